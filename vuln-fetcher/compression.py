@@ -0,0 +1,66 @@
+"""
+Compressed transfers.
+
+.nessus XML and scan CSVs compress 10-20x. Downloads advertise every
+content coding urllib3 can decode (gzip and deflate, plus br and zstd when
+the optional brotli / zstandard packages are installed), and requests
+decodes the response while it is streamed. Uploads to Paramify can be sent
+gzip-compressed (see ParamifyClient's compress_uploads); the body is
+compressed as it is sent, so nothing extra is held in memory or written to
+disk.
+"""
+import zlib
+from typing import Iterator, Optional, IO
+from urllib3.util import make_headers
+
+import progress
+
+# Accept-Encoding header value for downloads
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+# zlib level for compressed uploads (zlib's default; it still compresses
+# faster than the WAN links compressed uploads are meant for)
+UPLOAD_GZIP_LEVEL = 6
+
+# Upload bytes read and compressed per chunk
+CHUNK_SIZE = 1024 * 1024
+
+
+def gzip_stream(body: IO[bytes], tracked: progress.Transfer, level: int = UPLOAD_GZIP_LEVEL) -> Iterator[bytes]:
+    """
+    gzip-compress a request body as it is sent.
+
+    Passed to requests as data=, the chunks are sent with chunked transfer
+    encoding, since the compressed length is only known at the end.
+
+    Args:
+        body: Uncompressed body (file-like)
+        tracked: Transfer the uncompressed bytes are reported to
+        level: zlib compression level
+
+    Yields:
+        Compressed chunks
+    """
+    # wbits 16 + MAX_WBITS writes a gzip header and trailer
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    while True:
+        chunk = body.read(CHUNK_SIZE)
+        if not len(chunk):
+            break
+        tracked.advance(len(chunk))
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def wire_size(response) -> Optional[int]:
+    """
+    Bytes of a streamed response received over the wire, if it was compressed.
+
+    Returns:
+        Compressed size read so far, or None if the response was not compressed
+    """
+    if response.headers.get('Content-Encoding', 'identity') == 'identity':
+        return None
+    return response.raw.tell()
@@ -2,7 +2,7 @@
 Configuration management for the Nessus-Paramify integration.
 """
 import os
-from typing import Optional
+from typing import Optional, Dict, List, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -16,11 +16,79 @@ class Config:
     PARAMIFY_API_KEY: str = os.getenv('PARAMIFY_API_KEY', '')
     PARAMIFY_BASE_URL: str = os.getenv('PARAMIFY_BASE_URL', 'https://demo.paramify.com/api/v0')
 
+    # Send intake uploads gzip-compressed (true/false). The first upload
+    # probes for support and falls back to uncompressed uploads if the
+    # server rejects it.
+    PARAMIFY_COMPRESS_UPLOADS: str = os.getenv('PARAMIFY_COMPRESS_UPLOADS', 'false')
+
+    # Add a summary of each uploaded scan (host count, findings by severity,
+    # scan window) to its artifact metadata (true/false). The summary is
+    # computed while the file is uploaded and is always shown in the results.
+    PARAMIFY_ARTIFACT_SUMMARY: str = os.getenv('PARAMIFY_ARTIFACT_SUMMARY', 'false')
+
+    # Named Paramify tenants (optional, comma-separated, e.g. "acme,globex").
+    # Each tenant reads PARAMIFY_<NAME>_API_KEY, PARAMIFY_<NAME>_BASE_URL
+    # (default: PARAMIFY_BASE_URL), PARAMIFY_<NAME>_RATE_LIMIT (optional,
+    # requests per second), PARAMIFY_<NAME>_COMPRESS_UPLOADS and
+    # PARAMIFY_<NAME>_ARTIFACT_SUMMARY (default: PARAMIFY_COMPRESS_UPLOADS and
+    # PARAMIFY_ARTIFACT_SUMMARY). Assessments are then addressed as TENANT:UUID.
+    # When unset, the single PARAMIFY_* settings above are used.
+    PARAMIFY_TENANTS: str = os.getenv('PARAMIFY_TENANTS', '')
+
     # Nessus settings
     NESSUS_URL: str = os.getenv('NESSUS_URL', 'https://localhost:8834')
     NESSUS_ACCESS_KEY: str = os.getenv('NESSUS_ACCESS_KEY', '')
     NESSUS_SECRET_KEY: str = os.getenv('NESSUS_SECRET_KEY', '')
 
+    # Named scanner profiles (optional, comma-separated, e.g. "east,west").
+    # Each profile reads NESSUS_<NAME>_URL, NESSUS_<NAME>_ACCESS_KEY and
+    # NESSUS_<NAME>_SECRET_KEY. When unset, the single NESSUS_* settings above are used.
+    NESSUS_SCANNERS: str = os.getenv('NESSUS_SCANNERS', '')
+
+    # Optional file to remember Nessus export file IDs in, so later runs can
+    # re-download a still-available export instead of exporting again
+    NESSUS_EXPORT_REGISTRY: str = os.getenv('NESSUS_EXPORT_REGISTRY', '')
+
+    # GitHub settings (optional, for private repos or higher rate limits)
+    GITHUB_TOKEN: str = os.getenv('GITHUB_TOKEN', '')
+
+    # Columns written when .nessus files are transcoded to CSV before upload
+    # (optional, comma-separated; defaults to the columns of a Nessus CSV export)
+    TRANSCODE_COLUMNS: str = os.getenv('TRANSCODE_COLUMNS', '')
+
+    # Optional SQLite findings index; when set, every imported scan file is
+    # added to it so hosts, CVEs and plugins can be queried without re-exporting
+    FINDINGS_INDEX: str = os.getenv('FINDINGS_INDEX', '')
+
+    # Network timeouts in seconds. The read timeouts are the longest wait for
+    # the next bytes of a response: metadata calls, downloads, and uploads
+    # (which include Paramify processing the file) are allowed different waits.
+    HTTP_CONNECT_TIMEOUT: str = os.getenv('HTTP_CONNECT_TIMEOUT', '10')
+    HTTP_API_TIMEOUT: str = os.getenv('HTTP_API_TIMEOUT', '60')
+    HTTP_DOWNLOAD_TIMEOUT: str = os.getenv('HTTP_DOWNLOAD_TIMEOUT', '300')
+    HTTP_UPLOAD_TIMEOUT: str = os.getenv('HTTP_UPLOAD_TIMEOUT', '600')
+
+    # Optional wall-clock limit in seconds for each import job (scan details,
+    # export, download and upload together)
+    JOB_TIMEOUT: str = os.getenv('JOB_TIMEOUT', '')
+
+    # Optional limit in seconds for each scanner when several are listed or
+    # imported from at once, so a slow site does not hold up the others
+    SCANNER_TIMEOUT: str = os.getenv('SCANNER_TIMEOUT', '')
+
+    # Import scheduling (optional, comma-separated name=value lists).
+    # SCHEDULER_LIMITS caps concurrent jobs per endpoint: by kind (nessus,
+    # github, paramify) or for one endpoint (nessus:east, paramify:<UUID>).
+    # PRIORITY_WEIGHTS overrides the weights of critical/high/medium/low/info
+    # findings, deadline and age. ASSESSMENT_DEADLINES maps assessment UUIDs
+    # to YYYY-MM-DD dates; imports into assessments due soon go first.
+    SCHEDULER_LIMITS: str = os.getenv('SCHEDULER_LIMITS', '')
+    PRIORITY_WEIGHTS: str = os.getenv('PRIORITY_WEIGHTS', '')
+    ASSESSMENT_DEADLINES: str = os.getenv('ASSESSMENT_DEADLINES', '')
+
+    # Optional bearer token the `serve` HTTP API requires on every request
+    SERVICE_TOKEN: str = os.getenv('SERVICE_TOKEN', '')
+
     # Logging settings
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
 
@@ -29,16 +97,21 @@ class Config:
         """
         Validate that all required configuration is present.
 
-        Only PARAMIFY_API_KEY is required. Other credentials are optional
-        and only needed for specific features (Nessus import, private GitHub repos).
+        Only PARAMIFY_API_KEY (or, with PARAMIFY_TENANTS, each tenant's API
+        key) is required. Other credentials are optional and only needed for
+        specific features (Nessus import, private GitHub repos).
 
         Returns:
             Tuple of (is_valid, list of missing keys)
         """
         missing = []
 
-        if not cls.PARAMIFY_API_KEY:
+        profiles = cls.get_paramify_profiles()
+        if not profiles and not cls.PARAMIFY_API_KEY:
             missing.append('PARAMIFY_API_KEY')
+        for name, profile in profiles.items():
+            if not profile['api_key']:
+                missing.append(f'PARAMIFY_{cls._profile_key(name)}_API_KEY')
 
         return len(missing) == 0, missing
 
@@ -52,13 +125,188 @@ class Config:
         """
         missing = []
 
-        if not cls.NESSUS_ACCESS_KEY:
-            missing.append('NESSUS_ACCESS_KEY')
-        if not cls.NESSUS_SECRET_KEY:
-            missing.append('NESSUS_SECRET_KEY')
+        if not cls.NESSUS_SCANNERS.strip():
+            if not cls.NESSUS_ACCESS_KEY:
+                missing.append('NESSUS_ACCESS_KEY')
+            if not cls.NESSUS_SECRET_KEY:
+                missing.append('NESSUS_SECRET_KEY')
+            return len(missing) == 0, missing
+
+        for name, profile in cls.get_nessus_profiles().items():
+            prefix = f"NESSUS_{cls._profile_key(name)}"
+            if not profile['url']:
+                missing.append(f'{prefix}_URL')
+            if not profile['access_key']:
+                missing.append(f'{prefix}_ACCESS_KEY')
+            if not profile['secret_key']:
+                missing.append(f'{prefix}_SECRET_KEY')
 
         return len(missing) == 0, missing
 
+    @classmethod
+    def get_nessus_profiles(cls) -> Dict[str, Dict[str, str]]:
+        """
+        Get the configured Nessus scanner profiles.
+
+        Returns:
+            Dict mapping scanner name to a dict with url, access_key and secret_key.
+            A single 'default' profile is returned when NESSUS_SCANNERS is unset.
+        """
+        names = [n.strip() for n in cls.NESSUS_SCANNERS.split(',') if n.strip()]
+        if not names:
+            return {
+                'default': {
+                    'url': cls.NESSUS_URL,
+                    'access_key': cls.NESSUS_ACCESS_KEY,
+                    'secret_key': cls.NESSUS_SECRET_KEY
+                }
+            }
+
+        profiles = {}
+        for name in names:
+            prefix = f"NESSUS_{cls._profile_key(name)}"
+            profiles[name] = {
+                'url': os.getenv(f'{prefix}_URL', ''),
+                'access_key': os.getenv(f'{prefix}_ACCESS_KEY', ''),
+                'secret_key': os.getenv(f'{prefix}_SECRET_KEY', '')
+            }
+        return profiles
+
+    @classmethod
+    def get_paramify_profiles(cls) -> Dict[str, Dict]:
+        """
+        Get the configured Paramify tenant profiles.
+
+        Returns:
+            Dict mapping tenant name to a dict with api_key, base_url,
+            rate_limit (float or None), compress_uploads and attach_summary.
+            Empty when PARAMIFY_TENANTS is unset.
+        """
+        profiles = {}
+        for name in (n.strip() for n in cls.PARAMIFY_TENANTS.split(',')):
+            if not name:
+                continue
+            prefix = f"PARAMIFY_{cls._profile_key(name)}"
+            rate_limit = os.getenv(f'{prefix}_RATE_LIMIT', '')
+            profiles[name] = {
+                'api_key': os.getenv(f'{prefix}_API_KEY', ''),
+                'base_url': os.getenv(f'{prefix}_BASE_URL', '') or cls.PARAMIFY_BASE_URL,
+                'rate_limit': float(rate_limit) if rate_limit else None,
+                'compress_uploads': cls._is_true(
+                    os.getenv(f'{prefix}_COMPRESS_UPLOADS', '') or cls.PARAMIFY_COMPRESS_UPLOADS
+                ),
+                'attach_summary': cls._is_true(
+                    os.getenv(f'{prefix}_ARTIFACT_SUMMARY', '') or cls.PARAMIFY_ARTIFACT_SUMMARY
+                )
+            }
+        return profiles
+
+    @classmethod
+    def get_compress_uploads(cls) -> bool:
+        """Whether intake uploads are sent gzip-compressed (single-tenant setup)."""
+        return cls._is_true(cls.PARAMIFY_COMPRESS_UPLOADS)
+
+    @classmethod
+    def get_artifact_summary(cls) -> bool:
+        """Whether scan summaries are added to artifact metadata (single-tenant setup)."""
+        return cls._is_true(cls.PARAMIFY_ARTIFACT_SUMMARY)
+
+    @classmethod
+    def get_transcode_columns(cls) -> Optional[List[str]]:
+        """
+        Get the configured CSV transcoding columns.
+
+        Returns:
+            List of column names, or None to use the default column set
+        """
+        columns = [c.strip() for c in cls.TRANSCODE_COLUMNS.split(',') if c.strip()]
+        return columns or None
+
+    @classmethod
+    def get_timeouts(cls) -> Dict[str, Tuple[float, float]]:
+        """
+        Get the (connect, read) network timeouts by endpoint class.
+
+        Returns:
+            Dict with 'api', 'download' and 'upload' timeouts
+        """
+        connect = float(cls.HTTP_CONNECT_TIMEOUT)
+        return {
+            'api': (connect, float(cls.HTTP_API_TIMEOUT)),
+            'download': (connect, float(cls.HTTP_DOWNLOAD_TIMEOUT)),
+            'upload': (connect, float(cls.HTTP_UPLOAD_TIMEOUT))
+        }
+
+    @classmethod
+    def get_job_timeout(cls) -> Optional[float]:
+        """
+        Get the per-job time limit.
+
+        Returns:
+            Seconds, or None if jobs have no time limit
+        """
+        return float(cls.JOB_TIMEOUT) if cls.JOB_TIMEOUT else None
+
+    @classmethod
+    def get_scanner_timeout(cls) -> Optional[float]:
+        """
+        Get the per-scanner time limit for multi-scanner listings and folder imports.
+
+        Returns:
+            Seconds, or None if scanners have no time limit
+        """
+        return float(cls.SCANNER_TIMEOUT) if cls.SCANNER_TIMEOUT else None
+
+    @classmethod
+    def get_scheduler_limits(cls) -> Dict[str, str]:
+        """
+        Get the per-endpoint concurrency limits.
+
+        Returns:
+            Dict mapping endpoint (or endpoint kind) to its limit
+        """
+        return cls._parse_pairs(cls.SCHEDULER_LIMITS)
+
+    @classmethod
+    def get_priority_weights(cls) -> Dict[str, float]:
+        """
+        Get the configured priority weight overrides.
+
+        Returns:
+            Dict mapping factor name to weight
+        """
+        return {name: float(value) for name, value in cls._parse_pairs(cls.PRIORITY_WEIGHTS).items()}
+
+    @classmethod
+    def get_assessment_deadlines(cls) -> Dict[str, str]:
+        """
+        Get the configured assessment deadlines.
+
+        Returns:
+            Dict mapping assessment UUID to a YYYY-MM-DD date
+        """
+        return cls._parse_pairs(cls.ASSESSMENT_DEADLINES)
+
+    @staticmethod
+    def _parse_pairs(value: str) -> Dict[str, str]:
+        """Parse a comma-separated list of name=value pairs."""
+        pairs = {}
+        for part in value.split(','):
+            name, sep, item = part.partition('=')
+            if sep and name.strip():
+                pairs[name.strip()] = item.strip()
+        return pairs
+
+    @staticmethod
+    def _profile_key(name: str) -> str:
+        """Convert a profile name to its environment variable infix."""
+        return name.upper().replace('-', '_').replace(' ', '_')
+
+    @staticmethod
+    def _is_true(value: str) -> bool:
+        """Parse a boolean setting."""
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
     @classmethod
     def get_log_level(cls) -> int:
         """
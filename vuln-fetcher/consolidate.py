@@ -0,0 +1,286 @@
+"""
+Merging of overlapping .nessus scans into one consolidated file.
+
+Partial scans of the same boundary (one per subnet, or a rescan of the
+hosts that failed) would otherwise each become a separate upload and a
+separate artifact for Paramify to reconcile. consolidate_nessus() streams
+any number of them and writes a single .nessus that keeps, for every
+(host, port, protocol, plugin), the result of the most recent scan of that
+host.
+
+Findings are spilled to a temporary SQLite index on disk as they are read,
+so memory use does not grow with the number or size of the sources.
+"""
+import os
+import time
+import mmap
+import sqlite3
+import logging
+import tempfile
+import calendar
+import itertools
+import xml.etree.ElementTree as ET
+import xml.parsers.expat as expat
+from xml.sax.saxutils import quoteattr
+from typing import Optional, List, Dict, Tuple, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Rows inserted per executemany() call
+BATCH_SIZE = 10000
+
+# Bytes handed to the parser at a time
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Elements copied verbatim into the merged file
+COPIED_ELEMENTS = ('Policy', 'HostProperties', 'ReportItem')
+
+SCHEMA = """
+CREATE TABLE hosts (
+    name TEXT NOT NULL,
+    finished REAL NOT NULL,
+    source INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    properties BLOB NOT NULL
+);
+CREATE TABLE items (
+    host TEXT NOT NULL,
+    port TEXT,
+    protocol TEXT,
+    plugin_id TEXT,
+    finished REAL NOT NULL,
+    source INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    xml BLOB NOT NULL
+);
+"""
+
+
+def consolidate_nessus(
+    sources: List[str],
+    dest_path: str,
+    report_name: Optional[str] = None,
+    work_dir: Optional[str] = None
+) -> Dict:
+    """
+    Merge several .nessus files into one, keeping the latest result of each finding.
+
+    A finding is identified by host, port, protocol and plugin ID. When
+    several sources report it, the one whose host scan finished last
+    (HOST_END_TIMESTAMP or HOST_END) wins; sources without a timestamp,
+    and ties, are ranked by their position in sources (later wins). All of
+    the winning scan's items for that finding are kept, and each host gets
+    the properties of its latest scan; the <Policy> is that of the last
+    source. A finding reported only by an older scan is kept too, since a
+    partial rescan says nothing about it.
+
+    Args:
+        sources: .nessus files to merge
+        dest_path: .nessus file to write
+        report_name: Report name of the merged scan (default: "Consolidated scan")
+        work_dir: Where the temporary index is created (default: dest_path's directory)
+
+    Returns:
+        Stats dict with sources, hosts, input_findings, findings,
+        replaced (findings dropped for a newer result), input_bytes and
+        output_bytes
+
+    Raises:
+        ValueError: If no sources are given
+        xml.etree.ElementTree.ParseError: If a source is not valid XML
+    """
+    if not sources:
+        raise ValueError("No .nessus files to consolidate")
+
+    fd, db_path = tempfile.mkstemp(
+        suffix='.db', prefix='consolidate-', dir=work_dir or os.path.dirname(os.path.abspath(dest_path))
+    )
+    os.close(fd)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('PRAGMA journal_mode=OFF')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.executescript(SCHEMA)
+
+        policy = None
+        input_findings = 0
+        seq = itertools.count()
+        for index, path in enumerate(sources):
+            source_policy, count = _spill(conn, path, index, seq)
+            policy = source_policy or policy
+            input_findings += count
+            logger.info(f"Read {count} findings from {path}")
+
+        conn.execute('CREATE INDEX idx_items_host ON items(host, seq)')
+        hosts, findings = _write(conn, dest_path, policy, report_name or 'Consolidated scan')
+    finally:
+        conn.close()
+        os.remove(db_path)
+
+    stats = {
+        'sources': len(sources),
+        'hosts': hosts,
+        'input_findings': input_findings,
+        'findings': findings,
+        'replaced': input_findings - findings,
+        'input_bytes': sum(os.path.getsize(path) for path in sources),
+        'output_bytes': os.path.getsize(dest_path)
+    }
+    logger.info(
+        f"Consolidated {len(sources)} scans into {dest_path}: {findings} of {input_findings} "
+        f"findings kept across {hosts} hosts"
+    )
+    return stats
+
+
+def _spill(
+    conn: sqlite3.Connection,
+    path: str,
+    source: int,
+    seq: Iterator[int]
+) -> Tuple[Optional[bytes], int]:
+    """
+    Stream one .nessus file into the index.
+
+    Elements are copied byte for byte from a memory map of the file, using
+    the offsets the parser reports, so nothing is re-serialized.
+
+    Args:
+        conn: Index database
+        path: .nessus file
+        source: Position of the file among the sources
+        seq: Counter shared by all sources, recording the order elements were read in
+
+    Returns:
+        Tuple of (<Policy> element or None, number of findings read)
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the file is not valid XML
+    """
+    state = {'policy': None, 'host': '', 'key': None, 'finished': 0.0, 'has_properties': False, 'count': 0}
+    starts: Dict[str, int] = {}
+    batch = []
+
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            raise ET.ParseError(f"{path} is empty")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        parser = expat.ParserCreate()
+
+        def element_bytes(name: str) -> bytes:
+            """Source bytes of the element that has just ended."""
+            end = parser.CurrentByteIndex
+            # An empty element's end is reported just past its '/>'
+            if data[end:end + len(name) + 2] == f'</{name}'.encode('ascii'):
+                end = data.find(b'>', end) + 1
+            return data[starts.pop(name):end]
+
+        def start_element(name: str, attrs: Dict[str, str]) -> None:
+            if name in COPIED_ELEMENTS:
+                starts[name] = parser.CurrentByteIndex
+            if name == 'ReportItem':
+                state['key'] = (attrs.get('port'), attrs.get('protocol'), attrs.get('pluginID'))
+            elif name == 'ReportHost':
+                state.update(host=attrs.get('name', ''), finished=0.0, has_properties=False)
+
+        def end_element(name: str) -> None:
+            if name == 'ReportItem':
+                state['count'] += 1
+                batch.append((
+                    state['host'], *state['key'], state['finished'], source, next(seq), element_bytes(name)
+                ))
+                if len(batch) >= BATCH_SIZE:
+                    conn.executemany('INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)', batch)
+                    batch.clear()
+            elif name == 'HostProperties':
+                properties = element_bytes(name)
+                state.update(finished=_host_finished(properties), has_properties=True)
+                conn.execute(
+                    'INSERT INTO hosts VALUES (?, ?, ?, ?, ?)',
+                    (state['host'], state['finished'], source, next(seq), properties)
+                )
+            elif name == 'ReportHost' and not state['has_properties']:
+                conn.execute(
+                    'INSERT INTO hosts VALUES (?, ?, ?, ?, ?)',
+                    (state['host'], 0.0, source, next(seq), b'<HostProperties />')
+                )
+            elif name == 'Policy':
+                state['policy'] = element_bytes(name)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        try:
+            for offset in range(0, len(data), READ_CHUNK_SIZE):
+                parser.Parse(data[offset:offset + READ_CHUNK_SIZE], False)
+                # Let the kernel drop pages no open element will be copied from
+                done = min([offset + READ_CHUNK_SIZE, *starts.values()]) // mmap.PAGESIZE * mmap.PAGESIZE
+                if hasattr(data, 'madvise') and done:
+                    data.madvise(mmap.MADV_DONTNEED, 0, done)
+            parser.Parse(b'', True)
+        except expat.ExpatError as e:
+            raise ET.ParseError(f"{path}: {e}")
+        finally:
+            data.close()
+
+    if batch:
+        conn.executemany('INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)', batch)
+    conn.commit()
+    return state['policy'], state['count']
+
+
+def _write(conn: sqlite3.Connection, dest_path: str, policy: Optional[bytes], report_name: str) -> Tuple[int, int]:
+    """
+    Write the merged .nessus from the index.
+
+    Returns:
+        Tuple of (hosts written, findings written)
+    """
+    # Each host's latest properties, in the order hosts were first seen
+    host_rows = conn.execute("""
+        SELECT name, properties FROM (
+            SELECT name, properties, MIN(seq) OVER (PARTITION BY name) AS first_seen,
+                   ROW_NUMBER() OVER (PARTITION BY name ORDER BY finished DESC, source DESC, seq DESC) AS rank
+            FROM hosts
+        ) WHERE rank = 1 ORDER BY first_seen
+    """)
+    hosts = findings = 0
+
+    with open(dest_path, 'wb') as out:
+        out.write(b'<?xml version="1.0" ?>\n<NessusClientData_v2>\n')
+        if policy:
+            out.write(policy + b'\n')
+        out.write(f'<Report name={quoteattr(report_name)} xmlns:cm="http://www.nessus.org/cm">\n'.encode('utf-8'))
+
+        for name, properties in host_rows:
+            hosts += 1
+            out.write(f'<ReportHost name={quoteattr(name)}>'.encode('utf-8'))
+            out.write(properties + b'\n')
+            # RANK keeps every item the winning scan reported for a finding
+            items = conn.execute("""
+                SELECT xml FROM (
+                    SELECT xml, seq, source, RANK() OVER (
+                        PARTITION BY port, protocol, plugin_id ORDER BY finished DESC, source DESC
+                    ) AS rank
+                    FROM items WHERE host = ?
+                ) WHERE rank = 1 ORDER BY seq
+            """, (name,))
+            for (xml,) in items:
+                out.write(xml + b'\n')
+                findings += 1
+            out.write(b'</ReportHost>\n')
+
+        out.write(b'</Report>\n</NessusClientData_v2>\n')
+    return hosts, findings
+
+
+def _host_finished(properties: bytes) -> float:
+    """When a host's scan finished, as a Unix timestamp (0 if unknown), from its <HostProperties>."""
+    tags = {tag.get('name'): tag.text or '' for tag in ET.fromstring(properties).iter('tag')}
+    try:
+        return float(tags['HOST_END_TIMESTAMP'])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return float(calendar.timegm(time.strptime(tags.get('HOST_END', '').strip(), '%a %b %d %H:%M:%S %Y')))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,208 @@
+"""
+Network timeouts and per-job deadlines.
+
+Every HTTP call gets a (connect, read) timeout chosen by endpoint class, so
+a stalled socket fails instead of hanging. A Deadline bounds a whole job
+(scan details, export wait, download, upload): each call's timeout is
+clamped to the time the job has left, and long loops check it between
+chunks and polls. A deadline can also be cancelled, which stops the job at
+its next check; the usual cleanup paths then remove its temporary files.
+A deadline can be paused while its job waits in a queue behind other jobs,
+so only the time the job is actually running counts.
+"""
+import time
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Tuple, Iterator, Callable
+import requests
+
+# (connect, read) timeouts in seconds by endpoint class. The read timeout is
+# the longest wait for the next bytes, not for the whole response.
+#   api      - metadata calls (listings, details, export requests, status)
+#   download - export and file downloads
+#   upload   - intake uploads (includes the server processing the file)
+DEFAULT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    'api': (10, 60),
+    'download': (10, 300),
+    'upload': (10, 600),
+}
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a job runs past its deadline."""
+
+
+class JobCancelled(DeadlineExceeded):
+    """Raised when a job's deadline is cancelled."""
+
+
+class Deadline:
+    """Wall-clock budget for one job, optionally tied to a shared cancel event."""
+
+    def __init__(self, seconds: Optional[float] = None, cancel_event: Optional[threading.Event] = None):
+        """
+        Start a deadline.
+
+        Args:
+            seconds: Time the job may take (no time limit if None or 0)
+            cancel_event: Event that cancels the job when set, e.g. shared by
+                every job of a batch (a private event if not provided)
+        """
+        self.seconds = seconds or None
+        self.expires_at = time.monotonic() + seconds if seconds else None
+        self.cancel_event = cancel_event or threading.Event()
+        self._paused_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def pause(self) -> None:
+        """Stop the clock, e.g. while the job waits in a queue; cancelling still works."""
+        with self._lock:
+            if self._paused_at is None:
+                self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        """Restart the clock stopped by pause(); the paused time is not counted."""
+        with self._lock:
+            if self._paused_at is not None:
+                if self.expires_at is not None:
+                    self.expires_at += time.monotonic() - self._paused_at
+                self._paused_at = None
+
+    def cancel(self) -> None:
+        """Cancel the job (and every other job sharing the cancel event)."""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job has been cancelled."""
+        return self.cancel_event.is_set()
+
+    def remaining(self) -> Optional[float]:
+        """
+        Get the time left.
+
+        Returns:
+            Seconds left (may be negative), or None if there is no time limit
+        """
+        with self._lock:
+            if self.expires_at is None:
+                return None
+            now = self._paused_at if self._paused_at is not None else time.monotonic()
+            return self.expires_at - now
+
+    def check(self, what: str = 'Job') -> None:
+        """
+        Raise if the job has been cancelled or is out of time.
+
+        Args:
+            what: Description used in the error message
+
+        Raises:
+            JobCancelled: If the deadline was cancelled
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.cancelled:
+            raise JobCancelled(f"{what} was cancelled")
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded(f"{what} exceeded its {self.seconds:g}s deadline")
+
+    def timeout(self, timeout: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Clamp a (connect, read) timeout to the time left.
+
+        Args:
+            timeout: Timeout for the endpoint class
+
+        Returns:
+            Timeout to pass to requests
+
+        Raises:
+            DeadlineExceeded: If no time is left
+        """
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return (min(timeout[0], remaining), min(timeout[1], remaining))
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep between polls, waking early if the job is cancelled.
+
+        Args:
+            seconds: Time to sleep
+
+        Raises:
+            DeadlineExceeded: If the deadline passes or is cancelled
+        """
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, max(remaining, 0))
+        self.cancel_event.wait(seconds)
+        self.check()
+
+
+def when_run(deadline: Deadline, fn: Callable) -> Callable:
+    """
+    Pause a job's deadline until the job starts running.
+
+    Wrap a function before submitting it to a pool or scheduler, so the
+    time it spends queued behind other jobs is not counted.
+
+    Args:
+        deadline: The job's deadline (paused now)
+        fn: Function the job runs
+
+    Returns:
+        Function that resumes the deadline, then calls fn with its arguments
+    """
+    deadline.pause()
+
+    def run(*args, **kwargs):
+        deadline.resume()
+        return fn(*args, **kwargs)
+    return run
+
+
+def request_timeout(
+    timeouts: Dict[str, Tuple[float, float]],
+    endpoint_class: str,
+    deadline: Optional[Deadline] = None
+) -> Tuple[float, float]:
+    """
+    Get the timeout for a request, clamped to the job's deadline.
+
+    Args:
+        timeouts: Timeouts by endpoint class (missing classes use DEFAULT_TIMEOUTS)
+        endpoint_class: 'api', 'download', or 'upload'
+        deadline: Optional job deadline
+
+    Returns:
+        (connect, read) timeout in seconds
+    """
+    timeout = timeouts.get(endpoint_class) or DEFAULT_TIMEOUTS[endpoint_class]
+    return deadline.timeout(timeout) if deadline else timeout
+
+
+@contextmanager
+def deadline_errors(deadline: Optional[Deadline], what: str = 'Job') -> Iterator[None]:
+    """
+    Report a request that failed because the job ran out of time as DeadlineExceeded.
+
+    A timeout clamped to the deadline surfaces from requests as a read or
+    connect timeout; this turns it into the error that actually happened.
+
+    Args:
+        deadline: Optional job deadline
+        what: Description used in the error message
+
+    Raises:
+        DeadlineExceeded: If a request failed after the deadline passed or was cancelled
+    """
+    try:
+        yield
+    except requests.exceptions.RequestException:
+        if deadline:
+            deadline.check(what)
+        raise
@@ -0,0 +1,354 @@
+"""
+On-disk index of findings across every scan file the tool has handled.
+
+Findings from .nessus and .csv files are streamed into a SQLite database
+with indexes on host, CVE and plugin, so questions like "which scans found
+CVE-X on host Y" are answered without downloading any export again. A host
+can be looked up by its scan name, IP address or FQDN, whichever the scan
+named it by. Files are identified by their SHA-256, so indexing the same
+file twice is a no-op.
+"""
+import io
+import os
+import csv
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Iterator, Tuple
+from journal import file_sha256
+from transcode import iter_report_items
+
+logger = logging.getLogger(__name__)
+
+# Rows inserted per executemany() call
+BATCH_SIZE = 10000
+
+# Risk factor names and their Nessus severity levels
+SEVERITY_LEVELS = {'none': 0, 'info': 0, 'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    sha256 TEXT NOT NULL UNIQUE,
+    name TEXT,
+    origin TEXT,
+    effective_date TEXT,
+    indexed_at TEXT NOT NULL,
+    findings INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS findings (
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    host TEXT NOT NULL,
+    host_ip TEXT,
+    host_fqdn TEXT,
+    port INTEGER,
+    protocol TEXT,
+    plugin_id INTEGER,
+    plugin_name TEXT,
+    cve TEXT,
+    severity INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_findings_host ON findings(host);
+CREATE INDEX IF NOT EXISTS idx_findings_cve ON findings(cve);
+CREATE INDEX IF NOT EXISTS idx_findings_plugin ON findings(plugin_id);
+CREATE INDEX IF NOT EXISTS idx_findings_source ON findings(source_id);
+"""
+
+# Host alias columns, added to indexes created before they existed
+HOST_ALIAS_COLUMNS = ('host_ip', 'host_fqdn')
+
+HOST_ALIAS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_findings_host_ip ON findings(host_ip);
+CREATE INDEX IF NOT EXISTS idx_findings_host_fqdn ON findings(host_fqdn);
+"""
+
+# Columns returned by query()
+QUERY_COLUMNS = [
+    'host', 'port', 'protocol', 'plugin_id', 'plugin_name', 'cve', 'severity',
+    'scan', 'origin', 'effective_date'
+]
+
+
+class FindingsIndex:
+    """SQLite-backed index of findings from scan files."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a findings index.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(SCHEMA)
+        self._add_host_aliases()
+
+    def _add_host_aliases(self) -> None:
+        """Add the host IP/FQDN columns to an index created without them (files indexed before stay name-only)."""
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(findings)')}
+        for column in HOST_ALIAS_COLUMNS:
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE findings ADD COLUMN {column} TEXT')
+        self._conn.executescript(HOST_ALIAS_INDEXES)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def index_file(
+        self,
+        path: str,
+        name: Optional[str] = None,
+        origin: Optional[str] = None,
+        effective_date: Optional[str] = None
+    ) -> Dict:
+        """
+        Add the findings of a .nessus or .csv file to the index.
+
+        Args:
+            path: Scan file path
+            name: Scan/file name to record (default: basename of path)
+            origin: Where the file came from, e.g. 'nessus:default:12' or 'github:owner/repo@main:path'
+            effective_date: Optional effective date (YYYY-MM-DD format)
+
+        Returns:
+            Dict with sha256, findings (count) and skipped (True if the
+            file was already indexed)
+        """
+        name = name or os.path.basename(path)
+        return self._index(file_sha256(path), lambda: open(path, 'rb'), name, origin, effective_date)
+
+    def index_bytes(
+        self,
+        content: bytes,
+        name: str,
+        origin: Optional[str] = None,
+        effective_date: Optional[str] = None
+    ) -> Dict:
+        """
+        Add the findings of an in-memory .nessus or .csv file to the index.
+
+        Args:
+            content: File content
+            name: Filename (its extension selects the parser)
+            origin: Where the file came from
+            effective_date: Optional effective date (YYYY-MM-DD format)
+
+        Returns:
+            Same as index_file()
+        """
+        sha256 = hashlib.sha256(content).hexdigest()
+        return self._index(sha256, lambda: io.BytesIO(content), name, origin, effective_date)
+
+    def _index(self, sha256: str, opener, name: str, origin: Optional[str], effective_date: Optional[str]) -> Dict:
+        """Stream a file's findings into the index in one transaction, unless it is already there."""
+        if name.lower().endswith('.nessus'):
+            parse = _nessus_findings
+        elif name.lower().endswith('.csv'):
+            parse = _csv_findings
+        else:
+            raise ValueError(f"Cannot index {name}: only .nessus and .csv files are supported")
+
+        with self._lock:
+            row = self._conn.execute('SELECT findings FROM sources WHERE sha256 = ?', (sha256,)).fetchone()
+            if row:
+                logger.info(f"{name} is already indexed")
+                return {'sha256': sha256, 'findings': row[0], 'skipped': True}
+
+            count = 0
+            try:
+                cursor = self._conn.execute(
+                    'INSERT INTO sources (sha256, name, origin, effective_date, indexed_at) VALUES (?, ?, ?, ?, ?)',
+                    (sha256, name, origin, effective_date, datetime.now(timezone.utc).isoformat())
+                )
+                source_id = cursor.lastrowid
+
+                with opener() as f:
+                    batch = []
+                    for finding in parse(f):
+                        batch.append((source_id, *finding))
+                        if len(batch) >= BATCH_SIZE:
+                            self._insert(batch)
+                            count += len(batch)
+                            batch = []
+                    self._insert(batch)
+                    count += len(batch)
+
+                self._conn.execute('UPDATE sources SET findings = ? WHERE id = ?', (count, source_id))
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+        logger.info(f"Indexed {count} findings from {name}")
+        return {'sha256': sha256, 'findings': count, 'skipped': False}
+
+    def _insert(self, batch: List[Tuple]) -> None:
+        """Insert a batch of finding rows."""
+        if batch:
+            self._conn.executemany(
+                'INSERT INTO findings '
+                '(source_id, host, host_ip, host_fqdn, port, protocol, plugin_id, plugin_name, cve, severity) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                batch
+            )
+
+    def query(
+        self,
+        host: Optional[str] = None,
+        cve: Optional[str] = None,
+        plugin_id: Optional[int] = None,
+        min_severity: Optional[int] = None,
+        scan: Optional[str] = None,
+        limit: Optional[int] = 100
+    ) -> List[Dict]:
+        """
+        Find indexed findings. All given filters must match.
+
+        Args:
+            host: Host name, IP address or FQDN (exact match against any of them)
+            cve: CVE ID, e.g. CVE-2024-3094 (case-insensitive)
+            plugin_id: Nessus plugin ID
+            min_severity: Minimum severity (0=info ... 4=critical)
+            scan: Scan/file name (exact match)
+            limit: Maximum number of rows to return (None for all)
+
+        Returns:
+            List of finding dicts with the QUERY_COLUMNS keys, newest scans
+            first (effective_date falls back to the date the file was indexed)
+        """
+        conditions = []
+        params = []
+        if host:
+            conditions.append('(f.host = ? OR f.host_ip = ? OR f.host_fqdn = ?)')
+            params += [host, host, host]
+        if cve:
+            conditions.append('f.cve = ?')
+            params.append(cve.upper())
+        if plugin_id is not None:
+            conditions.append('f.plugin_id = ?')
+            params.append(plugin_id)
+        if min_severity is not None:
+            conditions.append('f.severity >= ?')
+            params.append(min_severity)
+        if scan:
+            conditions.append('s.name = ?')
+            params.append(scan)
+
+        sql = (
+            'SELECT f.host, f.port, f.protocol, f.plugin_id, f.plugin_name, f.cve, f.severity, '
+            "s.name, s.origin, COALESCE(s.effective_date, substr(s.indexed_at, 1, 10)) AS effective "
+            'FROM findings f JOIN sources s ON s.id = f.source_id'
+        )
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY effective DESC, s.id DESC, f.host, f.port'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(QUERY_COLUMNS, row)) for row in rows]
+
+    def stats(self) -> Dict:
+        """
+        Summarize the index.
+
+        Returns:
+            Dict with sources, findings, hosts and cves counts
+        """
+        with self._lock:
+            sources, findings = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(findings), 0) FROM sources'
+            ).fetchone()
+            hosts = self._conn.execute('SELECT COUNT(DISTINCT host) FROM findings').fetchone()[0]
+            cves = self._conn.execute('SELECT COUNT(DISTINCT cve) FROM findings').fetchone()[0]
+        return {'sources': sources, 'findings': findings, 'hosts': hosts, 'cves': cves}
+
+
+def index_quietly(
+    findings_index: Optional[FindingsIndex],
+    path: str,
+    name: Optional[str] = None,
+    origin: Optional[str] = None,
+    effective_date: Optional[str] = None
+) -> None:
+    """
+    Index a file as a side effect of an import, logging instead of raising on failure.
+
+    Args:
+        findings_index: Index to add to (nothing is done if None)
+        path: Scan file path
+        name: Scan/file name to record
+        origin: Where the file came from
+        effective_date: Optional effective date (YYYY-MM-DD format)
+    """
+    if findings_index is None:
+        return
+    try:
+        findings_index.index_file(path, name=name, origin=origin, effective_date=effective_date)
+    except Exception as e:
+        logger.warning(f"Could not index {name or path}: {e}")
+
+
+def _nessus_findings(f) -> Iterator[Tuple]:
+    """
+    Yield (host, host_ip, host_fqdn, port, protocol, plugin_id, plugin_name, cve, severity)
+    rows from a .nessus file.
+    """
+    for host_name, host_tags, item in iter_report_items(f):
+        host_ip = host_tags.get('host-ip') or None
+        host_fqdn = host_tags.get('host-fqdn') or None
+        port = _to_int(item.get('port'))
+        plugin_id = _to_int(item.get('pluginID'))
+        severity = _to_int(item.get('severity'))
+        cves = [c.text.strip().upper() for c in item.findall('cve') if c.text] or [None]
+        for cve in cves:
+            yield (
+                host_name, host_ip, host_fqdn, port, item.get('protocol'), plugin_id,
+                item.get('pluginName'), cve, severity
+            )
+
+
+def _csv_findings(f) -> Iterator[Tuple]:
+    """Yield finding rows from a Nessus-style CSV file (one row per CVE)."""
+    reader = csv.DictReader(io.TextIOWrapper(f, encoding='utf-8-sig', newline=''))
+    for row in reader:
+        host = row.get('Host') or row.get('IP Address')
+        if not host:
+            continue
+
+        severity = _to_int(row.get('Severity'))
+        if severity is None:
+            severity = SEVERITY_LEVELS.get((row.get('Risk') or '').strip().lower())
+
+        cves = [c.strip().upper() for c in (row.get('CVE') or '').replace(';', ',').split(',') if c.strip()]
+        for cve in cves or [None]:
+            yield (
+                host,
+                row.get('IP Address') or None,
+                row.get('FQDN') or None,
+                _to_int(row.get('Port')),
+                row.get('Protocol') or None,
+                _to_int(row.get('Plugin ID')),
+                row.get('Name') or None,
+                cve,
+                severity
+            )
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Convert a string to int, or None if it is empty or not a number."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
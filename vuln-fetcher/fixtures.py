@@ -0,0 +1,328 @@
+"""
+Deterministic synthetic scan files for load and memory testing.
+
+Generates .nessus XML and Nessus-style CSV of any size from a seed, a host
+count, a number of findings per host and a severity mix. Output is produced
+in chunks, so GB-scale files can be written to disk, or served by a stand-in
+Nessus/GitHub server, without ever being held in memory. The same arguments
+always produce the same bytes, and a .nessus and a .csv generated with the
+same arguments describe the same findings.
+"""
+import io
+import os
+import csv
+import time
+import random
+import bisect
+from xml.sax.saxutils import escape, quoteattr
+from typing import Optional, List, Dict, Iterator, Tuple
+from transcode import DEFAULT_COLUMNS
+
+# Nessus severity levels by name, and the risk factor each one is reported with
+SEVERITIES = {'info': 0, 'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+RISK_FACTORS = ['None', 'Low', 'Medium', 'High', 'Critical']
+
+# Relative weights of each severity when no mix is given (roughly a real network scan)
+DEFAULT_SEVERITY_MIX = {'critical': 2, 'high': 8, 'medium': 20, 'low': 10, 'info': 60}
+
+# Synthetic plugins generated per severity
+PLUGINS_PER_SEVERITY = 200
+
+# Bytes buffered before a chunk is yielded
+CHUNK_SIZE = 1024 * 1024
+
+_PORTS = [(22, 'tcp', 'ssh'), (25, 'tcp', 'smtp'), (53, 'udp', 'dns'), (80, 'tcp', 'www'),
+          (123, 'udp', 'ntp'), (161, 'udp', 'snmp'), (443, 'tcp', 'www'), (445, 'tcp', 'cifs'),
+          (3306, 'tcp', 'mysql'), (3389, 'tcp', 'msrdp'), (5432, 'tcp', 'postgresql'), (8443, 'tcp', 'www')]
+_FAMILIES = ['General', 'Web Servers', 'Windows', 'Ubuntu Local Security Checks', 'Databases',
+             'Service detection', 'Misc.', 'Red Hat Local Security Checks', 'Firewalls']
+_PRODUCTS = ['OpenSSH', 'Apache httpd', 'nginx', 'OpenSSL', 'Microsoft Windows', 'PostgreSQL',
+             'MySQL', 'Samba', 'BIND', 'Postfix', 'Tomcat', 'Node.js', 'PHP', 'jQuery']
+_ISSUES = ['Remote Code Execution', 'Denial of Service', 'Information Disclosure',
+           'Privilege Escalation', 'Multiple Vulnerabilities', 'Weak Cipher Suites',
+           'Outdated Version Detected', 'Authentication Bypass', 'Cross-Site Scripting']
+_OPERATING_SYSTEMS = ['Linux Kernel 5.15 on Ubuntu 22.04', 'Microsoft Windows Server 2019',
+                      'Linux Kernel 4.18 on Red Hat Enterprise Linux 8', 'FreeBSD 13.2']
+_WORDS = ('the remote host is affected by a vulnerability in the installed version which may '
+          'allow an unauthenticated attacker to send crafted requests and obtain sensitive data '
+          'or execute arbitrary code update to the latest release apply vendor patches').split()
+
+
+def parse_severity_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse a severity mix such as 'critical=2,high=8,medium=20,low=10,info=60'.
+
+    Args:
+        spec: Comma-separated severity=weight pairs (weights are relative;
+            severities left out are never generated)
+
+    Returns:
+        Dict of severity name to weight
+
+    Raises:
+        ValueError: If a severity is unknown or a weight is not a non-negative number
+    """
+    mix = {}
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        name, sep, weight = part.partition('=')
+        name = name.strip().lower()
+        if not sep or name not in SEVERITIES:
+            raise ValueError(f"Invalid severity mix entry '{part.strip()}': expected one of "
+                             f"{', '.join(SEVERITIES)} as name=weight")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid weight for {name}: {weight}")
+        if mix[name] < 0:
+            raise ValueError(f"Invalid weight for {name}: {weight}")
+    if not any(mix.values()):
+        raise ValueError("Severity mix must give at least one severity a positive weight")
+    return mix
+
+
+class _Generator:
+    """Seeded source of synthetic hosts and findings shared by both output formats."""
+
+    def __init__(self, seed: int, severity_mix: Optional[Dict[str, float]]):
+        self.seed = seed
+        mix = severity_mix or DEFAULT_SEVERITY_MIX
+        self.levels = [SEVERITIES[name] for name, weight in mix.items() if weight > 0]
+        weights = [weight for weight in mix.values() if weight > 0]
+        total = sum(weights)
+        self.cumulative = []
+        running = 0.0
+        for weight in weights:
+            running += weight / total
+            self.cumulative.append(running)
+
+        # The plugin catalog depends on the seed alone, so files of different
+        # sizes generated with one seed share their plugins
+        rng = random.Random(seed)
+        self.plugins = {level: [self._plugin(rng, level, i) for i in range(PLUGINS_PER_SEVERITY)]
+                        for level in SEVERITIES.values()}
+
+    @staticmethod
+    def _plugin(rng: random.Random, level: int, index: int) -> Dict:
+        """Create one synthetic plugin."""
+        product = rng.choice(_PRODUCTS)
+        cves = []
+        if level > 0:
+            year = rng.randint(2015, 2026)
+            cves = [f"CVE-{year}-{rng.randint(1000, 49999)}" for _ in range(rng.choice([1, 1, 1, 2, 3]))]
+        base = {0: 0.0, 1: 2.0, 2: 4.0, 3: 7.0, 4: 9.0}[level]
+        cvss = round(min(base + rng.random() * (1.0 if level == 4 else 2.9), 10.0), 1)
+        return {
+            'id': 100000 + level * 10000 + index,
+            'name': f"{product} {rng.choice(_ISSUES)}" if level else f"{product} Detection",
+            'family': rng.choice(_FAMILIES),
+            'severity': level,
+            'risk': RISK_FACTORS[level],
+            'cves': cves,
+            'cvss': '' if level == 0 else f"{cvss}",
+            'synopsis': f"The remote host is running a version of {product} that needs attention.",
+            'description': ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(40, 90))).capitalize() + '.',
+            'solution': f"Upgrade {product} to the latest version or apply the vendor patch.",
+            'see_also': f"https://www.example.com/advisories/{100000 + level * 10000 + index}",
+            'published': f"{rng.randint(2015, 2026)}/{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}",
+        }
+
+    def hosts(self, count: int, findings_per_host: int) -> Iterator[Tuple[Dict, List[Tuple[Dict, tuple]]]]:
+        """Yield (host, [(plugin, (port, protocol, service)), ...]) for every host."""
+        for i in range(count):
+            # Each host has its own stream, so host N is the same whatever the host count
+            rng = random.Random(f"{self.seed}:{i}")
+            host = {
+                'ip': f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+                'fqdn': f"host-{i:06d}.example.test",
+                'os': rng.choice(_OPERATING_SYSTEMS),
+            }
+            findings = []
+            for _ in range(findings_per_host):
+                level = self.levels[min(bisect.bisect(self.cumulative, rng.random()), len(self.levels) - 1)]
+                findings.append((rng.choice(self.plugins[level]), rng.choice(_PORTS)))
+            yield host, findings
+
+
+def _plugin_output(host: Dict, port: tuple) -> str:
+    """Per-host output text of a finding."""
+    return f"Detected on {host['ip']} ({host['fqdn']}) port {port[0]}/{port[1]}."
+
+
+def _chunked(parts: Iterator[str], chunk_size: int) -> Iterator[bytes]:
+    """Join string parts into UTF-8 chunks of about chunk_size bytes."""
+    buffer = []
+    size = 0
+    for part in parts:
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
+
+def iter_nessus(
+    hosts: int,
+    findings_per_host: int,
+    severity_mix: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Generate a .nessus (NessusClientData_v2) file in chunks.
+
+    Args:
+        hosts: Number of hosts
+        findings_per_host: Findings (ReportItems) per host
+        severity_mix: Relative weight of each severity (default: DEFAULT_SEVERITY_MIX)
+        seed: Seed; the same arguments always give the same bytes
+        chunk_size: Approximate size of each chunk in bytes
+
+    Yields:
+        Chunks of the file, e.g. to write to disk or to send as a response body
+    """
+    return _chunked(_nessus_parts(_Generator(seed, severity_mix), hosts, findings_per_host, seed), chunk_size)
+
+
+def _nessus_parts(gen: _Generator, hosts: int, findings_per_host: int, seed: int) -> Iterator[str]:
+    """Yield the text of a .nessus file piece by piece."""
+    # The static part of every plugin's <ReportItem> is rendered once
+    bodies = {}
+    for plugins in gen.plugins.values():
+        for p in plugins:
+            children = [f"<cve>{cve}</cve>" for cve in p['cves']]
+            if p['cvss']:
+                children.append(f"<cvss_base_score>{p['cvss']}</cvss_base_score>")
+            children += [
+                f"<risk_factor>{p['risk']}</risk_factor>",
+                f"<synopsis>{escape(p['synopsis'])}</synopsis>",
+                f"<description>{escape(p['description'])}</description>",
+                f"<solution>{escape(p['solution'])}</solution>",
+                f"<see_also>{escape(p['see_also'])}</see_also>",
+                f"<plugin_publication_date>{p['published']}</plugin_publication_date>",
+            ]
+            attrs = (f'severity="{p["severity"]}" pluginID="{p["id"]}" pluginName={quoteattr(p["name"])} '
+                     f'pluginFamily={quoteattr(p["family"])}')
+            bodies[p['id']] = (attrs, ''.join(children))
+
+    yield '<?xml version="1.0" ?>\n<NessusClientData_v2>\n'
+    yield f'<Policy><policyName>Synthetic load test (seed {seed})</policyName></Policy>\n'
+    yield f'<Report name="Synthetic scan {seed}" xmlns:cm="http://www.nessus.org/cm">\n'
+    for host, findings in gen.hosts(hosts, findings_per_host):
+        yield (
+            f'<ReportHost name="{host["ip"]}"><HostProperties>'
+            '<tag name="HOST_START">Mon Jan  5 02:00:00 2026</tag>'
+            '<tag name="HOST_END">Mon Jan  5 02:30:00 2026</tag>'
+            f'<tag name="host-ip">{host["ip"]}</tag>'
+            f'<tag name="host-fqdn">{host["fqdn"]}</tag>'
+            f'<tag name="operating-system">{host["os"]}</tag>'
+            '</HostProperties>\n'
+        )
+        for plugin, port in findings:
+            attrs, children = bodies[plugin['id']]
+            yield (
+                f'<ReportItem port="{port[0]}" svc_name="{port[2]}" protocol="{port[1]}" {attrs}>'
+                f'{children}<plugin_output>{escape(_plugin_output(host, port))}</plugin_output></ReportItem>\n'
+            )
+        yield '</ReportHost>\n'
+    yield '</Report>\n</NessusClientData_v2>\n'
+
+
+def iter_csv(
+    hosts: int,
+    findings_per_host: int,
+    severity_mix: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Generate a Nessus-style CSV file (DEFAULT_COLUMNS, one row per CVE) in chunks.
+
+    Args:
+        hosts: Number of hosts
+        findings_per_host: Findings per host
+        severity_mix: Relative weight of each severity (default: DEFAULT_SEVERITY_MIX)
+        seed: Seed; the same arguments describe the same findings as iter_nessus()
+        chunk_size: Approximate size of each chunk in bytes
+
+    Yields:
+        Chunks of the file
+    """
+    return _chunked(_csv_parts(_Generator(seed, severity_mix), hosts, findings_per_host), chunk_size)
+
+
+def _csv_parts(gen: _Generator, hosts: int, findings_per_host: int) -> Iterator[str]:
+    """Yield the text of a CSV file row by row."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+
+    def line(row: List) -> str:
+        out.seek(0)
+        out.truncate()
+        writer.writerow(row)
+        return out.getvalue()[:-2]
+
+    # The plugin columns around the per-host ones are rendered once per plugin and CVE
+    rows = {}
+    for plugins in gen.plugins.values():
+        for p in plugins:
+            tail = line([p['name'], p['synopsis'], p['description'], p['solution'], p['see_also']])
+            rows[p['id']] = [(line([p['id'], cve, p['cvss'], p['risk']]), tail) for cve in p['cves'] or ['']]
+
+    yield line(DEFAULT_COLUMNS) + '\r\n'
+    for host, findings in gen.hosts(hosts, findings_per_host):
+        for plugin, port in findings:
+            output = line([_plugin_output(host, port)])
+            for head, tail in rows[plugin['id']]:
+                yield f"{head},{host['ip']},{port[1]},{port[0]},{tail},{output}\r\n"
+
+
+def write_fixture(
+    path: str,
+    hosts: int,
+    findings_per_host: int,
+    severity_mix: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+    format: Optional[str] = None
+) -> Dict:
+    """
+    Write a synthetic scan file to disk.
+
+    Args:
+        path: Output file
+        hosts: Number of hosts
+        findings_per_host: Findings per host
+        severity_mix: Relative weight of each severity (default: DEFAULT_SEVERITY_MIX)
+        seed: Seed; the same arguments always give the same file
+        format: 'nessus' or 'csv' (default: from the file extension)
+
+    Returns:
+        Stats dict with path, format, hosts, findings, bytes and seconds
+
+    Raises:
+        ValueError: If the format cannot be determined
+    """
+    format = format or os.path.splitext(path)[1].lstrip('.').lower()
+    generators = {'nessus': iter_nessus, 'csv': iter_csv}
+    if format not in generators:
+        raise ValueError(f"Cannot generate '{path}': format must be 'nessus' or 'csv'")
+
+    start = time.monotonic()
+    size = 0
+    with open(path, 'wb') as f:
+        for chunk in generators[format](hosts, findings_per_host, severity_mix, seed):
+            f.write(chunk)
+            size += len(chunk)
+
+    return {
+        'path': path,
+        'format': format,
+        'hosts': hosts,
+        'findings': hosts * findings_per_host,
+        'bytes': size,
+        'seconds': round(time.monotonic() - start, 2)
+    }
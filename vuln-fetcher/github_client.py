@@ -1,10 +1,18 @@
 """
 GitHub API Client for retrieving Nessus scan files from repositories.
 """
+import os
+import json
+import shutil
+import tarfile
 import requests
+from requests.adapters import HTTPAdapter
 import base64
 import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple, Callable
+from deadline import Deadline, request_timeout, deadline_errors
+import progress
+from compression import ACCEPT_ENCODING, wire_size
 
 logger = logging.getLogger(__name__)
 
@@ -12,42 +20,67 @@ logger = logging.getLogger(__name__)
 class GitHubClient:
     """Client for interacting with GitHub API to fetch Nessus scan files."""
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        pool_size: int = 10
+    ):
         """
         Initialize GitHub client.
 
         Args:
             token: GitHub personal access token (optional, for private repos or higher rate limits)
+            timeouts: (connect, read) timeouts by endpoint class ('api',
+                'download'); see deadline.DEFAULT_TIMEOUTS
+            pool_size: Keep-alive connections kept open per host
         """
         self.token = token
+        self.timeouts = timeouts or {}
         self.base_url = "https://api.github.com"
         self.headers = {
             'Accept': 'application/vnd.github+json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'X-GitHub-Api-Version': '2022-11-28'
         }
         if token:
             self.headers['Authorization'] = f'Bearer {token}'
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        endpoint_class: str = 'api',
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> requests.Response:
         """
         Make HTTP request to GitHub API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
-            **kwargs: Additional arguments to pass to requests
+            endpoint_class: Timeout class of the endpoint ('api' or 'download')
+            deadline: Optional job deadline the timeout is clamped to
+            **kwargs: Additional arguments to pass to requests (headers are
+                added to the client's default headers)
 
         Returns:
             Response object
 
         Raises:
             requests.exceptions.RequestException: If request fails
+            DeadlineExceeded: If the deadline has passed or was cancelled
         """
         url = f"{self.base_url}{endpoint}"
-        kwargs['headers'] = self.headers
+        kwargs['headers'] = {**self.headers, **kwargs.get('headers', {})}
+        kwargs['timeout'] = request_timeout(self.timeouts, endpoint_class, deadline)
 
         logger.debug(f"Making {method} request to {url}")
-        response = requests.request(method, url, **kwargs)
+        with deadline_errors(deadline, f"{method} {endpoint}"):
+            response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
         return response
 
@@ -109,7 +142,8 @@ class GitHubClient:
         path: str = "",
         ref: str = "main",
         recursive: bool = True,
-        file_types: List[str] = None
+        file_types: List[str] = None,
+        on_file: Optional[Callable[[Dict], None]] = None
     ) -> List[Dict]:
         """
         Find all scan files (Nessus and CSV) in a repository.
@@ -121,6 +155,8 @@ class GitHubClient:
             ref: Branch/tag/commit
             recursive: Search subdirectories (default: True)
             file_types: List of file extensions to search for (default: ['.nessus', '.csv'])
+            on_file: Optional callback called with each scan file as soon as
+                it is found, e.g. to show results while the search continues
 
         Returns:
             List of scan file objects with metadata
@@ -144,7 +180,7 @@ class GitHubClient:
                                 file_type = ext.lstrip('.')
                                 break
 
-                        scan_files.append({
+                        scan_file = {
                             'name': item['name'],
                             'path': item['path'],
                             'size': item['size'],
@@ -152,11 +188,14 @@ class GitHubClient:
                             'download_url': item.get('download_url'),
                             'url': item['url'],
                             'type': file_type
-                        })
+                        }
+                        scan_files.append(scan_file)
+                        if on_file:
+                            on_file(scan_file)
                 elif item['type'] == 'dir' and recursive:
                     # Recursively search subdirectories
                     subdir_files = self.find_scan_files(
-                        owner, repo, item['path'], ref, recursive, file_types
+                        owner, repo, item['path'], ref, recursive, file_types, on_file
                     )
                     scan_files.extend(subdir_files)
 
@@ -170,7 +209,8 @@ class GitHubClient:
         owner: str,
         repo: str,
         path: str,
-        ref: str = "main"
+        ref: str = "main",
+        deadline: Optional[Deadline] = None
     ) -> bytes:
         """
         Get the content of a file from the repository.
@@ -180,6 +220,7 @@ class GitHubClient:
             repo: Repository name
             path: File path within repository
             ref: Branch/tag/commit
+            deadline: Optional job deadline
 
         Returns:
             File content as bytes
@@ -190,10 +231,13 @@ class GitHubClient:
         response = self._make_request(
             'GET',
             f'/repos/{owner}/{repo}/contents/{path}',
-            params=params
+            endpoint_class='download',
+            deadline=deadline,
+            params=params,
+            stream=True
         )
 
-        data = response.json()
+        data = json.loads(self._read_body(response, f"{owner}/{repo}/{path}"))
 
         # GitHub API returns file content base64-encoded
         if data.get('encoding') == 'base64':
@@ -203,6 +247,158 @@ class GitHubClient:
         else:
             raise ValueError(f"Unsupported encoding: {data.get('encoding')}")
 
+    def list_commits(
+        self,
+        owner: str,
+        repo: str,
+        path: str,
+        ref: str = "main",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        per_page: int = 100
+    ) -> List[Dict]:
+        """
+        List the commits on a ref that touched a path, newest first.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            path: File path within repository
+            ref: Branch/tag/commit the history is read from
+            since: Optional ISO 8601 date or time; only later commits are listed
+            until: Optional ISO 8601 date or time; only earlier commits are listed
+            per_page: Commits fetched per request (GitHub allows at most 100)
+
+        Returns:
+            List of commit objects as returned by the GitHub API
+        """
+        logger.info(f"Listing commits of {owner}/{repo}/{path} (ref: {ref})")
+        params = {'path': path, 'sha': ref, 'per_page': per_page}
+        if since:
+            params['since'] = since
+        if until:
+            params['until'] = until
+
+        commits = []
+        page = 1
+        while True:
+            response = self._make_request(
+                'GET',
+                f'/repos/{owner}/{repo}/commits',
+                params={**params, 'page': page}
+            )
+            batch = response.json()
+            commits.extend(batch)
+            if len(batch) < per_page:
+                break
+            page += 1
+        return commits
+
+    def get_commit_sha(self, owner: str, repo: str, ref: str = "main") -> str:
+        """
+        Resolve a branch, tag or commit to its commit SHA.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch/tag/commit
+
+        Returns:
+            Full commit SHA
+        """
+        response = self._make_request(
+            'GET',
+            f'/repos/{owner}/{repo}/commits/{ref}',
+            headers={'Accept': 'application/vnd.github.sha'}
+        )
+        return response.text.strip()
+
+    def compare_commits(self, owner: str, repo: str, base: str, head: str) -> Dict:
+        """
+        Compare two commits.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            base: Base commit SHA (or ref)
+            head: Head commit SHA (or ref)
+
+        Returns:
+            Comparison as returned by the GitHub API; 'files' lists the files
+            changed between the merge base and head (at most 300) with their
+            'filename', 'status' and blob 'sha'
+        """
+        logger.info(f"Comparing {owner}/{repo} {base[:12]}...{head[:12]}")
+        response = self._make_request('GET', f'/repos/{owner}/{repo}/compare/{base}...{head}')
+        return response.json()
+
+    def get_commit_file(self, owner: str, repo: str, sha: str, path: str) -> Optional[Dict]:
+        """
+        Get the version of a file a commit left behind.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Commit SHA
+            path: File path within repository
+
+        Returns:
+            Dict with the file's blob 'sha' and, when known, 'size'; None if
+            the commit deleted the file
+        """
+        response = self._make_request('GET', f'/repos/{owner}/{repo}/commits/{sha}')
+        for file in response.json().get('files') or []:
+            if file.get('filename') == path:
+                if file.get('status') == 'removed':
+                    return None
+                return {'sha': file['sha'], 'size': None}
+
+        # Commits listing more than 300 files are truncated; ask for the file at that commit instead
+        try:
+            item = self.list_repository_contents(owner, repo, path, sha)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+        if not isinstance(item, dict) or item.get('type') != 'file':
+            return None
+        return {'sha': item['sha'], 'size': item.get('size')}
+
+    def get_blob(
+        self,
+        owner: str,
+        repo: str,
+        sha: str,
+        name: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> bytes:
+        """
+        Download a blob (one version of a file) by its SHA.
+
+        Unlike get_file_content() the raw bytes are sent, not base64 in
+        JSON, and files up to 100 MB can be fetched.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Blob SHA
+            name: Name shown in progress output (default: the SHA)
+            deadline: Optional job deadline
+
+        Returns:
+            Blob content as bytes
+        """
+        logger.info(f"Fetching blob {sha} from {owner}/{repo}")
+        response = self._make_request(
+            'GET',
+            f'/repos/{owner}/{repo}/git/blobs/{sha}',
+            endpoint_class='download',
+            deadline=deadline,
+            headers={'Accept': 'application/vnd.github.raw+json'},
+            stream=True
+        )
+        return self._read_body(response, name or f"{owner}/{repo}@{sha[:12]}")
+
     def download_file_direct(self, download_url: str) -> bytes:
         """
         Download file directly using the download URL.
@@ -214,9 +410,109 @@ class GitHubClient:
             File content as bytes
         """
         logger.info(f"Downloading file from {download_url}")
-        response = requests.get(download_url)
+        response = self.session.get(
+            download_url, headers={'Accept-Encoding': ACCEPT_ENCODING},
+            timeout=request_timeout(self.timeouts, 'download'), stream=True
+        )
         response.raise_for_status()
-        return response.content
+        return self._read_body(response, download_url)
+
+    @staticmethod
+    def _read_body(response: requests.Response, name: str, chunk_size: int = 1024 * 1024) -> bytes:
+        """Read a streamed response body, reporting download progress as it arrives."""
+        chunks = []
+        with response, progress.transfer('download', name, progress.content_length(response)) as tracked:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                chunks.append(chunk)
+                tracked.advance(len(chunk))
+        compressed = wire_size(response)
+        if compressed is not None:
+            logger.debug(f"Downloaded {name}: {tracked.done} bytes, {compressed} on the wire")
+        return b''.join(chunks)
+
+    def download_archive(
+        self,
+        owner: str,
+        repo: str,
+        dest_dir: str,
+        ref: str = "main",
+        file_types: List[str] = None,
+        path_filter: Optional[Callable[[str], bool]] = None
+    ) -> List[Dict]:
+        """
+        Download a ref's tarball once and extract only the matching scan files.
+
+        The archive is read as a stream, member by member, so neither the
+        tarball nor the skipped files are ever held in memory or written to disk.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            dest_dir: Directory to extract matching files into (repository layout is kept)
+            ref: Branch/tag/commit
+            file_types: List of file extensions to extract (default: ['.nessus', '.csv'])
+            path_filter: Optional callable taking a repository path; only paths
+                for which it returns True are extracted
+
+        Returns:
+            List of scan file objects like find_scan_files(), with 'local_path' set
+        """
+        if file_types is None:
+            file_types = ['.nessus', '.csv']
+
+        logger.info(f"Downloading archive of {owner}/{repo} (ref: {ref})")
+        response = self._make_request(
+            'GET',
+            f'/repos/{owner}/{repo}/tarball/{ref}',
+            endpoint_class='download',
+            stream=True
+        )
+        response.raw.decode_content = True
+
+        dest_root = os.path.realpath(dest_dir)
+        scan_files = []
+
+        with response, progress.transfer('download', f"{owner}/{repo}@{ref}") as tracked, \
+                tarfile.open(fileobj=progress.ProgressReader(response.raw, tracked), mode='r|gz') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+
+                # Members live under a single "<owner>-<repo>-<sha>/" top-level directory
+                parts = member.name.split('/', 1)
+                if len(parts) != 2:
+                    continue
+                path = parts[1]
+
+                file_type = next(
+                    (ext.lstrip('.') for ext in file_types if path.lower().endswith(ext)),
+                    None
+                )
+                if file_type is None or (path_filter and not path_filter(path)):
+                    continue
+
+                local_path = os.path.realpath(os.path.join(dest_root, path))
+                if not local_path.startswith(dest_root + os.sep):
+                    logger.warning(f"Skipping archive member outside destination: {member.name}")
+                    continue
+
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                with archive.extractfile(member) as src, open(local_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+
+                scan_files.append({
+                    'name': os.path.basename(path),
+                    'path': path,
+                    'size': member.size,
+                    'sha': None,
+                    'download_url': None,
+                    'url': None,
+                    'type': file_type,
+                    'local_path': local_path
+                })
+
+        logger.info(f"Extracted {len(scan_files)} scan files from archive")
+        return scan_files
 
     @staticmethod
     def parse_github_url(url: str) -> Dict[str, str]:
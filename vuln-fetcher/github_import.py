@@ -0,0 +1,837 @@
+"""
+Non-interactive bulk import of scan files from GitHub repositories into Paramify.
+"""
+import os
+import re
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+import posixpath
+import urllib.parse
+import requests
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Tuple
+from github_client import GitHubClient
+from github_sync import SyncState
+from paramify_client import ParamifyClient
+from journal import JobJournal, STAGE_UPLOADED
+from transcode import transcode_for_upload
+from findings_index import FindingsIndex, index_quietly
+from sharding import Shard
+from deadline import Deadline
+from scheduler import ImportScheduler, PriorityPolicy
+
+logger = logging.getLogger(__name__)
+
+# Characters that make a path segment a glob rather than a literal directory
+GLOB_CHARS = set('*?[')
+
+# Patterns used when no --glob is given
+DEFAULT_PATTERNS = ['**/*.nessus', '**/*.csv']
+
+# Compare statuses of files whose new version should be imported
+CHANGED_STATUSES = ('added', 'modified', 'renamed', 'copied', 'changed')
+
+# GitHub lists at most this many files in a comparison
+COMPARE_FILE_LIMIT = 300
+
+
+def parse_repo_spec(spec: str) -> Dict[str, str]:
+    """
+    Parse a repository spec into owner, repo, ref, and path components.
+
+    Supports formats:
+    - owner/repo
+    - owner/repo@ref
+    - https://github.com/owner/repo/tree/branch/path
+
+    Args:
+        spec: Repository spec
+
+    Returns:
+        Dict with owner, repo, ref, and path
+    """
+    spec = spec.strip()
+    if 'github.com' in spec:
+        parsed = GitHubClient.parse_github_url(spec)
+        parsed['path'] = urllib.parse.unquote(parsed['path'])
+        return parsed
+
+    ref = 'main'
+    if '@' in spec:
+        spec, ref = spec.rsplit('@', 1)
+
+    parts = spec.strip('/').split('/')
+    if len(parts) != 2 or not all(parts):
+        raise ValueError(f"Invalid repository spec: {spec} (expected owner/repo[@ref])")
+
+    return {'owner': parts[0], 'repo': parts[1], 'ref': ref, 'path': ''}
+
+
+def commit_time(commit: Dict) -> str:
+    """Get a commit's committer date (ISO 8601, as returned by the GitHub API)."""
+    return commit['commit']['committer']['date']
+
+
+def job_label(job: Dict) -> str:
+    """Describe a job's file for messages: repo/path, plus the short commit SHA of a file version."""
+    label = f"{job['owner']}/{job['repo']}/{job['path']}"
+    if job.get('commit'):
+        label += f"@{job['commit'][:7]}"
+    return label
+
+
+def git_blob_sha(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA git (and GitHub) gives a file's content as a blob."""
+    digest = hashlib.sha1(f"blob {os.path.getsize(path)}\0".encode())
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """
+    Compile a path glob into a regular expression.
+
+    '*' and '?' match within a single path segment, '**' matches any number
+    of segments (including none), and '[...]' is a character class.
+
+    Args:
+        pattern: Glob such as 'scans/2026-*/**/*.nessus'
+
+    Returns:
+        Compiled regex matching full repository paths
+    """
+    i = 0
+    regex = ''
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+        elif pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            regex += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            regex += '[^/]'
+            i += 1
+        elif pattern[i] == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                regex += re.escape('[')
+                i += 1
+            else:
+                chars = pattern[i + 1:end]
+                if chars.startswith('!'):
+                    chars = '^' + chars[1:]
+                regex += f'[{chars}]'
+                i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(f'^{regex}$')
+
+
+def glob_base(pattern: str) -> str:
+    """
+    Get the literal directory prefix of a glob, used as the search root.
+
+    Args:
+        pattern: Path glob
+
+    Returns:
+        Directory path with no glob characters ('' for the repository root)
+    """
+    segments = pattern.split('/')
+    base = []
+    # The last segment is the file name, never a directory to descend into
+    for segment in segments[:-1]:
+        if GLOB_CHARS & set(segment):
+            break
+        base.append(segment)
+    return '/'.join(base)
+
+
+def parse_mapping(entries: List[str]) -> List[Tuple[str, str]]:
+    """
+    Parse 'GLOB=ASSESSMENT_ID' mapping entries.
+
+    ASSESSMENT_ID may list several comma-separated targets (e.g. one per
+    Paramify tenant); matching files are then uploaded to each of them.
+
+    Args:
+        entries: Mapping entries from the command line
+
+    Returns:
+        List of (glob, assessment_id) tuples in the given order
+    """
+    mapping = []
+    for entry in entries:
+        if '=' not in entry:
+            raise ValueError(f"Invalid mapping: {entry} (expected GLOB=ASSESSMENT_ID)")
+        pattern, assessment_id = entry.rsplit('=', 1)
+        mapping.append((pattern.strip(), assessment_id.strip()))
+    return mapping
+
+
+class GitHubBulkImporter:
+    """Discovers scan files across repositories and imports them concurrently."""
+
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        paramify_client: ParamifyClient,
+        max_workers: int = 4,
+        archive: bool = False,
+        download_dir: Optional[str] = None,
+        journal: Optional[JobJournal] = None,
+        transcode_csv: bool = False,
+        transcode_columns: Optional[List[str]] = None,
+        findings_index: Optional[FindingsIndex] = None,
+        shard: Optional[Shard] = None,
+        job_timeout: Optional[float] = None,
+        scheduler_limits: Optional[Dict[str, int]] = None,
+        priority_policy: Optional[PriorityPolicy] = None
+    ):
+        """
+        Initialize the bulk importer.
+
+        Args:
+            github_client: Client used for discovery and downloads
+            paramify_client: Client used for uploads (a ParamifyTenants for
+                'TENANT:UUID' targets)
+            max_workers: Maximum number of concurrent discovery/import workers
+            archive: Fetch each repository as one tarball instead of per-file API calls
+            download_dir: Where archive mode extracts files (a temporary
+                directory, removed by close(), if not provided)
+            journal: Optional job journal; files already uploaded by an
+                earlier run are skipped
+            transcode_csv: Convert .nessus files to compact CSV before uploading them
+            transcode_columns: CSV columns to keep when transcoding (default:
+                the columns of a Nessus CSV export)
+            findings_index: Optional findings index every imported file is added to
+            shard: Optional shard; plan() keeps only the files this shard owns
+            job_timeout: Optional time limit in seconds for each file's
+                download and upload together
+            scheduler_limits: Optional concurrency limits by endpoint
+                ('github', 'paramify', 'paramify:<assessment UUID>')
+            priority_policy: Optional policy; files for assessments with the
+                nearest deadline are imported first
+        """
+        self.github_client = github_client
+        self.paramify_client = paramify_client
+        self.max_workers = max_workers
+        self.archive = archive
+        self.download_dir = download_dir
+        self.journal = journal
+        self.transcode_csv = transcode_csv
+        self.transcode_columns = transcode_columns
+        self.findings_index = findings_index
+        self.shard = shard
+        self.job_timeout = job_timeout
+        self.scheduler_limits = scheduler_limits or {}
+        self.priority_policy = priority_policy or PriorityPolicy()
+        self._temp_dir = None
+        # Downloads of files that go to several assessments, by file
+        self._shared: Dict[str, Dict] = {}
+
+    def close(self) -> None:
+        """Remove files extracted into the temporary download directory."""
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+    def _work_dir(self) -> str:
+        """Get the directory archive mode extracts into, creating it if needed."""
+        if self.download_dir:
+            return self.download_dir
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix='vuln-fetcher-')
+        return self._temp_dir
+
+    def discover(self, repos: List[str], patterns: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Find every scan file matching the patterns in the given repositories.
+
+        Only the literal directory prefix of each pattern is walked, so
+        'scans/2026-*/**/*.nessus' never lists anything outside 'scans/'.
+        In archive mode each repository is instead fetched as one tarball
+        and the matching files are extracted to disk ('local_path' is set).
+
+        Args:
+            repos: Repository specs (owner/repo[@ref] or GitHub URLs), or
+                specs already parsed by parse_repo_spec()
+            patterns: Path globs relative to the repository root (or to the
+                path in a GitHub URL)
+
+        Returns:
+            List of scan file dicts, each with owner, repo and ref added
+        """
+        patterns = patterns or DEFAULT_PATTERNS
+
+        # Work out which directories to walk in each repository
+        searches = []
+        for spec in repos:
+            parsed = spec if isinstance(spec, dict) else parse_repo_spec(spec)
+            repo_patterns = [
+                posixpath.join(parsed['path'], p) if parsed['path'] else p
+                for p in patterns
+            ]
+            if self.archive:
+                # The whole ref is fetched at once, so there is nothing to narrow down
+                searches.append((parsed, None, [glob_to_regex(p) for p in repo_patterns]))
+                continue
+            bases = sorted({glob_base(p) for p in repo_patterns})
+            # Skip bases already covered by a shallower one
+            roots = []
+            for base in bases:
+                if not any(base == r or base.startswith(r + '/') or r == '' for r in roots):
+                    roots.append(base)
+            for root in roots:
+                searches.append((parsed, root, [glob_to_regex(p) for p in repo_patterns]))
+
+        files = []
+        seen = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                self._submit_search(pool, parsed, root, regexes): (parsed, regexes)
+                for parsed, root, regexes in searches
+            }
+            for future in as_completed(futures):
+                parsed, regexes = futures[future]
+                for item in future.result():
+                    key = (parsed['owner'], parsed['repo'], parsed['ref'], item['path'])
+                    if key in seen or not any(r.match(item['path']) for r in regexes):
+                        continue
+                    seen.add(key)
+                    files.append({
+                        **item,
+                        'owner': parsed['owner'],
+                        'repo': parsed['repo'],
+                        'ref': parsed['ref']
+                    })
+
+        files.sort(key=lambda f: (f['owner'], f['repo'], f['ref'], f['path']))
+        logger.info(f"Discovered {len(files)} matching scan files in {len(repos)} repositories")
+        return files
+
+    def discover_changes(
+        self,
+        repos: List[str],
+        patterns: Optional[List[str]],
+        state: SyncState
+    ) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        Find the scan files added or modified since each repository's last sync.
+
+        Each repository's ref is resolved to its head commit and compared
+        with the commit recorded in the sync state, so the cost depends on
+        the size of the change, not of the repository. A repository that
+        was never synced, whose recorded commit no longer exists, or whose
+        change is too large for one comparison is discovered in full.
+        Files are always read at the head commit, so a file changed again
+        during the sync is imported as of that commit.
+
+        Args:
+            repos: Repository specs (owner/repo[@ref] or GitHub URLs)
+            patterns: Path globs relative to the repository root (or to the
+                path in a GitHub URL)
+            state: Sync state holding the last synced commit of each repository
+
+        Returns:
+            Tuple of (files like discover()'s with 'ref' set to the head
+            commit and 'sync_key' to the repository's state entry, head
+            commit by state entry). The heads are not recorded here; the
+            caller updates the state once the files are imported.
+        """
+        patterns = patterns or DEFAULT_PATTERNS
+        files = []
+        heads = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {}
+            for spec in repos:
+                parsed = parse_repo_spec(spec)
+                key = SyncState.key(parsed)
+                futures[pool.submit(self._changes, parsed, patterns, state.commit(key))] = key
+            for future in as_completed(futures):
+                key = futures[future]
+                heads[key], changed = future.result()
+                files += [{**file, 'sync_key': key} for file in changed]
+
+        files.sort(key=lambda f: (f['owner'], f['repo'], f['path']))
+        return files, heads
+
+    def _changes(self, parsed: Dict, patterns: List[str], base: Optional[str]) -> Tuple[str, List[Dict]]:
+        """Get a repository's head commit and the matching files changed since the base commit."""
+        owner, repo = parsed['owner'], parsed['repo']
+        head = self.github_client.get_commit_sha(owner, repo, parsed['ref'])
+        if head == base:
+            logger.info(f"{owner}/{repo}@{parsed['ref']} has not changed since {base[:12]}")
+            return head, []
+
+        at_head = {**parsed, 'ref': head}
+        if base is None:
+            logger.info(f"First sync of {owner}/{repo}@{parsed['ref']}, discovering all files")
+            return head, self.discover([at_head], patterns)
+
+        try:
+            comparison = self.github_client.compare_commits(owner, repo, base, head)
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            logger.warning(
+                f"Last synced commit {base[:12]} of {owner}/{repo} no longer exists "
+                f"(history rewritten?), discovering all files"
+            )
+            return head, self.discover([at_head], patterns)
+
+        changed = comparison.get('files') or []
+        if len(changed) >= COMPARE_FILE_LIMIT:
+            logger.warning(
+                f"{owner}/{repo} changed too much since {base[:12]} for one comparison, "
+                f"discovering all files"
+            )
+            return head, self.discover([at_head], patterns)
+
+        regexes = [
+            glob_to_regex(posixpath.join(parsed['path'], p) if parsed['path'] else p)
+            for p in patterns
+        ]
+        files = []
+        for item in changed:
+            path = item['filename']
+            if item.get('status') not in CHANGED_STATUSES or not any(r.match(path) for r in regexes):
+                continue
+            name = posixpath.basename(path)
+            files.append({
+                'name': name,
+                'path': path,
+                'size': None,
+                'sha': item['sha'],
+                'download_url': None,
+                'url': None,
+                'type': posixpath.splitext(name)[1].lstrip('.').lower(),
+                'owner': owner,
+                'repo': repo,
+                'ref': head
+            })
+        logger.info(
+            f"{len(files)} of {len(changed)} files changed in {owner}/{repo} "
+            f"since {base[:12]} match"
+        )
+        return head, files
+
+    def discover_history(
+        self,
+        repos: List[str],
+        paths: List[str],
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Find every distinct version of files that are overwritten in place.
+
+        The commits touching each path are listed, and the blob each one
+        left behind is looked up concurrently. A version is kept only the
+        first time its blob SHA appears, so commits that did not change the
+        content (or restored an earlier version) are not imported again.
+
+        Args:
+            repos: Repository specs (owner/repo[@ref] or GitHub URLs); the
+                history of the ref is read
+            paths: File paths relative to the repository root (or to the
+                path in a GitHub URL)
+            since: Optional ISO 8601 date; only later commits are considered
+            until: Optional ISO 8601 date; only earlier commits are
+                considered (a date alone includes that whole day)
+
+        Returns:
+            List of file version dicts, oldest first, like discover()'s but
+            with 'ref' and 'commit' set to the commit SHA, 'branch' to the
+            ref whose history was read, 'sha' to the blob SHA, and
+            'effective_date' to the commit date (YYYY-MM-DD)
+        """
+        if until and len(until) == len('YYYY-MM-DD'):
+            until += 'T23:59:59Z'
+
+        histories = []
+        for spec in repos:
+            parsed = parse_repo_spec(spec)
+            for path in paths:
+                path = posixpath.join(parsed['path'], path) if parsed['path'] else path
+                histories.append((parsed, path.strip('/')))
+
+        commits = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(
+                    self.github_client.list_commits,
+                    parsed['owner'], parsed['repo'], path, parsed['ref'], since, until
+                ): (parsed, path)
+                for parsed, path in histories
+            }
+            for future in as_completed(futures):
+                parsed, path = futures[future]
+                commits += [(parsed, path, commit) for commit in future.result()]
+
+            futures = {
+                pool.submit(
+                    self.github_client.get_commit_file,
+                    parsed['owner'], parsed['repo'], commit['sha'], path
+                ): (parsed, path, commit)
+                for parsed, path, commit in commits
+            }
+            versions = []
+            for future in as_completed(futures):
+                parsed, path, commit = futures[future]
+                blob = future.result()
+                if blob is not None:
+                    versions.append((parsed, path, commit, blob))
+
+        files = []
+        seen = set()
+        # Oldest first, so each blob is imported with the date it first appeared
+        versions.sort(key=lambda v: (commit_time(v[2]), v[2]['sha']))
+        for parsed, path, commit, blob in versions:
+            key = (parsed['owner'], parsed['repo'], path, blob['sha'])
+            if key in seen:
+                continue
+            seen.add(key)
+            name = posixpath.basename(path)
+            files.append({
+                'name': name,
+                'path': path,
+                'size': blob['size'],
+                'sha': blob['sha'],
+                'download_url': None,
+                'url': None,
+                'type': posixpath.splitext(name)[1].lstrip('.').lower(),
+                'owner': parsed['owner'],
+                'repo': parsed['repo'],
+                'ref': commit['sha'],
+                'commit': commit['sha'],
+                'branch': parsed['ref'],
+                'effective_date': commit_time(commit)[:10]
+            })
+
+        logger.info(
+            f"Found {len(files)} distinct versions in {len(commits)} commits "
+            f"touching {len(histories)} paths"
+        )
+        return files
+
+    def _submit_search(self, pool: ThreadPoolExecutor, parsed: Dict, root: Optional[str], regexes: List):
+        """Submit a directory walk, or in archive mode a tarball download, for one repository."""
+        if not self.archive:
+            return pool.submit(
+                self.github_client.find_scan_files,
+                parsed['owner'], parsed['repo'], root, parsed['ref']
+            )
+
+        dest_dir = os.path.join(
+            self._work_dir(), parsed['owner'], parsed['repo'], parsed['ref'].replace('/', '_')
+        )
+        return pool.submit(
+            self.github_client.download_archive,
+            parsed['owner'], parsed['repo'], dest_dir, parsed['ref'],
+            path_filter=lambda path: any(r.match(path) for r in regexes)
+        )
+
+    @staticmethod
+    def resolve_assessment(
+        path: str,
+        mapping: List[Tuple[str, str]],
+        default_assessment_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Pick the target assessment for a file path.
+
+        Args:
+            path: Repository file path
+            mapping: Ordered (glob, assessment_id) pairs; the first match wins
+            default_assessment_id: Assessment used when no mapping matches
+
+        Returns:
+            Assessment UUID (or comma-separated targets, as given), or None
+            if nothing matches and there is no default
+        """
+        for pattern, assessment_id in mapping:
+            if glob_to_regex(pattern).match(path):
+                return assessment_id
+        return default_assessment_id
+
+    def plan(
+        self,
+        files: List[Dict],
+        mapping: List[Tuple[str, str]],
+        default_assessment_id: Optional[str] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Pair discovered files with their target assessments.
+
+        Args:
+            files: Files from discover()
+            mapping: Ordered (glob, assessment_id) pairs
+            default_assessment_id: Assessment used when no mapping matches
+
+        Returns:
+            Tuple of (jobs with an 'assessment_id' key, files with no target).
+            A file mapped to several comma-separated targets gets one job
+            per target. Files owned by other shards are left out of both.
+        """
+        jobs = []
+        unmapped = []
+        for file in files:
+            if self.shard and not self.shard.owns(self.item_key(file)):
+                continue
+            targets = self.resolve_assessment(file['path'], mapping, default_assessment_id) or ''
+            assessment_ids = [t.strip() for t in targets.split(',') if t.strip()]
+            if assessment_ids:
+                jobs += [{**file, 'assessment_id': a} for a in dict.fromkeys(assessment_ids)]
+            else:
+                unmapped.append(file)
+        return jobs, unmapped
+
+    def run(self, jobs: List[Dict], effective_date: Optional[str] = None) -> List[Dict]:
+        """
+        Download and upload every job concurrently, most urgent assessments first.
+
+        A file with jobs for several assessments is downloaded once and
+        the content shared by its uploads.
+
+        Args:
+            jobs: Jobs from plan()
+            effective_date: Optional effective date (YYYY-MM-DD format) for
+                jobs without their own (file versions from
+                discover_history() carry their commit date)
+
+        Returns:
+            List of per-file result dicts with the job fields, success, and
+            either result or error
+        """
+        results = []
+        uses = Counter(self._origin(job) for job in jobs if not job.get('local_path'))
+        self._shared = {
+            origin: {'lock': threading.Lock(), 'content': None, 'users': count}
+            for origin, count in uses.items() if count > 1
+        }
+        with ImportScheduler(self.max_workers, self.scheduler_limits) as scheduler:
+            futures = {}
+            for job in jobs:
+                endpoints = [f"paramify:{job['assessment_id']}"]
+                if not job.get('local_path'):
+                    endpoints.append('github')
+                future = scheduler.submit(
+                    self.import_file, job, job.get('effective_date') or effective_date,
+                    priority=self.priority_policy.deadline_priority(job['assessment_id']),
+                    endpoints=endpoints
+                )
+                futures[future] = job
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    results.append({**job, 'success': True, 'result': future.result()})
+                except Exception as e:
+                    logger.warning(f"Import failed for {job_label(job)}: {e}")
+                    results.append({**job, 'success': False, 'error': str(e)})
+        self._shared = {}
+        return results
+
+    def import_file(self, job: Dict, effective_date: Optional[str] = None) -> Dict:
+        """
+        Download one file from GitHub and upload it to its assessment.
+
+        With a journal, a version of the file (by blob SHA) already uploaded
+        to the assessment is skipped, whichever ref it was found at.
+
+        Args:
+            job: Job from plan()
+            effective_date: Optional effective date (YYYY-MM-DD format)
+
+        Returns:
+            Response from Paramify upload, with a 'transcode' entry holding
+            the transcoding stats when the file was converted to CSV
+        """
+        # Journaled by content (blob SHA), so a changed file is imported again
+        key = None
+        if self.journal:
+            try:
+                key = JobJournal.job_key(
+                    'github', f"{job['owner']}/{job['repo']}", job['path'], self._blob_sha(job), job['assessment_id']
+                )
+                uploaded = self.journal.stage(key) == STAGE_UPLOADED
+            except Exception:
+                self._release(job)
+                raise
+            if uploaded:
+                # Jobs of other assessments may still need the shared download
+                self._release(job)
+                logger.info(f"This version of {job['path']} was already uploaded to {job['assessment_id']}, skipping")
+                return self.journal.get(key)['result']
+
+        deadline = Deadline(self.job_timeout)
+        if self.transcode_csv and job['name'].lower().endswith('.nessus'):
+            result = self._import_transcoded(job, effective_date, deadline)
+        elif job.get('local_path'):
+            # Streamed from the extracted file, so a large scan is never read into memory
+            index_quietly(
+                self.findings_index, job['local_path'], name=job['name'],
+                origin=self._origin(job), effective_date=effective_date
+            )
+            result = self.paramify_client.upload_intake_file(
+                assessment_id=job['assessment_id'],
+                file_path=job['local_path'],
+                filename=job['name'],
+                effective_date=effective_date,
+                deadline=deadline
+            )
+        else:
+            content = self._fetch(job, deadline)
+            self._index_content(job, content, effective_date)
+            result = self.paramify_client.upload_intake(
+                assessment_id=job['assessment_id'],
+                file_content=content,
+                filename=job['name'],
+                effective_date=effective_date,
+                deadline=deadline
+            )
+
+        if self.journal:
+            artifacts = result.get('artifacts') or [{}]
+            self.journal.record(key, STAGE_UPLOADED, artifact_id=artifacts[0].get('id'), result=result)
+        return result
+
+    def _blob_sha(self, job: Dict) -> str:
+        """Get the git blob SHA of a job's file version, hashing an extracted file or asking GitHub if needed."""
+        if job.get('sha'):
+            return job['sha']
+        if job.get('local_path'):
+            return git_blob_sha(job['local_path'])
+        item = self.github_client.list_repository_contents(job['owner'], job['repo'], job['path'], job['ref'])
+        return item['sha']
+
+    def _import_transcoded(
+        self,
+        job: Dict,
+        effective_date: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """
+        Convert a .nessus file to CSV and upload the CSV instead.
+
+        Args:
+            job: Job from plan()
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            deadline: Optional job deadline
+
+        Returns:
+            Response from Paramify upload, with the transcoding stats under 'transcode'
+        """
+        source_path = job.get('local_path')
+        fetched_path = None
+        if not source_path:
+            content = self._fetch(job, deadline)
+            fd, fetched_path = tempfile.mkstemp(suffix='.nessus')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            del content
+            source_path = fetched_path
+
+        try:
+            index_quietly(
+                self.findings_index, source_path, name=job['name'],
+                origin=self._origin(job), effective_date=effective_date
+            )
+            csv_path, csv_filename, stats = transcode_for_upload(
+                source_path, job['name'], self.transcode_columns
+            )
+        finally:
+            if fetched_path:
+                os.remove(fetched_path)
+
+        try:
+            result = self.paramify_client.upload_intake_file(
+                assessment_id=job['assessment_id'],
+                file_path=csv_path,
+                filename=csv_filename,
+                effective_date=effective_date,
+                deadline=deadline
+            )
+        finally:
+            os.remove(csv_path)
+
+        result['transcode'] = stats
+        return result
+
+    def _fetch(self, job: Dict, deadline: Optional[Deadline] = None) -> bytes:
+        """
+        Download a job's file.
+
+        A file shared by several jobs is downloaded by the first of them
+        and released once the last one has it (or has given up its share).
+        """
+        shared = self._shared.get(self._origin(job))
+        if shared is None:
+            return self._download(job, deadline)
+        with shared['lock']:
+            try:
+                content = shared['content']
+                if content is None:
+                    content = shared['content'] = self._download(job, deadline)
+                return content
+            finally:
+                self._drop_user(shared)
+
+    def _release(self, job: Dict) -> None:
+        """Give up a job's share of a shared download without fetching it."""
+        shared = self._shared.get(self._origin(job))
+        if shared is not None and not job.get('local_path'):
+            with shared['lock']:
+                self._drop_user(shared)
+
+    @staticmethod
+    def _drop_user(shared: Dict) -> None:
+        """Count one job of a shared download as done, freeing the content after the last (lock held)."""
+        shared['users'] -= 1
+        if not shared['users']:
+            shared['content'] = None
+
+    def _download(self, job: Dict, deadline: Optional[Deadline] = None) -> bytes:
+        """Download a job's file, by blob SHA for versions from discover_history()."""
+        if job.get('commit'):
+            return self.github_client.get_blob(
+                job['owner'], job['repo'], job['sha'], name=job_label(job), deadline=deadline
+            )
+        return self.github_client.get_file_content(
+            job['owner'], job['repo'], job['path'], job['ref'], deadline=deadline
+        )
+
+    def _index_content(self, job: Dict, content: bytes, effective_date: Optional[str] = None) -> None:
+        """Add a downloaded file to the findings index, logging instead of raising on failure."""
+        if self.findings_index is None:
+            return
+        try:
+            self.findings_index.index_bytes(
+                content, job['name'], origin=self._origin(job), effective_date=effective_date
+            )
+        except Exception as e:
+            logger.warning(f"Could not index {job['path']}: {e}")
+
+    @staticmethod
+    def item_key(file: Dict) -> str:
+        """Stable identifier of a repository file (or file version), used for sharding and the ledger."""
+        key = f"github:{file['owner']}/{file['repo']}:{file['path']}"
+        if file.get('commit'):
+            key += f"@{file['commit']}"
+        return key
+
+    @staticmethod
+    def _origin(job: Dict) -> str:
+        """Describe where a job's file came from, for the findings index."""
+        return f"github:{job['owner']}/{job['repo']}@{job['ref']}:{job['path']}"
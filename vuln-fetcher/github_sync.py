@@ -0,0 +1,65 @@
+"""
+Last synced commit of each GitHub repository, so a sync only imports what changed.
+
+The state is one small JSON file mapping a repository, ref and path to the
+commit SHA the last successful sync imported. A sync compares that commit
+with the current head and imports only the scan files added or modified in
+between.
+"""
+import os
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SyncState:
+    """JSON file of the last synced commit per repository, ref and path."""
+
+    def __init__(self, path: str):
+        """
+        Open a sync state file, loading the commits recorded by earlier syncs.
+
+        Args:
+            path: State file path (created by the first save())
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            # Starting over only costs one full discovery
+            logger.warning(f"Ignoring unreadable sync state {path}: {e}")
+
+    @staticmethod
+    def key(parsed: Dict[str, str]) -> str:
+        """Build the entry name of a parsed repository spec: owner/repo@ref:path."""
+        return f"{parsed['owner']}/{parsed['repo']}@{parsed['ref']}:{parsed['path']}"
+
+    def commit(self, key: str) -> Optional[str]:
+        """Get the last synced commit SHA of an entry, or None if it was never synced."""
+        with self._lock:
+            return (self._entries.get(key) or {}).get('commit')
+
+    def update(self, key: str, commit: str) -> None:
+        """Record the commit an entry has been synced to (written by save())."""
+        with self._lock:
+            self._entries[key] = {
+                'commit': commit,
+                'synced': datetime.now(timezone.utc).isoformat()
+            }
+
+    def save(self) -> None:
+        """Write the state file, replacing it atomically."""
+        with self._lock:
+            partial_path = f"{self.path}.tmp"
+            with open(partial_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(partial_path, self.path)
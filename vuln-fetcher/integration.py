@@ -1,10 +1,31 @@
 """
 Integration orchestration for Nessus to Paramify workflow.
 """
+import os
 import logging
-from typing import Optional
+import contextlib
+import tempfile
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, TimeoutError as FuturesTimeoutError
+from typing import Optional, Union, List, Dict, Tuple, Callable, Any, Iterator
 from nessus_client import NessusClient
-from paramify_client import ParamifyClient
+from paramify_client import ParamifyClient, ParamifyTenants
+from transcode import transcode_for_upload
+from consolidate import consolidate_nessus
+from preflight import preflight_file
+from findings_index import FindingsIndex, index_quietly
+from sharding import Shard
+from deadline import Deadline, DeadlineExceeded, when_run
+import progress
+from scheduler import ImportScheduler, PriorityPolicy
+from journal import (
+    JobJournal,
+    STAGE_EXPORT_REQUESTED,
+    STAGE_EXPORT_READY,
+    STAGE_DOWNLOADED,
+    STAGE_UPLOADED
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +39,21 @@ class NessusParamifyIntegration:
         nessus_access_key: str,
         nessus_secret_key: str,
         paramify_api_key: str,
-        paramify_base_url: str = "https://stage.paramify.com/api/v0"
+        paramify_base_url: str = "https://stage.paramify.com/api/v0",
+        nessus_profiles: Optional[Dict[str, Dict[str, str]]] = None,
+        paramify_profiles: Optional[Dict[str, Dict]] = None,
+        paramify_compress_uploads: bool = False,
+        paramify_attach_summary: bool = False,
+        export_registry_path: Optional[str] = None,
+        transcode_csv: bool = False,
+        transcode_columns: Optional[List[str]] = None,
+        findings_index: Optional[FindingsIndex] = None,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        job_timeout: Optional[float] = None,
+        scanner_timeout: Optional[float] = None,
+        scheduler_limits: Optional[Dict[str, int]] = None,
+        priority_policy: Optional[PriorityPolicy] = None,
+        pool_size: int = 10
     ):
         """
         Initialize the integration.
@@ -29,44 +64,294 @@ class NessusParamifyIntegration:
             nessus_secret_key: Nessus API secret key
             paramify_api_key: Paramify API key
             paramify_base_url: Paramify API base URL
+            nessus_profiles: Optional named scanner profiles (name -> dict with
+                url, access_key, secret_key). Overrides the single nessus_* arguments.
+            paramify_profiles: Optional named Paramify tenants (name -> dict with
+                api_key, base_url, rate_limit). Overrides the single paramify_*
+                arguments; assessments are then addressed as 'TENANT:UUID'.
+            paramify_compress_uploads: Send uploads gzip-compressed when the
+                server accepts it (single-tenant setup; tenants set it per profile)
+            paramify_attach_summary: Add scan summaries to artifact metadata
+                (single-tenant setup; tenants set it per profile)
+            export_registry_path: Optional file to persist Nessus export file IDs
+                in, so exports are reused across runs
+            transcode_csv: Convert exports to compact CSV before uploading them
+            transcode_columns: CSV columns to keep when transcoding (default:
+                the columns of a Nessus CSV export)
+            findings_index: Optional findings index every downloaded export is added to
+            timeouts: Optional (connect, read) timeouts by endpoint class
+                ('api', 'download', 'upload') for the Nessus and Paramify clients
+            job_timeout: Optional time limit in seconds for each scan import
+                (details, export, download and upload together)
+            scanner_timeout: Optional time limit in seconds for each scanner
+                when several are listed or imported from at once; a scanner
+                that takes longer is reported as failed so the others' results
+                are not held up
+            scheduler_limits: Optional concurrency limits of batch imports by
+                endpoint ('nessus', 'nessus:<scanner>', 'paramify',
+                'paramify:<assessment UUID>'; see ImportScheduler)
+            priority_policy: Optional policy ranking the scans of a batch
+                import (default: PriorityPolicy())
+            pool_size: Keep-alive connections each client keeps open to its server
         """
-        self.nessus_client = NessusClient(
-            url=nessus_url,
-            access_key=nessus_access_key,
-            secret_key=nessus_secret_key
-        )
-        self.paramify_client = ParamifyClient(
-            api_key=paramify_api_key,
-            base_url=paramify_base_url
-        )
+        if not nessus_profiles:
+            nessus_profiles = {
+                'default': {
+                    'url': nessus_url,
+                    'access_key': nessus_access_key,
+                    'secret_key': nessus_secret_key
+                }
+            }
+
+        self.nessus_clients = {
+            name: NessusClient(
+                url=profile['url'],
+                access_key=profile['access_key'],
+                secret_key=profile['secret_key'],
+                export_registry_path=export_registry_path,
+                timeouts=timeouts,
+                pool_size=pool_size
+            )
+            for name, profile in nessus_profiles.items()
+        }
+        # The first profile is the default scanner for single-scanner operations
+        self.nessus_client = next(iter(self.nessus_clients.values()))
+        if paramify_profiles:
+            self.paramify_client = ParamifyTenants(paramify_profiles, timeouts=timeouts, pool_size=pool_size)
+        else:
+            self.paramify_client = ParamifyClient(
+                api_key=paramify_api_key,
+                base_url=paramify_base_url,
+                timeouts=timeouts,
+                pool_size=pool_size,
+                compress_uploads=paramify_compress_uploads,
+                attach_summary=paramify_attach_summary
+            )
+        self.job_timeout = job_timeout
+        self.scanner_timeout = scanner_timeout
+        self.scheduler_limits = scheduler_limits or {}
+        self.priority_policy = priority_policy or PriorityPolicy()
+        self.transcode_csv = transcode_csv
+        self.transcode_columns = transcode_columns
+        self.findings_index = findings_index
+
+    @property
+    def scanner_names(self) -> List[str]:
+        """Names of the configured Nessus scanners."""
+        return list(self.nessus_clients)
+
+    def get_nessus_client(self, scanner: Optional[str] = None) -> NessusClient:
+        """
+        Get the Nessus client for a named scanner.
+
+        Args:
+            scanner: Scanner profile name (default scanner if not provided)
 
-    def list_nessus_scans(self):
+        Returns:
+            NessusClient for the scanner
+
+        Raises:
+            ValueError: If the scanner is not configured
+        """
+        if scanner is None:
+            return self.nessus_client
+        if scanner not in self.nessus_clients:
+            raise ValueError(
+                f"Unknown Nessus scanner '{scanner}'. Configured: {', '.join(self.nessus_clients)}"
+            )
+        return self.nessus_clients[scanner]
+
+    def list_nessus_scans(self, scanner: Optional[str] = None):
         """
         List all available Nessus scans.
 
+        Args:
+            scanner: Scanner profile name (default scanner if not provided)
+
         Returns:
             List of scan dictionaries
         """
-        return self.nessus_client.list_scans()
+        return self.get_nessus_client(scanner).list_scans()
+
+    def list_all_nessus_scans(self, timeout: Optional[float] = None) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        List scans from every configured scanner in parallel.
+
+        Each scan is tagged with a 'scanner' key. A scanner that fails or
+        does not answer within the timeout is reported in the errors dict
+        and does not affect the others.
+
+        Args:
+            timeout: Optional timeout in seconds (default: the integration's
+                scanner_timeout)
+
+        Returns:
+            Tuple of (merged list of scans, dict of scanner name -> error message)
+        """
+        def list_tagged(name: str, client: NessusClient) -> List[Dict]:
+            scans = client.list_scans()
+            for scan in scans:
+                scan['scanner'] = name
+            return scans
+
+        results, errors = self.fan_out(list_tagged, timeout=timeout or self.scanner_timeout)
+        scans = [scan for name in self.nessus_clients if name in results for scan in results[name]]
+        return scans, errors
+
+    def iter_nessus_scans(
+        self,
+        scanner: Optional[str] = None
+    ) -> Iterator[Tuple[str, Optional[List[Dict]], Optional[str]]]:
+        """
+        List scans from every scanner (or one), yielding each scanner's scans as soon as it answers.
+
+        Each scan is tagged with a 'scanner' key. Unlike
+        list_all_nessus_scans(), a fast scanner's scans can be used while
+        slower ones are still being queried.
+
+        Args:
+            scanner: Scanner profile name (default: every scanner)
+
+        Yields:
+            Tuples of (scanner name, scans, None), or (scanner name, None,
+            error message) for a scanner that failed or did not answer within
+            the integration's scanner_timeout
+        """
+        names = [scanner] if scanner else self.scanner_names
+        clients = {name: self.get_nessus_client(name) for name in names}
+        pool = ThreadPoolExecutor(max_workers=len(clients))
+        try:
+            futures = {pool.submit(client.list_scans): name for name, client in clients.items()}
+            pending = set(futures)
+            try:
+                for future in as_completed(futures, timeout=self.scanner_timeout):
+                    pending.discard(future)
+                    name = futures[future]
+                    try:
+                        scans = future.result()
+                    except Exception as e:
+                        logger.warning(f"Scanner '{name}' failed: {e}")
+                        yield name, None, str(e)
+                        continue
+                    for scan in scans:
+                        scan['scanner'] = name
+                    yield name, scans, None
+            except FuturesTimeoutError:
+                for future in pending:
+                    name = futures[future]
+                    logger.warning(f"Scanner '{name}' timed out after {self.scanner_timeout}s")
+                    yield name, None, f"Timed out after {self.scanner_timeout}s"
+        finally:
+            # Don't block on scanners that timed out
+            pool.shutdown(wait=False, cancel_futures=True)
 
-    def list_paramify_assessments(self, params: Optional[dict] = None):
+    def fan_out(
+        self,
+        func: Callable[[str, NessusClient], Any],
+        scanners: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Run an operation against several scanners in parallel.
+
+        Args:
+            func: Callable taking (scanner name, NessusClient)
+            scanners: Scanner names to run against (default: all)
+            timeout: Optional timeout in seconds for the whole fan-out
+
+        Returns:
+            Tuple of (dict of scanner name -> result, dict of scanner name -> error message)
+        """
+        names = scanners if scanners is not None else self.scanner_names
+        clients = {name: self.get_nessus_client(name) for name in names}
+
+        results = {}
+        errors = {}
+        pool = ThreadPoolExecutor(max_workers=max(len(clients), 1))
+        try:
+            futures = {pool.submit(func, name, client): name for name, client in clients.items()}
+            done, not_done = wait(futures, timeout=timeout)
+            for future in done:
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.warning(f"Scanner '{name}' failed: {e}")
+                    errors[name] = str(e)
+            for future in not_done:
+                name = futures[future]
+                logger.warning(f"Scanner '{name}' timed out after {timeout}s")
+                errors[name] = f"Timed out after {timeout}s"
+        finally:
+            # Don't block on scanners that timed out
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return results, errors
+
+    @property
+    def tenant_names(self) -> List[str]:
+        """Names of the configured Paramify tenants (empty with a single Paramify account)."""
+        return getattr(self.paramify_client, 'tenant_names', [])
+
+    def list_paramify_assessments(self, params: Optional[dict] = None, tenants: Optional[List[str]] = None):
         """
         List all available Paramify assessments.
 
+        With several tenants, every tenant is listed in parallel and each
+        assessment's 'id' is its 'TENANT:UUID' target.
+
         Args:
             params: Optional filter parameters
+            tenants: Tenants to list (default: all)
 
         Returns:
             List of assessment dictionaries
+
+        Raises:
+            ValueError: If tenants are given but none are configured
+        """
+        if not self.tenant_names:
+            if tenants:
+                raise ValueError("No Paramify tenants are configured (set PARAMIFY_TENANTS)")
+            return self.paramify_client.list_assessments(params)
+        return self.paramify_client.list_assessments(params, tenants)
+
+    def iter_paramify_assessments(
+        self,
+        params: Optional[dict] = None,
+        tenants: Optional[List[str]] = None
+    ) -> Iterator[Tuple[Optional[str], Optional[List[Dict]], Optional[str]]]:
+        """
+        List assessments, yielding each tenant's assessments as soon as it answers.
+
+        Args:
+            params: Optional filter parameters
+            tenants: Tenants to list (default: all)
+
+        Yields:
+            Tuples of (tenant name or None with a single Paramify account,
+            assessments, None), or (tenant name, None, error message) for
+            a tenant that failed
+
+        Raises:
+            ValueError: If tenants are given but none are configured, or one is unknown
         """
-        return self.paramify_client.list_assessments(params)
+        if not self.tenant_names:
+            if tenants:
+                raise ValueError("No Paramify tenants are configured (set PARAMIFY_TENANTS)")
+            yield None, self.paramify_client.list_assessments(params), None
+            return
+        yield from self.paramify_client.iter_assessments(params, tenants)
 
     def import_scan_to_assessment(
         self,
         scan_id: int,
         assessment_id: str,
         effective_date: Optional[str] = None,
-        artifact_metadata: Optional[dict] = None
+        artifact_metadata: Optional[dict] = None,
+        scanner: Optional[str] = None,
+        journal: Optional[JobJournal] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> dict:
         """
         Import a Nessus scan into a Paramify assessment.
@@ -76,63 +361,931 @@ class NessusParamifyIntegration:
         2. Exports the scan in .nessus format
         3. Uploads it to the specified Paramify assessment
 
+        With a journal, each completed stage is recorded and a rerun resumes
+        from the last one: a finished upload is not repeated, a downloaded
+        file is uploaded again without re-exporting, and a requested export
+        is reused while Nessus still has it. Jobs are journaled per scan run,
+        so a run newer than the one last imported is imported again.
+
+        The whole import is bounded by the integration's job_timeout, and
+        stops early (removing its temporary files) if cancel_event is set.
+
         Args:
             scan_id: Nessus scan ID
             assessment_id: Paramify assessment UUID
             effective_date: Optional effective date (YYYY-MM-DD format)
             artifact_metadata: Optional metadata for the artifact
+            scanner: Scanner profile name (default scanner if not provided)
+            journal: Optional job journal to record and resume stages
+            cancel_event: Optional event that cancels the import when set
 
         Returns:
             Response from Paramify upload
 
         Raises:
+            DeadlineExceeded: If the import runs out of time or is cancelled
             Exception: If any step fails
         """
         logger.info(f"Starting import of Nessus scan {scan_id} to Paramify assessment {assessment_id}")
+        nessus_client = self.get_nessus_client(scanner)
+        deadline = Deadline(self.job_timeout, cancel_event)
 
         # Get scan details for metadata
-        scan_details = self.nessus_client.get_scan_details(scan_id)
+        scan_details = nessus_client.get_scan_details(scan_id, deadline)
         scan_name = scan_details.get('info', {}).get('name', f'scan_{scan_id}')
         logger.info(f"Scan name: {scan_name}")
+        scan = {'id': scan_id, 'name': scan_name}
+        history_id = nessus_client.latest_history_id(scan_details)
 
-        # Export and download the scan
-        logger.info("Exporting scan from Nessus...")
-        scan_content = self.nessus_client.get_scan_export(scan_id, format='nessus')
-        logger.info(f"Successfully exported scan ({len(scan_content)} bytes)")
-
-        # Generate filename
-        filename = f"{scan_name}.nessus"
-        # Sanitize filename
-        filename = "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+        # A new run of the scan is a new job, not one the journal has finished
+        key = self._job_key(scanner, scan_id, history_id, assessment_id)
+        if journal and journal.stage(key) == STAGE_UPLOADED:
+            logger.info(f"Run {history_id} of scan {scan_id} was already uploaded to {assessment_id}, skipping")
+            return journal.get(key)['result']
 
-        # Create artifact metadata if not provided
-        if artifact_metadata is None:
-            artifact_metadata = {}
+        # Export the scan unless a previous run already downloaded it
+        file_id = None
+        if not (journal and journal.downloaded_file(key)):
+            logger.info("Exporting scan from Nessus...")
+            file_id = self._start_export(nessus_client, scan_id, journal, key, history_id, deadline)
+            nessus_client.wait_for_export(scan_id, file_id, deadline=deadline)
 
-        # Upload to Paramify
+        # Download and upload to Paramify
         logger.info(f"Uploading to Paramify assessment {assessment_id}...")
-        result = self.paramify_client.upload_intake(
+        result = self._transfer_export(
+            nessus_client, scan, file_id, assessment_id, effective_date,
+            artifact_metadata, journal, key, deadline
+        )
+
+        logger.info("Import completed successfully")
+        return result
+
+    def import_scan_to_assessments(
+        self,
+        scan_id: int,
+        assessment_ids: List[str],
+        effective_date: Optional[str] = None,
+        artifact_metadata: Optional[dict] = None,
+        scanner: Optional[str] = None,
+        journal: Optional[JobJournal] = None,
+        max_workers: int = 4,
+        cancel_event: Optional[threading.Event] = None
+    ) -> List[Dict]:
+        """
+        Import one Nessus scan into several Paramify assessments.
+
+        The scan is exported and downloaded once, then the same file on disk
+        is uploaded to every assessment in parallel. A failed upload does not
+        affect the others. Assessments may belong to different Paramify
+        tenants ('TENANT:UUID'); each tenant's uploads use its own
+        connections. The integration's job_timeout bounds the whole fan-out,
+        export and uploads included.
+
+        Args:
+            scan_id: Nessus scan ID
+            assessment_ids: Paramify assessment UUIDs or 'TENANT:UUID' targets
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            artifact_metadata: Optional metadata for the artifacts
+            scanner: Scanner profile name (default scanner if not provided)
+            journal: Optional job journal; assessments already uploaded to are
+                skipped and the download is kept until every upload succeeds
+            max_workers: Maximum number of concurrent uploads
+            cancel_event: Optional event that cancels the import (the export
+                wait, download and every upload) when set
+
+        Returns:
+            List of per-assessment result dictionaries (in the given order)
+            with assessment_id, success, and either result or error
+
+        Raises:
+            Exception: If exporting or downloading the scan fails
+        """
+        assessment_ids = list(dict.fromkeys(assessment_ids))
+        logger.info(f"Starting import of Nessus scan {scan_id} to {len(assessment_ids)} Paramify assessments")
+        nessus_client = self.get_nessus_client(scanner)
+        deadline = Deadline(self.job_timeout, cancel_event)
+        scan_details = nessus_client.get_scan_details(scan_id, deadline)
+        scan = {'id': scan_id, 'name': scan_details.get('info', {}).get('name', f'scan_{scan_id}')}
+        history_id = nessus_client.latest_history_id(scan_details)
+
+        results = {}
+        remaining = []
+        for assessment_id in assessment_ids:
+            key = self._job_key(scanner, scan_id, history_id, assessment_id)
+            if journal and journal.stage(key) == STAGE_UPLOADED:
+                logger.info(f"Scan {scan_id} was already uploaded to {assessment_id}, skipping")
+                results[assessment_id] = {
+                    'assessment_id': assessment_id,
+                    'success': True,
+                    'result': journal.get(key)['result']
+                }
+            else:
+                remaining.append(assessment_id)
+
+        if remaining:
+            # Export and download once for all targets
+            export_key = self._export_key(scanner, scan_id, history_id)
+            file_id = None
+            if not (journal and journal.downloaded_file(export_key)):
+                file_id = self._start_export(nessus_client, scan_id, journal, export_key, history_id, deadline)
+                nessus_client.wait_for_export(scan_id, file_id, deadline=deadline)
+            local_path = self._download_export(nessus_client, scan, file_id, journal, export_key, deadline)
+            upload_path = None
+
+            try:
+                # Transcode once, then upload the same file everywhere
+                upload_path, filename, stats = self._prepare_upload(nessus_client, local_path, scan, effective_date)
+                results.update(self._upload_to_assessments(
+                    upload_path, filename, remaining, effective_date, artifact_metadata, journal,
+                    {
+                        assessment_id: self._job_key(scanner, scan_id, history_id, assessment_id)
+                        for assessment_id in remaining
+                    },
+                    stats, deadline, max_workers
+                ))
+            finally:
+                if upload_path and upload_path != local_path:
+                    os.remove(upload_path)
+                # Keep a journaled download until every target has it
+                if not journal or all(
+                    assessment_id in results and results[assessment_id]['success']
+                    for assessment_id in remaining
+                ):
+                    os.remove(local_path)
+
+        return [results[assessment_id] for assessment_id in assessment_ids]
+
+    def resolve_folder(self, folder: Union[int, str], scanner: Optional[str] = None) -> Dict:
+        """
+        Look up a Nessus folder by ID or name.
+
+        Args:
+            folder: Folder ID, or folder name (case-insensitive)
+            scanner: Scanner profile name (default scanner if not provided)
+
+        Returns:
+            Folder dictionary
+
+        Raises:
+            ValueError: If no matching folder exists
+        """
+        folders = self.get_nessus_client(scanner).list_folders()
+        folder_str = str(folder).strip()
+
+        if folder_str.isdigit():
+            match = next((f for f in folders if f.get('id') == int(folder_str)), None)
+        else:
+            match = next(
+                (f for f in folders if str(f.get('name', '')).lower() == folder_str.lower()),
+                None
+            )
+
+        if match is None:
+            raise ValueError(f"Nessus folder not found: {folder}")
+        return match
+
+    def import_folder_to_assessment(
+        self,
+        folder: Union[int, str],
+        assessment_id: str,
+        effective_date: Optional[str] = None,
+        max_workers: int = 4,
+        max_retries: int = 30,
+        poll_interval: float = 2,
+        scanner: Optional[str] = None,
+        journal: Optional[JobJournal] = None,
+        shard: Optional[Shard] = None,
+        cancel_event: Optional[threading.Event] = None,
+        scheduler: Optional[ImportScheduler] = None
+    ) -> List[Dict]:
+        """
+        Import every completed scan in a Nessus folder into a Paramify assessment.
+
+        All exports are requested up front and polled together, so Nessus
+        builds them in parallel. Each export is downloaded and uploaded as
+        soon as it is ready, while the remaining ones are still being polled.
+
+        Export requests and transfers are run by priority (see the
+        integration's priority_policy): scans with the most severe findings
+        go first, and the scheduler's limits keep the scanner and the
+        assessment from being sent too many requests at once.
+
+        Each scan's import is bounded by the integration's job_timeout. Its
+        clock runs from when its first job starts (time spent queued behind
+        other scans is not counted) through the export wait, download and
+        upload. Setting cancel_event (or pressing
+        Ctrl+C) stops every in-flight scan at its next check and removes its
+        temporary files.
+
+        Args:
+            folder: Nessus folder ID or name
+            assessment_id: Paramify assessment UUID
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            max_workers: Maximum number of concurrent export/upload workers
+            max_retries: Maximum number of shared polling rounds
+            poll_interval: Seconds to wait between polling rounds
+            scanner: Scanner profile name (default scanner if not provided)
+            journal: Optional job journal; scans already uploaded are skipped
+                and interrupted ones resume from their last completed stage
+            shard: Optional shard; only the scans it owns are imported
+            cancel_event: Optional event that cancels the remaining imports when set
+            scheduler: Optional scheduler shared with other imports (default:
+                one with max_workers workers and the integration's limits)
+
+        Returns:
+            List of per-scan result dictionaries with scan_id, scan_name,
+            scanner, success, and either result or error
+        """
+        cancel_event = cancel_event or threading.Event()
+        nessus_client = self.get_nessus_client(scanner)
+        scanner_name = scanner or self.scanner_names[0]
+        folder_info = self.resolve_folder(folder, scanner)
+        logger.info(f"Importing Nessus folder '{folder_info.get('name')}' to Paramify assessment {assessment_id}")
+
+        scans = [
+            s for s in nessus_client.list_scans(folder_id=folder_info['id'])
+            if s.get('status') == 'completed'
+        ]
+        logger.info(f"Found {len(scans)} completed scans in folder")
+        if shard:
+            scans = [s for s in scans if shard.owns(self.scan_key(scanner_name, s['id']))]
+            logger.info(f"Shard {shard} owns {len(scans)} of them")
+
+        results = []
+        # Each clock is paused while its scan's next job is queued
+        deadlines = {s['id']: Deadline(self.job_timeout, cancel_event) for s in scans}
+        nessus_endpoint = f"nessus:{scanner_name}"
+        transfer_endpoints = [nessus_endpoint, f"paramify:{assessment_id}"]
+
+        def failed(scan: Dict, error: str) -> None:
+            results.append({
+                'scan_id': scan.get('id'),
+                'scan_name': scan.get('name'),
+                'scanner': scanner_name,
+                'success': False,
+                'error': error
+            })
+
+        def succeeded(scan: Dict, result: dict) -> None:
+            results.append({
+                'scan_id': scan.get('id'),
+                'scan_name': scan.get('name'),
+                'scanner': scanner_name,
+                'success': True,
+                'result': result
+            })
+
+        # Exports, downloads and uploads go through the priority scheduler;
+        # a shared one (from import_folder_from_all_scanners) is left running
+        owned_scheduler = None if scheduler else ImportScheduler(max_workers, self.scheduler_limits)
+        scheduler = scheduler or owned_scheduler
+
+        with ThreadPoolExecutor(max_workers=max_workers) as export_pool, \
+                (owned_scheduler or contextlib.nullcontext()):
+            try:
+                transfer_futures = {}
+
+                # Rank the scans by their findings, the assessment deadline and scan age
+                details_futures = {
+                    export_pool.submit(
+                        when_run(deadlines[scan['id']], nessus_client.get_scan_details),
+                        scan['id'], deadlines[scan['id']]
+                    ): scan
+                    for scan in scans
+                }
+                priorities = {}
+                keys = {}
+                history_ids = {}
+                for future in as_completed(details_futures):
+                    scan = details_futures[future]
+                    try:
+                        details = future.result()
+                    except Exception as e:
+                        logger.warning(f"Could not get details of scan {scan.get('id')}: {e}")
+                        failed(scan, str(e))
+                        continue
+                    history_id = nessus_client.latest_history_id(details)
+                    key = self._job_key(scanner, scan['id'], history_id, assessment_id)
+                    # Skip scan runs a previous run already finished
+                    if journal and journal.stage(key) == STAGE_UPLOADED:
+                        logger.info(f"Run {history_id} of scan {scan['id']} was already uploaded, skipping")
+                        succeeded(scan, journal.get(key)['result'])
+                        continue
+                    priorities[scan['id']] = self.priority_policy.scan_priority(details, assessment_id)
+                    keys[scan['id']] = key
+                    history_ids[scan['id']] = history_id
+
+                # Resume downloaded jobs; request every other export at once, most important first
+                export_futures = {}
+                for scan in scans:
+                    scan_id = scan['id']
+                    if scan_id not in priorities:
+                        continue
+                    key = keys[scan_id]
+                    if journal and journal.downloaded_file(key):
+                        transfer_future = scheduler.submit(
+                            when_run(deadlines[scan_id], self._transfer_export), nessus_client, scan, None,
+                            assessment_id, effective_date, None, journal, key, deadlines[scan_id],
+                            priority=priorities[scan_id], endpoints=transfer_endpoints
+                        )
+                        transfer_futures[transfer_future] = scan
+                    else:
+                        export_future = scheduler.submit(
+                            when_run(deadlines[scan_id], self._start_export),
+                            nessus_client, scan_id, journal, key, history_ids[scan_id], deadlines[scan_id],
+                            priority=priorities[scan_id], endpoints=[nessus_endpoint]
+                        )
+                        export_futures[export_future] = scan
+
+                pending = {}
+                export_waits = {}
+
+                def settle(scan_id: int) -> None:
+                    """Stop polling an export that is ready or failed."""
+                    del pending[scan_id]
+                    export_waits.pop(scan_id).finish()
+
+                for future in as_completed(export_futures):
+                    scan = export_futures[future]
+                    try:
+                        pending[scan['id']] = (scan, future.result())
+                        export_waits[scan['id']] = progress.export_wait(f"scan {scan['id']}")
+                    except Exception as e:
+                        logger.warning(f"Export request failed for scan {scan.get('id')}: {e}")
+                        failed(scan, str(e))
+
+                # Poll all pending exports together, handing ready ones off for transfer
+                for attempt in range(max_retries):
+                    for scan_id, (scan, _) in list(pending.items()):
+                        try:
+                            deadlines[scan_id].check(f"Import of scan {scan_id}")
+                        except DeadlineExceeded as e:
+                            settle(scan_id)
+                            failed(scan, str(e))
+
+                    status_futures = {
+                        export_pool.submit(
+                            nessus_client.check_export_status, scan_id, file_id, deadlines[scan_id]
+                        ): scan_id
+                        for scan_id, (_, file_id) in pending.items()
+                    }
+                    for future in as_completed(status_futures):
+                        scan_id = status_futures[future]
+                        scan, file_id = pending[scan_id]
+                        try:
+                            status = future.result()
+                        except Exception as e:
+                            logger.warning(f"Export status check failed for scan {scan_id}: {e}")
+                            settle(scan_id)
+                            failed(scan, str(e))
+                            continue
+
+                        if status == 'ready':
+                            settle(scan_id)
+                            transfer_future = scheduler.submit(
+                                when_run(deadlines[scan_id], self._transfer_export), nessus_client, scan, file_id,
+                                assessment_id, effective_date, None, journal, keys[scan_id], deadlines[scan_id],
+                                priority=priorities[scan_id], endpoints=transfer_endpoints
+                            )
+                            transfer_futures[transfer_future] = scan
+                        elif status == 'error':
+                            settle(scan_id)
+                            failed(scan, 'Nessus reported an export error')
+
+                    if not pending:
+                        break
+                    logger.debug(f"{len(pending)} exports still loading ({attempt + 1}/{max_retries})")
+                    cancel_event.wait(poll_interval)
+
+                for scan_id, (scan, _) in list(pending.items()):
+                    settle(scan_id)
+                    failed(scan, f"Export did not complete within {max_retries} retries")
+
+                for future in as_completed(transfer_futures):
+                    scan = transfer_futures[future]
+                    try:
+                        succeeded(scan, future.result())
+                    except Exception as e:
+                        logger.warning(f"Import failed for scan {scan.get('id')}: {e}")
+                        failed(scan, str(e))
+            except KeyboardInterrupt:
+                # Stop in-flight downloads and uploads before the pools wait for them
+                logger.warning("Interrupted, cancelling in-flight imports")
+                cancel_event.set()
+                raise
+
+        return results
+
+    def import_folder_from_all_scanners(
+        self,
+        folder: Union[int, str],
+        assessment_id: str,
+        effective_date: Optional[str] = None,
+        max_workers: int = 4,
+        timeout: Optional[float] = None,
+        journal: Optional[JobJournal] = None,
+        shard: Optional[Shard] = None
+    ) -> List[Dict]:
+        """
+        Import a folder (by ID or name) from every configured scanner in parallel.
+
+        A scanner that fails, lacks the folder, or exceeds the timeout is
+        reported as a single failed result and does not affect the others.
+        Imports still running when the timeout expires are cancelled.
+        All scanners share one priority scheduler, so the most important
+        scans go first whichever scanner holds them.
+
+        Args:
+            folder: Nessus folder ID or name
+            assessment_id: Paramify assessment UUID
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            max_workers: Maximum number of concurrent export/upload workers per scanner
+            timeout: Optional timeout in seconds for each scanner's import
+                (default: the integration's scanner_timeout)
+            journal: Optional job journal shared by all scanners
+            shard: Optional shard; only the scans it owns are imported
+
+        Returns:
+            Merged list of per-scan result dictionaries
+        """
+        cancel_event = threading.Event()
+        # max_workers applies per scanner unless SCHEDULER_LIMITS says otherwise
+        scheduler = ImportScheduler(
+            max_workers * len(self.nessus_clients), {'nessus': max_workers, **self.scheduler_limits}
+        )
+
+        def import_from(name: str, client: NessusClient) -> List[Dict]:
+            return self.import_folder_to_assessment(
+                folder, assessment_id, effective_date, max_workers,
+                scanner=name, journal=journal, shard=shard, cancel_event=cancel_event,
+                scheduler=scheduler
+            )
+
+        try:
+            results, errors = self.fan_out(import_from, timeout=timeout or self.scanner_timeout)
+        finally:
+            # Abandoned scanners stop at their next check instead of running on
+            cancel_event.set()
+            scheduler.shutdown(wait=False, cancel_futures=True)
+        merged = [r for name in self.nessus_clients if name in results for r in results[name]]
+        for name, error in errors.items():
+            merged.append({
+                'scan_id': None,
+                'scan_name': None,
+                'scanner': name,
+                'success': False,
+                'error': error
+            })
+        return merged
+
+    def import_folder_consolidated(
+        self,
+        folder: Union[int, str],
+        assessment_ids: List[str],
+        effective_date: Optional[str] = None,
+        max_workers: int = 4,
+        scanners: Optional[List[str]] = None,
+        report_name: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict:
+        """
+        Merge every completed scan in a Nessus folder into one upload.
+
+        Partial scans of the same boundary (per subnet, or rescans of failed
+        hosts) are exported and downloaded concurrently, then merged with
+        consolidate_nessus(): each (host, port, protocol, plugin) keeps the
+        result of the latest scan of that host. The merged file is uploaded
+        as a single artifact to every assessment, in parallel. Scans that
+        fail to download are left out.
+
+        The whole run (exports, merge and uploads) is bounded by the
+        integration's job_timeout.
+
+        Args:
+            folder: Nessus folder ID or name
+            assessment_ids: Paramify assessment UUIDs or 'TENANT:UUID' targets
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            max_workers: Maximum number of concurrent exports/downloads
+            scanners: Scanner profiles to collect the folder from (default: all);
+                a scanner without the folder is skipped
+            report_name: Name of the merged scan (default: "<folder> (consolidated)")
+            cancel_event: Optional event that cancels the run when set
+
+        Returns:
+            Dict with scans (per-scan dicts with scan_id, scan_name, scanner,
+            success and error), consolidate (merge stats, None when no scan
+            could be downloaded) and uploads (per-assessment dicts with
+            assessment_id, success, and either result or error; empty when
+            nothing was merged)
+
+        Raises:
+            ValueError: If no scanner has the folder, or it holds no completed scans
+        """
+        scanners = scanners or self.scanner_names
+        deadline = Deadline(self.job_timeout, cancel_event)
+
+        scans = []
+        folder_name = str(folder)
+        for name in scanners:
+            try:
+                folder_info = self.resolve_folder(folder, name)
+            except ValueError as e:
+                logger.warning(f"Scanner {name}: {e}")
+                continue
+            folder_name = folder_info.get('name') or folder_name
+            scans += [
+                (name, s) for s in self.get_nessus_client(name).list_scans(folder_id=folder_info['id'])
+                if s.get('status') == 'completed'
+            ]
+        if not scans:
+            raise ValueError(f"No completed scans in Nessus folder {folder}")
+        assessment_ids = list(dict.fromkeys(assessment_ids))
+        logger.info(
+            f"Consolidating {len(scans)} scans from folder '{folder_name}' into {len(assessment_ids)} assessments"
+        )
+
+        def fetch(name: str, scan: Dict) -> str:
+            nessus_client = self.get_nessus_client(name)
+            file_id = self._start_export(nessus_client, scan['id'], deadline=deadline)
+            nessus_client.wait_for_export(scan['id'], file_id, deadline=deadline)
+            local_path = self._download_export(nessus_client, scan, file_id, deadline=deadline)
+            index_quietly(
+                self.findings_index, local_path, name=self._scan_filename(scan.get('name') or f"scan_{scan['id']}"),
+                origin=self.scan_key(name, scan['id']), effective_date=effective_date
+            )
+            return local_path
+
+        downloads = {}
+        scan_results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(fetch, name, scan): (name, scan) for name, scan in scans}
+            for future in as_completed(futures):
+                name, scan = futures[future]
+                entry = {'scan_id': scan['id'], 'scan_name': scan.get('name'), 'scanner': name}
+                try:
+                    downloads[(name, scan['id'])] = future.result()
+                    scan_results.append({**entry, 'success': True})
+                except Exception as e:
+                    logger.warning(f"Could not download scan {scan['id']} from {name}: {e}")
+                    scan_results.append({**entry, 'success': False, 'error': str(e)})
+
+        if not downloads:
+            return {'scans': scan_results, 'consolidate': None, 'uploads': []}
+
+        fd, merged_path = tempfile.mkstemp(suffix='.nessus')
+        os.close(fd)
+        upload_path = merged_path
+        try:
+            # Listing order breaks ties between scans without host timestamps
+            paths = [downloads[(name, s['id'])] for name, s in scans if (name, s['id']) in downloads]
+            report_name = report_name or f"{folder_name} (consolidated)"
+            stats = consolidate_nessus(paths, merged_path, report_name)
+            for path in paths:
+                os.remove(path)
+            deadline.check(f"Consolidated import of folder {folder_name}")
+
+            filename = self._scan_filename(report_name)
+            transcode_stats = None
+            if self.transcode_csv:
+                upload_path, filename, transcode_stats = transcode_for_upload(
+                    merged_path, filename, self.transcode_columns
+                )
+            uploads = self._upload_to_assessments(
+                upload_path, filename, assessment_ids, effective_date,
+                transcode_stats=transcode_stats, deadline=deadline, max_workers=max_workers
+            )
+        finally:
+            for path in {merged_path, upload_path, *downloads.values()}:
+                if os.path.exists(path):
+                    os.remove(path)
+        return {
+            'scans': scan_results,
+            'consolidate': stats,
+            'uploads': [uploads[assessment_id] for assessment_id in assessment_ids]
+        }
+
+    @staticmethod
+    def scan_key(scanner: str, scan_id: int) -> str:
+        """Stable identifier of a scan across scanners, used for sharding and the ledger."""
+        return JobJournal.job_key('nessus', scanner, scan_id)
+
+    def _job_key(self, scanner: Optional[str], scan_id: int, history_id: Optional[int], assessment_id: str) -> str:
+        """Build the journal key for importing a run of a scan into an assessment."""
+        return JobJournal.job_key('nessus', scanner or self.scanner_names[0], scan_id, history_id, assessment_id)
+
+    def _export_key(self, scanner: Optional[str], scan_id: int, history_id: Optional[int]) -> str:
+        """Build the journal key for an export of a scan run shared by several assessments."""
+        return JobJournal.job_key('nessus', scanner or self.scanner_names[0], scan_id, history_id, 'shared-export')
+
+    def _start_export(
+        self,
+        nessus_client: NessusClient,
+        scan_id: int,
+        journal: Optional[JobJournal] = None,
+        key: Optional[str] = None,
+        history_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None
+    ) -> int:
+        """
+        Request an export, reusing one a previous run requested if Nessus still has it.
+
+        Args:
+            nessus_client: Client for the scanner holding the scan
+            scan_id: Nessus scan ID
+            journal: Optional job journal
+            key: Journal key of the job
+            history_id: Scan run to export (looked up from the scan details if not provided)
+            deadline: Optional job deadline
+
+        Returns:
+            Export file ID
+        """
+        if journal:
+            state = journal.get(key)
+            file_id = state.get('file_id')
+            if file_id and state.get('stage') in (STAGE_EXPORT_REQUESTED, STAGE_EXPORT_READY, STAGE_DOWNLOADED):
+                try:
+                    status = nessus_client.check_export_status(scan_id, file_id, deadline)
+                    if status in ('ready', 'loading'):
+                        logger.info(f"Reusing export {file_id} for scan {scan_id} from journal")
+                        return file_id
+                except requests.exceptions.RequestException as e:
+                    logger.info(f"Journaled export {file_id} for scan {scan_id} is gone ({e}), re-exporting")
+
+        # Pin the export to a run so the client's export registry can reuse it safely
+        if history_id is None:
+            history_id = nessus_client.latest_history_id(nessus_client.get_scan_details(scan_id, deadline))
+
+        file_id = nessus_client.request_export(scan_id, 'nessus', history_id, deadline)
+        if journal:
+            journal.record(key, STAGE_EXPORT_REQUESTED, file_id=file_id, history_id=history_id)
+        return file_id
+
+    def _transfer_export(
+        self,
+        nessus_client: NessusClient,
+        scan: Dict,
+        file_id: Optional[int],
+        assessment_id: str,
+        effective_date: Optional[str] = None,
+        artifact_metadata: Optional[dict] = None,
+        journal: Optional[JobJournal] = None,
+        key: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> dict:
+        """
+        Download a ready export to disk and stream it to a Paramify assessment.
+
+        Args:
+            nessus_client: Client for the scanner holding the export
+            scan: Scan dictionary with id and name
+            file_id: Ready export file ID (may be None if the journal has the download)
+            assessment_id: Paramify assessment UUID
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            artifact_metadata: Optional metadata for the artifact
+            journal: Optional job journal
+            key: Journal key of the job
+            deadline: Optional job deadline
+
+        Returns:
+            Response from Paramify upload
+        """
+        local_path = self._download_export(nessus_client, scan, file_id, journal, key, deadline)
+        upload_path = None
+
+        try:
+            upload_path, filename, stats = self._prepare_upload(nessus_client, local_path, scan, effective_date)
+            result = self._upload_export(
+                upload_path, filename, assessment_id, effective_date, artifact_metadata, journal, key, stats,
+                deadline
+            )
+        finally:
+            if upload_path and upload_path != local_path:
+                os.remove(upload_path)
+            # Without a journal there is nothing to resume, so never keep the file
+            if not journal:
+                os.remove(local_path)
+
+        if journal:
+            os.remove(local_path)
+        return result
+
+    def _download_export(
+        self,
+        nessus_client: NessusClient,
+        scan: Dict,
+        file_id: Optional[int],
+        journal: Optional[JobJournal] = None,
+        key: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> str:
+        """
+        Download a ready export to disk, or reuse the journal's earlier download.
+
+        Without a journal the file goes to a temporary path that the caller
+        must remove; with one it goes to the journal's spool directory.
+
+        Args:
+            nessus_client: Client for the scanner holding the export
+            scan: Scan dictionary with id and name
+            file_id: Ready export file ID (may be None if the journal has the download)
+            journal: Optional job journal
+            key: Journal key of the job
+            deadline: Optional job deadline
+
+        Returns:
+            Local path of the downloaded export
+        """
+        local_path = journal.downloaded_file(key) if journal else None
+        if local_path is not None:
+            logger.info(f"Resuming scan {scan['id']} from downloaded file {local_path}")
+            return local_path
+
+        if journal:
+            journal.record(key, STAGE_EXPORT_READY, file_id=file_id)
+            local_path = journal.spool_path(key, '.nessus')
+        else:
+            fd, local_path = tempfile.mkstemp(suffix='.nessus')
+            os.close(fd)
+
+        try:
+            sha256 = nessus_client.download_scan_to_file(scan['id'], file_id, local_path, deadline=deadline)
+            # A truncated download must not be journaled, or every resume would upload it again
+            preflight_file(local_path, self._scan_filename(scan.get('name') or f"scan_{scan['id']}"))
+        except Exception:
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            raise
+
+        size = os.path.getsize(local_path)
+        logger.info(f"Downloaded scan {scan['id']} ({size} bytes)")
+        if journal:
+            journal.record(key, STAGE_DOWNLOADED, file_id=file_id, local_path=local_path, sha256=sha256, size=size)
+        return local_path
+
+    def _prepare_upload(
+        self,
+        nessus_client: NessusClient,
+        local_path: str,
+        scan: Dict,
+        effective_date: Optional[str] = None
+    ) -> Tuple[str, str, Optional[Dict]]:
+        """
+        Index a downloaded export and choose the file to upload, transcoding it to CSV if enabled.
+
+        Args:
+            nessus_client: Client for the scanner the export came from
+            local_path: Downloaded export
+            scan: Scan dictionary with id and name
+            effective_date: Optional effective date (YYYY-MM-DD format)
+
+        Returns:
+            Tuple of (path, upload filename, transcode stats or None). A path
+            other than local_path is a temporary CSV the caller must remove.
+        """
+        filename = self._scan_filename(scan.get('name') or f"scan_{scan['id']}")
+        scanner = next(name for name, client in self.nessus_clients.items() if client is nessus_client)
+        index_quietly(
+            self.findings_index, local_path, name=filename,
+            origin=self.scan_key(scanner, scan['id']), effective_date=effective_date
+        )
+
+        if not self.transcode_csv:
+            return local_path, filename, None
+        return transcode_for_upload(local_path, filename, self.transcode_columns)
+
+    def _upload_to_assessments(
+        self,
+        upload_path: str,
+        filename: str,
+        assessment_ids: List[str],
+        effective_date: Optional[str] = None,
+        artifact_metadata: Optional[dict] = None,
+        journal: Optional[JobJournal] = None,
+        keys: Optional[Dict[str, str]] = None,
+        transcode_stats: Optional[Dict] = None,
+        deadline: Optional[Deadline] = None,
+        max_workers: int = 4
+    ) -> Dict[str, Dict]:
+        """
+        Upload one file to several assessments in parallel.
+
+        A failed upload does not affect the others.
+
+        Args:
+            upload_path: File to upload
+            filename: Filename to upload as
+            assessment_ids: Paramify assessment UUIDs or 'TENANT:UUID' targets
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            artifact_metadata: Optional metadata for the artifacts
+            journal: Optional job journal
+            keys: Journal key of each assessment's upload
+            transcode_stats: Stats of the CSV transcoding, if the file was transcoded
+            deadline: Optional job deadline
+            max_workers: Maximum number of concurrent uploads
+
+        Returns:
+            Dict of assessment ID -> result dict with assessment_id, success,
+            and either result or error
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(min(len(assessment_ids), max_workers), 1)) as pool:
+            futures = {
+                pool.submit(
+                    self._upload_export, upload_path, filename, assessment_id, effective_date,
+                    artifact_metadata, journal, (keys or {}).get(assessment_id), transcode_stats, deadline
+                ): assessment_id
+                for assessment_id in assessment_ids
+            }
+            for future in as_completed(futures):
+                assessment_id = futures[future]
+                try:
+                    results[assessment_id] = {
+                        'assessment_id': assessment_id,
+                        'success': True,
+                        'result': future.result()
+                    }
+                except Exception as e:
+                    logger.warning(f"Upload of {filename} to {assessment_id} failed: {e}")
+                    results[assessment_id] = {
+                        'assessment_id': assessment_id,
+                        'success': False,
+                        'error': str(e)
+                    }
+        return results
+
+    def _upload_export(
+        self,
+        upload_path: str,
+        filename: str,
+        assessment_id: str,
+        effective_date: Optional[str] = None,
+        artifact_metadata: Optional[dict] = None,
+        journal: Optional[JobJournal] = None,
+        key: Optional[str] = None,
+        transcode_stats: Optional[Dict] = None,
+        deadline: Optional[Deadline] = None
+    ) -> dict:
+        """
+        Stream a downloaded export to a Paramify assessment.
+
+        Args:
+            upload_path: File to upload, as returned by _prepare_upload()
+            filename: Filename to upload as
+            assessment_id: Paramify assessment UUID or 'TENANT:UUID' target
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            artifact_metadata: Optional metadata for the artifact
+            journal: Optional job journal
+            key: Journal key to record the upload under
+            transcode_stats: Stats of the CSV transcoding, if the file was transcoded
+            deadline: Optional job deadline
+
+        Returns:
+            Response from Paramify upload, with a 'transcode' entry holding
+            transcode_stats when the file was transcoded
+        """
+        result = self.paramify_client.upload_intake_file(
             assessment_id=assessment_id,
-            file_content=scan_content,
+            file_path=upload_path,
             filename=filename,
-            artifact_metadata=artifact_metadata,
-            effective_date=effective_date
+            artifact_metadata=dict(artifact_metadata or {}),
+            effective_date=effective_date,
+            deadline=deadline
         )
+        if transcode_stats:
+            result['transcode'] = transcode_stats
 
-        logger.info("Import completed successfully")
+        if journal:
+            artifacts = result.get('artifacts') or [{}]
+            journal.record(key, STAGE_UPLOADED, artifact_id=artifacts[0].get('id'), result=result)
         return result
 
-    def get_scan_info(self, scan_id: int) -> dict:
+    @staticmethod
+    def _scan_filename(scan_name: str) -> str:
+        """
+        Build a sanitized .nessus filename from a scan name.
+
+        Args:
+            scan_name: Nessus scan name
+
+        Returns:
+            Filename safe for upload
+        """
+        filename = f"{scan_name}.nessus"
+        return "".join(c for c in filename if c.isalnum() or c in (' ', '-', '_', '.')).strip()
+
+    def get_scan_info(self, scan_id: int, scanner: Optional[str] = None) -> dict:
         """
         Get detailed information about a Nessus scan.
 
         Args:
             scan_id: Nessus scan ID
+            scanner: Scanner profile name (default scanner if not provided)
 
         Returns:
             Scan details dictionary
         """
-        return self.nessus_client.get_scan_details(scan_id)
+        return self.get_nessus_client(scanner).get_scan_details(scan_id)
 
     def get_assessment_info(self, assessment_id: str) -> dict:
         """
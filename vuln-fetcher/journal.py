@@ -0,0 +1,182 @@
+"""
+Resumable job journal for multi-step imports.
+
+Each import job (e.g. one Nessus scan into one assessment) records every
+stage it completes in an append-only JSON-lines file. Rerunning a batch with
+the same journal picks each job up from its last completed stage instead of
+starting over.
+"""
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Dict
+
+logger = logging.getLogger(__name__)
+
+# Stages, in the order a Nessus import goes through them
+STAGE_EXPORT_REQUESTED = 'export_requested'
+STAGE_EXPORT_READY = 'export_ready'
+STAGE_DOWNLOADED = 'downloaded'
+STAGE_UPLOADED = 'uploaded'
+
+
+class JobJournal:
+    """Append-only record of import job stages."""
+
+    def __init__(self, path: str):
+        """
+        Open a journal, loading any stages recorded by earlier runs.
+
+        Args:
+            path: Journal file path (created if missing). Downloaded files
+                are kept in '<path>.spool/' until they have been uploaded.
+        """
+        self.path = path
+        self.spool_dir = f"{path}.spool"
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Replay the journal file into the in-memory job states."""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write can leave a torn last line
+                    logger.warning(f"Ignoring unreadable journal line {line_no} in {self.path}")
+                    continue
+                self._jobs.setdefault(entry['job'], {}).update(entry)
+
+        logger.info(f"Loaded {len(self._jobs)} jobs from journal {self.path}")
+
+    @staticmethod
+    def job_key(*parts) -> str:
+        """
+        Build a job key from its identifying parts.
+
+        Args:
+            *parts: e.g. source, scanner, scan ID, assessment ID
+
+        Returns:
+            Key string
+        """
+        return ':'.join(str(p) for p in parts)
+
+    def get(self, key: str) -> Dict:
+        """
+        Get the accumulated state of a job.
+
+        Args:
+            key: Job key
+
+        Returns:
+            Dict with 'stage' and the data recorded so far (empty if the job is new)
+        """
+        with self._lock:
+            return dict(self._jobs.get(key, {}))
+
+    def stage(self, key: str) -> Optional[str]:
+        """
+        Get the last completed stage of a job.
+
+        Args:
+            key: Job key
+
+        Returns:
+            Stage name, or None if the job is new
+        """
+        return self.get(key).get('stage')
+
+    def record(self, key: str, stage: str, **data) -> None:
+        """
+        Record that a job completed a stage.
+
+        Args:
+            key: Job key
+            stage: Stage name
+            **data: Stage data (file ID, local path, hash, artifact ID, ...)
+        """
+        entry = {
+            'job': key,
+            'stage': stage,
+            'time': datetime.now(timezone.utc).isoformat(),
+            **data
+        }
+        line = json.dumps(entry, default=str)
+
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._jobs.setdefault(key, {}).update(entry)
+
+        logger.debug(f"Journal: {key} -> {stage}")
+
+    def spool_path(self, key: str, suffix: str = '') -> str:
+        """
+        Get the path a job should download its file to.
+
+        Args:
+            key: Job key
+            suffix: File extension, e.g. '.nessus'
+
+        Returns:
+            Path inside the journal's spool directory
+        """
+        os.makedirs(self.spool_dir, exist_ok=True)
+        safe_key = re.sub(r'[^A-Za-z0-9._-]+', '_', key)
+        return os.path.join(self.spool_dir, f"{safe_key}{suffix}")
+
+    def downloaded_file(self, key: str) -> Optional[str]:
+        """
+        Get a job's downloaded file if it is still intact.
+
+        Args:
+            key: Job key
+
+        Returns:
+            Local path if the job reached the downloaded stage and the file
+            still matches its recorded hash, otherwise None
+        """
+        state = self.get(key)
+        if state.get('stage') != STAGE_DOWNLOADED:
+            return None
+
+        path = state.get('local_path')
+        if not path or not os.path.exists(path):
+            return None
+        if file_sha256(path) != state.get('sha256'):
+            logger.warning(f"Spooled file for {key} does not match its recorded hash")
+            return None
+        return path
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 of a file without reading it into memory at once.
+
+    Args:
+        path: File path
+        chunk_size: Bytes to read per chunk
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
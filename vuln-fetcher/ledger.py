@@ -0,0 +1,128 @@
+"""
+Append-only ledger of import outcomes, mergeable across shards for reporting.
+
+Where the job journal records progress so a run can resume, the ledger
+records what happened to every item (succeeded or failed, and why). Each
+shard writes its own ledger; merge_ledgers() combines any number of them,
+keeping the latest outcome of every item.
+"""
+import os
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional, List, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class ResultLedger:
+    """JSON-lines file of per-item import outcomes."""
+
+    def __init__(self, path: str, shard: Optional[str] = None):
+        """
+        Open a ledger for appending.
+
+        Args:
+            path: Ledger file path (created if missing)
+            shard: Shard label ('i/N') recorded with every entry
+        """
+        self.path = path
+        self.shard = shard
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        source: str,
+        item: str,
+        target: Optional[str],
+        success: bool,
+        artifact_id: Optional[str] = None,
+        error: Optional[str] = None,
+        summary: Optional[Dict] = None
+    ) -> None:
+        """
+        Append one outcome.
+
+        Args:
+            source: 'nessus', 'github', or 'file'
+            item: Item identifier (scanner:scan ID, repo file, or file path)
+            target: Paramify assessment UUID
+            success: Whether the import succeeded
+            artifact_id: Created artifact ID, on success
+            error: Error message, on failure
+            summary: Scan summary of the uploaded file, on success
+        """
+        entry = {
+            'time': datetime.now(timezone.utc).isoformat(),
+            'shard': self.shard,
+            'source': source,
+            'item': item,
+            'target': target,
+            'success': success
+        }
+        if artifact_id:
+            entry['artifact_id'] = artifact_id
+        if error:
+            entry['error'] = error
+        if summary:
+            entry['summary'] = summary
+
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, default=str) + '\n')
+
+    def record_results(self, source: str, results: List[Dict], item_key, target: Optional[str] = None) -> None:
+        """
+        Append the outcomes of a batch.
+
+        Args:
+            source: 'nessus', 'github', or 'file'
+            results: Per-item result dicts with success and result or error
+            item_key: Function returning the item identifier of a result
+            target: Assessment UUID, if not in each result as 'assessment_id'
+        """
+        for r in results:
+            result = r.get('result') or {}
+            artifacts = result.get('artifacts') or [{}]
+            self.record(
+                source,
+                item_key(r),
+                r.get('assessment_id') or target,
+                r['success'],
+                artifact_id=artifacts[0].get('id') if r['success'] else None,
+                error=r.get('error'),
+                summary=result.get('summary') if r['success'] else None
+            )
+
+
+def merge_ledgers(paths: List[str]) -> List[Dict]:
+    """
+    Merge ledgers, keeping the latest outcome of each (source, item, target).
+
+    Args:
+        paths: Ledger files (missing files are skipped with a warning)
+
+    Returns:
+        Merged entries sorted by source and item
+    """
+    latest: Dict[tuple, Dict] = {}
+    for path in paths:
+        if not os.path.exists(path):
+            logger.warning(f"Ledger not found: {path}")
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring unreadable ledger line {line_no} in {path}")
+                    continue
+                key = (entry.get('source'), entry.get('item'), entry.get('target'))
+                if key not in latest or entry.get('time', '') >= latest[key].get('time', ''):
+                    latest[key] = entry
+
+    return sorted(latest.values(), key=lambda e: (str(e.get('source')), str(e.get('item')), str(e.get('target'))))
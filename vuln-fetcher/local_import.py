@@ -0,0 +1,330 @@
+"""
+Import of scan files from the local filesystem, including a watched drop folder.
+"""
+import os
+import time
+import shutil
+import logging
+from concurrent.futures import as_completed, Future
+from typing import Optional, List, Dict, Tuple
+from paramify_client import ParamifyClient
+from findings_index import FindingsIndex, index_quietly
+from sharding import Shard
+from ledger import ResultLedger
+from deadline import Deadline
+from scheduler import ImportScheduler
+
+logger = logging.getLogger(__name__)
+
+# File types Paramify accepts as scan intake
+SCAN_EXTENSIONS = ('.nessus', '.csv')
+
+# Subfolders of a watched folder that imported files are moved into
+DONE_DIR = 'done'
+FAILED_DIR = 'failed'
+
+
+def is_scan_file(path: str) -> bool:
+    """
+    Check whether a path looks like an importable scan file.
+
+    Args:
+        path: File path
+
+    Returns:
+        True for .nessus and .csv files (hidden and partial files are skipped)
+    """
+    name = os.path.basename(path)
+    return not name.startswith('.') and name.lower().endswith(SCAN_EXTENSIONS)
+
+
+def file_key(path: str) -> str:
+    """
+    Stable identifier of a local scan file, used for sharding and the ledger.
+
+    Only the file name is used, so workers that mount the same folder at
+    different paths still agree on which shard owns a file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Key string
+    """
+    return f"file:{os.path.basename(path)}"
+
+
+def collect_scan_files(paths: List[str]) -> List[str]:
+    """
+    Expand files and directories into the list of scan files to import.
+
+    Args:
+        paths: File and/or directory paths (directories are not searched recursively)
+
+    Returns:
+        Sorted list of scan file paths
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for name in os.listdir(path):
+                full_path = os.path.join(path, name)
+                if os.path.isfile(full_path) and is_scan_file(full_path):
+                    files.add(full_path)
+        elif os.path.isfile(path):
+            files.add(path)
+        else:
+            raise FileNotFoundError(f"No such file or directory: {path}")
+    return sorted(files)
+
+
+def import_local_file(
+    paramify_client: ParamifyClient,
+    path: str,
+    assessment_id: str,
+    effective_date: Optional[str] = None,
+    findings_index: Optional[FindingsIndex] = None,
+    job_timeout: Optional[float] = None
+) -> Dict:
+    """
+    Upload one local scan file, adding it to the findings index first if one is given.
+
+    Args:
+        paramify_client: Client used for uploads
+        path: Scan file path
+        assessment_id: Paramify assessment UUID
+        effective_date: Optional effective date (YYYY-MM-DD format)
+        findings_index: Optional findings index
+        job_timeout: Optional time limit in seconds for the upload
+
+    Returns:
+        Response from Paramify upload
+    """
+    index_quietly(findings_index, path, origin=f"file:{os.path.abspath(path)}", effective_date=effective_date)
+    return paramify_client.upload_intake_file(
+        assessment_id=assessment_id,
+        file_path=path,
+        effective_date=effective_date,
+        deadline=Deadline(job_timeout)
+    )
+
+
+def import_local_files(
+    paramify_client: ParamifyClient,
+    paths: List[str],
+    assessment_id: str,
+    effective_date: Optional[str] = None,
+    max_workers: int = 4,
+    findings_index: Optional[FindingsIndex] = None,
+    job_timeout: Optional[float] = None,
+    scheduler_limits: Optional[Dict[str, int]] = None
+) -> List[Dict]:
+    """
+    Upload local scan files to a Paramify assessment concurrently.
+
+    Files are streamed from a memory map, so they are never read into
+    memory as a whole.
+
+    Args:
+        paramify_client: Client used for uploads
+        paths: Scan file paths
+        assessment_id: Paramify assessment UUID
+        effective_date: Optional effective date (YYYY-MM-DD format)
+        max_workers: Maximum number of concurrent uploads
+        findings_index: Optional findings index every file is added to
+        job_timeout: Optional time limit in seconds for each upload
+        scheduler_limits: Optional concurrency limits by endpoint
+            ('paramify' or 'paramify:<assessment UUID>')
+
+    Returns:
+        List of per-file result dicts with path, success, and either result or error
+    """
+    results = []
+    with ImportScheduler(max_workers, scheduler_limits) as scheduler:
+        futures = {
+            scheduler.submit(
+                import_local_file, paramify_client, path, assessment_id, effective_date,
+                findings_index, job_timeout, endpoints=[f"paramify:{assessment_id}"]
+            ): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results.append({'path': path, 'success': True, 'result': future.result()})
+            except Exception as e:
+                logger.warning(f"Import failed for {path}: {e}")
+                results.append({'path': path, 'success': False, 'error': str(e)})
+    return results
+
+
+class DropFolderWatcher:
+    """Imports scan files as they appear in a folder, then files them under done/ or failed/."""
+
+    def __init__(
+        self,
+        paramify_client: ParamifyClient,
+        watch_dir: str,
+        assessment_id: str,
+        effective_date: Optional[str] = None,
+        max_workers: int = 4,
+        poll_interval: float = 5,
+        stable_checks: int = 2,
+        findings_index: Optional[FindingsIndex] = None,
+        shard: Optional[Shard] = None,
+        ledger: Optional[ResultLedger] = None,
+        job_timeout: Optional[float] = None,
+        scheduler_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            paramify_client: Client used for uploads
+            watch_dir: Folder to watch (only its top level is watched)
+            assessment_id: Paramify assessment UUID
+            effective_date: Optional effective date (YYYY-MM-DD format)
+            max_workers: Maximum number of concurrent uploads
+            poll_interval: Seconds between folder scans
+            stable_checks: Number of consecutive scans a file's size and
+                modification time must stay unchanged before it is imported,
+                so files still being copied in are left alone
+            findings_index: Optional findings index every imported file is added to
+            shard: Optional shard; files owned by other shards are left for
+                their watchers (ownership is decided by file name)
+            ledger: Optional ledger every outcome is recorded in as it happens
+            job_timeout: Optional time limit in seconds for each upload
+            scheduler_limits: Optional concurrency limits by endpoint
+                ('paramify' or 'paramify:<assessment UUID>')
+        """
+        self.paramify_client = paramify_client
+        self.watch_dir = watch_dir
+        self.assessment_id = assessment_id
+        self.effective_date = effective_date
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.stable_checks = stable_checks
+        self.findings_index = findings_index
+        self.shard = shard
+        self.ledger = ledger
+        self.job_timeout = job_timeout
+        self.scheduler_limits = scheduler_limits or {}
+
+        self.done_dir = os.path.join(watch_dir, DONE_DIR)
+        self.failed_dir = os.path.join(watch_dir, FAILED_DIR)
+
+        # path -> ((size, mtime), number of scans it has been unchanged for)
+        self._candidates: Dict[str, Tuple[Tuple[int, float], int]] = {}
+        self._in_flight: Dict[Future, str] = {}
+        self.results: List[Dict] = []
+
+    def run(self, once: bool = False) -> List[Dict]:
+        """
+        Watch the folder until interrupted.
+
+        Args:
+            once: Import the files present now (waiting for them to settle)
+                and return, instead of watching forever
+
+        Returns:
+            List of per-file result dicts, as from import_local_files()
+        """
+        os.makedirs(self.done_dir, exist_ok=True)
+        os.makedirs(self.failed_dir, exist_ok=True)
+        logger.info(f"Watching {self.watch_dir} for scan files")
+
+        with ImportScheduler(self.max_workers, self.scheduler_limits) as scheduler:
+            try:
+                while True:
+                    self._collect_finished()
+                    for path in self.poll():
+                        future = scheduler.submit(
+                            import_local_file, self.paramify_client, path,
+                            self.assessment_id, self.effective_date, self.findings_index,
+                            self.job_timeout, endpoints=[f"paramify:{self.assessment_id}"]
+                        )
+                        self._in_flight[future] = path
+
+                    if once and not self._candidates and not self._in_flight:
+                        break
+                    time.sleep(self.poll_interval)
+            finally:
+                for future in as_completed(list(self._in_flight)):
+                    self._finish(future)
+
+        return self.results
+
+    def poll(self) -> List[str]:
+        """
+        Scan the folder once.
+
+        Returns:
+            Files that have just become stable and are ready to import
+        """
+        in_flight = set(self._in_flight.values())
+        seen = set()
+        ready = []
+
+        for name in sorted(os.listdir(self.watch_dir)):
+            path = os.path.join(self.watch_dir, name)
+            if path in in_flight or not os.path.isfile(path) or not is_scan_file(path):
+                continue
+            if self.shard and not self.shard.owns(file_key(path)):
+                continue
+
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime)
+            seen.add(path)
+
+            previous, unchanged = self._candidates.get(path, (None, 0))
+            unchanged = unchanged + 1 if signature == previous else 0
+            if unchanged >= self.stable_checks - 1:
+                self._candidates.pop(path, None)
+                ready.append(path)
+            else:
+                self._candidates[path] = (signature, unchanged)
+
+        # Forget files that were removed before they settled
+        for path in list(self._candidates):
+            if path not in seen:
+                del self._candidates[path]
+
+        return ready
+
+    def _collect_finished(self) -> None:
+        """File away every upload that has completed."""
+        for future in [f for f in self._in_flight if f.done()]:
+            self._finish(future)
+
+    def _finish(self, future: Future) -> None:
+        """Record an upload's result and move its file to done/ or failed/."""
+        path = self._in_flight.pop(future)
+        try:
+            result = {'path': path, 'success': True, 'result': future.result()}
+            dest_dir = self.done_dir
+            logger.info(f"Imported {path}")
+        except Exception as e:
+            logger.warning(f"Import failed for {path}: {e}")
+            result = {'path': path, 'success': False, 'error': str(e)}
+            dest_dir = self.failed_dir
+
+        result['moved_to'] = self._move(path, dest_dir)
+        self.results.append(result)
+        if self.ledger:
+            self.ledger.record_results('file', [result], lambda r: file_key(r['path']), self.assessment_id)
+
+    @staticmethod
+    def _move(path: str, dest_dir: str) -> str:
+        """Move a file into dest_dir without overwriting an earlier file of the same name."""
+        dest = os.path.join(dest_dir, os.path.basename(path))
+        if os.path.exists(dest):
+            stem, ext = os.path.splitext(os.path.basename(path))
+            dest = os.path.join(dest_dir, f"{stem}.{time.strftime('%Y%m%d-%H%M%S')}{ext}")
+        shutil.move(path, dest)
+        return dest
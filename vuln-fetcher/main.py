@@ -3,14 +3,33 @@
 Nessus to Paramify Integration CLI
 Imports Nessus scan results into Paramify assessments.
 """
+import os
 import sys
 import logging
 import argparse
-from typing import Optional, List, Dict
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple, Union, Iterator
 from config import Config
 from integration import NessusParamifyIntegration
 from github_client import GitHubClient
-from paramify_client import ParamifyClient
+from github_import import GitHubBulkImporter, parse_mapping, job_label
+from github_sync import SyncState
+from journal import JobJournal
+from local_import import collect_scan_files, import_local_files, file_key, DropFolderWatcher
+from findings_index import FindingsIndex, SEVERITY_LEVELS
+from sharding import Shard, shard_path
+from ledger import ResultLedger, merge_ledgers
+from paramify_client import ParamifyClient, ParamifyTenants
+from prefetch import Prefetch
+from fixtures import write_fixture, parse_severity_mix
+from scheduler import PriorityPolicy, parse_limits
+from consolidate import consolidate_nessus
+from deadline import Deadline
+from service import ImportService, create_server
+from output import FORMATS, RecordWriter, parse_fields, format_records_table
+from progress import PROGRESS_MODES, ProgressReporter
 
 
 def setup_logging(log_level: int = logging.INFO):
@@ -22,32 +41,214 @@ def setup_logging(log_level: int = logging.INFO):
     )
 
 
+def open_findings_index() -> Optional[FindingsIndex]:
+    """Open the findings index imports are added to, if FINDINGS_INDEX is set."""
+    return FindingsIndex(Config.FINDINGS_INDEX) if Config.FINDINGS_INDEX else None
+
+
+def parse_shard(spec: Optional[str]) -> Optional[Shard]:
+    """Parse a --shard argument, exiting with a message if it is invalid."""
+    if not spec:
+        return None
+    try:
+        return Shard.parse(spec)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+
+def open_ledger(path: Optional[str], shard: Optional[Shard]) -> Optional[ResultLedger]:
+    """Open the results ledger for a --ledger argument (one file per shard)."""
+    if not path:
+        return None
+    return ResultLedger(shard_path(path, shard), str(shard) if shard else None)
+
+
+def open_journal(path: Optional[str], shard: Optional[Shard]) -> Optional[JobJournal]:
+    """Open the job journal for a --journal argument (one file per shard)."""
+    return JobJournal(shard_path(path, shard)) if path else None
+
+
+def start_progress(mode: Optional[str]) -> Optional[ProgressReporter]:
+    """Start live transfer progress on stderr for a --progress argument ('off' or None for none)."""
+    if not mode or mode == 'off':
+        return None
+    return ProgressReporter(mode).start()
+
+
+def load_scheduling() -> Tuple[Dict[str, int], PriorityPolicy]:
+    """Read the scheduler limits and priority policy from the configuration."""
+    try:
+        return (
+            parse_limits(Config.get_scheduler_limits()),
+            PriorityPolicy(Config.get_priority_weights(), Config.get_assessment_deadlines())
+        )
+    except ValueError as e:
+        print(f"✗ Configuration error: {e}")
+        sys.exit(1)
+
+
+def require_paramify() -> None:
+    """Exit with an error unless the Paramify credentials are configured."""
+    is_valid, missing = Config.validate()
+    if not is_valid:
+        print(f"✗ Configuration error: Missing required Paramify credentials: {', '.join(missing)}")
+        sys.exit(1)
+
+
+def build_paramify_client(pool_size: int = 10) -> Union[ParamifyClient, ParamifyTenants]:
+    """Create the Paramify client, routing to named tenants when PARAMIFY_TENANTS is set."""
+    profiles = Config.get_paramify_profiles()
+    if profiles:
+        return ParamifyTenants(profiles, timeouts=Config.get_timeouts(), pool_size=pool_size)
+    return ParamifyClient(
+        api_key=Config.PARAMIFY_API_KEY,
+        base_url=Config.PARAMIFY_BASE_URL,
+        timeouts=Config.get_timeouts(),
+        pool_size=pool_size,
+        compress_uploads=Config.get_compress_uploads(),
+        attach_summary=Config.get_artifact_summary()
+    )
+
+
+def check_assessment_targets(paramify_client: Union[ParamifyClient, ParamifyTenants], targets: List[str]) -> None:
+    """Exit with an error if an assessment target names an unknown Paramify tenant."""
+    for target in targets:
+        try:
+            paramify_client.resolve(target)
+        except ValueError as e:
+            print(f"✗ {e}")
+            sys.exit(1)
+
+
+def build_integration(
+    transcode_csv: bool = False,
+    job_timeout: Optional[float] = None,
+    pool_size: int = 10,
+    scanner_timeout: Optional[float] = None
+) -> NessusParamifyIntegration:
+    """Create the integration from the current configuration."""
+    scheduler_limits, priority_policy = load_scheduling()
+    return NessusParamifyIntegration(
+        nessus_url=Config.NESSUS_URL,
+        nessus_access_key=Config.NESSUS_ACCESS_KEY,
+        nessus_secret_key=Config.NESSUS_SECRET_KEY,
+        paramify_api_key=Config.PARAMIFY_API_KEY,
+        paramify_base_url=Config.PARAMIFY_BASE_URL,
+        nessus_profiles=Config.get_nessus_profiles(),
+        paramify_profiles=Config.get_paramify_profiles(),
+        paramify_compress_uploads=Config.get_compress_uploads(),
+        paramify_attach_summary=Config.get_artifact_summary(),
+        export_registry_path=Config.NESSUS_EXPORT_REGISTRY or None,
+        transcode_csv=transcode_csv,
+        transcode_columns=Config.get_transcode_columns(),
+        findings_index=open_findings_index(),
+        timeouts=Config.get_timeouts(),
+        job_timeout=job_timeout,
+        scanner_timeout=scanner_timeout or Config.get_scanner_timeout(),
+        scheduler_limits=scheduler_limits,
+        priority_policy=priority_policy,
+        pool_size=pool_size
+    )
+
+
 def format_scan_table(scans: List[Dict]) -> None:
     """Display scans in a formatted table."""
     if not scans:
         print("No scans found.")
         return
 
-    print(f"{'#':<4} {'ID':<8} {'Name':<40} {'Status':<12}")
+    # Show which scanner each scan came from when several are configured
+    show_scanner = len({scan.get('scanner') for scan in scans}) > 1
+
+    if show_scanner:
+        print(f"{'#':<4} {'Scanner':<12} {'ID':<8} {'Name':<30} {'Status':<12}")
+    else:
+        print(f"{'#':<4} {'ID':<8} {'Name':<40} {'Status':<12}")
     print("-" * 70)
 
     for idx, scan in enumerate(scans, 1):
         scan_id = scan.get('id', 'N/A')
-        name = scan.get('name', 'Unknown')[:38]
         status = scan.get('status', 'unknown')
 
         status_icon = "✓" if status == "completed" else "●"
-        print(f"{idx:<4} {scan_id:<8} {name:<40} {status_icon} {status}")
+        if show_scanner:
+            name = scan.get('name', 'Unknown')[:28]
+            scanner = str(scan.get('scanner'))[:11]
+            print(f"{idx:<4} {scanner:<12} {scan_id:<8} {name:<30} {status_icon} {status}")
+        else:
+            name = scan.get('name', 'Unknown')[:38]
+            print(f"{idx:<4} {scan_id:<8} {name:<40} {status_icon} {status}")
 
 
-def list_scans(integration: NessusParamifyIntegration, return_scans: bool = False):
-    """List all available Nessus scans."""
+def fetch_scans(
+    integration: NessusParamifyIntegration,
+    scanner: Optional[str] = None
+) -> Tuple[List[Dict], Dict[str, str]]:
+    """Fetch scans (from every scanner unless one is given) with per-scanner errors."""
+    if scanner is None and len(integration.scanner_names) > 1:
+        return integration.list_all_nessus_scans()
+    scans = integration.list_nessus_scans(scanner)
+    for scan in scans:
+        scan['scanner'] = scanner or integration.scanner_names[0]
+    return scans, {}
+
+
+def stream_records(
+    sources: Iterator[Tuple[Optional[str], Optional[List[Dict]], Optional[str]]],
+    output_format: str,
+    fields: Optional[List[str]],
+    source_label: str
+) -> None:
+    """
+    Write listed records as NDJSON or JSON as each scanner or tenant answers.
+
+    Warnings go to stderr so stdout stays machine-readable. Exits with an
+    error only if no source answered.
+    """
+    answered = 0
+    failed = 0
+    try:
+        with RecordWriter(output_format, fields) as writer:
+            for name, records, error in sources:
+                if error:
+                    print(f"⚠ {source_label} '{name}' unavailable: {error}", file=sys.stderr)
+                    failed += 1
+                    continue
+                answered += 1
+                writer.write_all(records)
+    except Exception as e:
+        print(f"✗ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if failed and not answered:
+        sys.exit(1)
+
+
+def list_scans(
+    integration: NessusParamifyIntegration,
+    return_scans: bool = False,
+    scanner: Optional[str] = None,
+    prefetch: Optional[Prefetch] = None,
+    output_format: str = 'table',
+    fields: Optional[List[str]] = None
+):
+    """List all available Nessus scans (from every scanner unless one is given)."""
+    if output_format != 'table':
+        stream_records(integration.iter_nessus_scans(scanner), output_format, fields, 'Scanner')
+        return
+
     try:
-        scans = integration.list_nessus_scans()
+        scans, errors = prefetch.result() if prefetch else fetch_scans(integration, scanner)
     except Exception as e:
         print(f"\n✗ Error fetching scans: {e}")
         sys.exit(1)
 
+    for name, error in errors.items():
+        print(f"\n⚠ Scanner '{name}' unavailable: {error}")
+    if errors and not scans:
+        print("\n✗ Error fetching scans: no scanner responded")
+        sys.exit(1)
+
     if return_scans:
         return scans
 
@@ -55,7 +256,10 @@ def list_scans(integration: NessusParamifyIntegration, return_scans: bool = Fals
     print("  NESSUS SCANS")
     print("=" * 70 + "\n")
 
-    format_scan_table(scans)
+    if fields:
+        format_records_table(scans, fields)
+    else:
+        format_scan_table(scans)
     print()
 
 
@@ -65,7 +269,13 @@ def format_assessment_table(assessments: List[Dict]) -> None:
         print("No assessments found.")
         return
 
-    print(f"{'#':<4} {'Name':<35} {'Type':<18}")
+    # Show which tenant each assessment belongs to when several are configured
+    show_tenant = any(assessment.get('tenant') for assessment in assessments)
+
+    if show_tenant:
+        print(f"{'#':<4} {'Tenant':<12} {'Name':<35} {'Type':<18}")
+    else:
+        print(f"{'#':<4} {'Name':<35} {'Type':<18}")
     print("-" * 70)
 
     for idx, assessment in enumerate(assessments, 1):
@@ -73,13 +283,28 @@ def format_assessment_table(assessments: List[Dict]) -> None:
         assessment_type = assessment.get('type', 'UNKNOWN')
         type_display = assessment_type.replace('_', ' ').title()
 
-        print(f"{idx:<4} {name:<35} {type_display:<18}")
+        if show_tenant:
+            tenant = str(assessment.get('tenant'))[:11]
+            print(f"{idx:<4} {tenant:<12} {name:<35} {type_display:<18}")
+        else:
+            print(f"{idx:<4} {name:<35} {type_display:<18}")
+
 
+def list_assessments(
+    integration: NessusParamifyIntegration,
+    return_assessments: bool = False,
+    prefetch: Optional[Prefetch] = None,
+    tenants: Optional[List[str]] = None,
+    output_format: str = 'table',
+    fields: Optional[List[str]] = None
+):
+    """List all available Paramify assessments (from every tenant unless some are given)."""
+    if output_format != 'table':
+        stream_records(integration.iter_paramify_assessments(tenants=tenants), output_format, fields, 'Tenant')
+        return
 
-def list_assessments(integration: NessusParamifyIntegration, return_assessments: bool = False):
-    """List all available Paramify assessments."""
     try:
-        assessments = integration.list_paramify_assessments()
+        assessments = prefetch.result() if prefetch else integration.list_paramify_assessments(tenants=tenants)
     except Exception as e:
         print(f"\n✗ Error fetching assessments: {e}")
         sys.exit(1)
@@ -91,6 +316,11 @@ def list_assessments(integration: NessusParamifyIntegration, return_assessments:
     print("  PARAMIFY ASSESSMENTS")
     print("=" * 70 + "\n")
 
+    if fields:
+        format_records_table(assessments, fields)
+        print()
+        return
+
     format_assessment_table(assessments)
     print()
 
@@ -107,8 +337,12 @@ def import_scan_interactive(integration: NessusParamifyIntegration):
     print("  IMPORT NESSUS SCAN TO PARAMIFY")
     print("=" * 70 + "\n")
 
+    # Load scans and assessments together; assessments keep loading while the user picks a scan
+    scans_prefetch = Prefetch(fetch_scans, integration)
+    assessments_prefetch = Prefetch(integration.list_paramify_assessments)
+
     # Get available scans
-    scans = list_scans(integration, return_scans=True)
+    scans = list_scans(integration, return_scans=True, prefetch=scans_prefetch)
     if not scans:
         print("✗ No scans available to import.")
         sys.exit(1)
@@ -134,9 +368,12 @@ def import_scan_interactive(integration: NessusParamifyIntegration):
             # Try as scan ID
             elif choice.isdigit():
                 scan_id = int(choice)
-                selected_scan = next((s for s in scans if s['id'] == scan_id), None)
-                if selected_scan:
+                matches = [s for s in scans if s['id'] == scan_id]
+                if len(matches) == 1:
+                    selected_scan = matches[0]
                     break
+                elif matches:
+                    print(f"✗ Scan ID {scan_id} exists on several scanners. Please enter its # instead.")
                 else:
                     print(f"✗ Scan ID {scan_id} not found. Please try again.")
             else:
@@ -146,7 +383,7 @@ def import_scan_interactive(integration: NessusParamifyIntegration):
             sys.exit(0)
 
     # Get available assessments
-    assessments = list_assessments(integration, return_assessments=True)
+    assessments = list_assessments(integration, return_assessments=True, prefetch=assessments_prefetch)
     if not assessments:
         print("✗ No assessments available.")
         sys.exit(1)
@@ -156,20 +393,22 @@ def import_scan_interactive(integration: NessusParamifyIntegration):
     print("=" * 70 + "\n")
     format_assessment_table(assessments)
 
-    # Let user select assessment
+    # Let user select one or more assessments
     while True:
         try:
-            choice = input("\nEnter the # of the assessment (or 'q' to quit): ").strip()
+            choice = input("\nEnter the # of the assessment, or several separated by commas (or 'q' to quit): ").strip()
             if choice.lower() == 'q':
                 print("Cancelled.")
                 sys.exit(0)
 
-            if choice.isdigit() and 1 <= int(choice) <= len(assessments):
-                assessment_id = assessments[int(choice) - 1]['id']
-                selected_assessment = assessments[int(choice) - 1]
+            picks = [c.strip() for c in choice.split(',') if c.strip()]
+            if picks and all(c.isdigit() and 1 <= int(c) <= len(assessments) for c in picks):
+                selected_assessments = [assessments[int(c) - 1] for c in dict.fromkeys(picks)]
+                assessment_id = selected_assessments[0]['id']
+                selected_assessment = selected_assessments[0]
                 break
             else:
-                print(f"✗ Invalid choice. Please enter a number between 1 and {len(assessments)}.")
+                print(f"✗ Invalid choice. Please enter numbers between 1 and {len(assessments)}.")
         except (ValueError, KeyboardInterrupt):
             print("\nCancelled.")
             sys.exit(0)
@@ -183,7 +422,11 @@ def import_scan_interactive(integration: NessusParamifyIntegration):
     print("  IMPORT SUMMARY")
     print("=" * 70)
     print(f"\n  Scan:       {selected_scan.get('name')} (ID: {scan_id})")
-    print(f"  Assessment: {selected_assessment.get('name')}")
+    if len(integration.scanner_names) > 1:
+        print(f"  Scanner:    {selected_scan.get('scanner')}")
+    for idx, assessment in enumerate(selected_assessments):
+        label = "Assessment:" if idx == 0 else ""
+        print(f"  {label:<11} {assessment.get('name')}")
     print(f"  Date:       {effective_date if effective_date else 'Today'}\n")
 
     # Confirm
@@ -192,13 +435,25 @@ def import_scan_interactive(integration: NessusParamifyIntegration):
         print("Cancelled.")
         sys.exit(0)
 
+    if len(selected_assessments) > 1:
+        import_scan_multi(
+            integration,
+            scan_id,
+            [a['id'] for a in selected_assessments],
+            effective_date,
+            selected_scan.get('scanner'),
+            assessment_names={a['id']: a.get('name') for a in selected_assessments}
+        )
+        return
+
     print("\n⏳ Importing scan...")
 
     try:
         result = integration.import_scan_to_assessment(
             scan_id=scan_id,
             assessment_id=assessment_id,
-            effective_date=effective_date
+            effective_date=effective_date,
+            scanner=selected_scan.get('scanner')
         )
 
         print("\n" + "=" * 70)
@@ -226,6 +481,10 @@ def import_from_github_interactive():
     print("  IMPORT FROM GITHUB REPOSITORY")
     print("=" * 70 + "\n")
 
+    # Assessments load while the user types in the repository and picks a file
+    paramify_client = build_paramify_client()
+    assessments_prefetch = Prefetch(paramify_client.list_assessments)
+
     # Get GitHub repo URL or details
     print("Enter GitHub repository information:")
     repo_input = input("  Repository (owner/repo or full URL): ").strip()
@@ -265,20 +524,10 @@ def import_from_github_interactive():
         if ref_input:
             ref = ref_input
 
-    github_client = GitHubClient(token=token)
+    github_client = GitHubClient(token=token, timeouts=Config.get_timeouts())
 
     print(f"\n⏳ Searching for scan files (.nessus, .csv) in {owner}/{repo}...")
 
-    try:
-        scan_files = github_client.find_scan_files(owner, repo, path, ref)
-    except Exception as e:
-        print(f"\n✗ Error accessing repository: {e}")
-        sys.exit(1)
-
-    if not scan_files:
-        print(f"✗ No scan files (.nessus or .csv) found in {owner}/{repo}")
-        sys.exit(1)
-
     print("\n" + "=" * 70)
     print("  SELECT SCAN FILE")
     print("=" * 70 + "\n")
@@ -286,11 +535,25 @@ def import_from_github_interactive():
     print(f"{'#':<4} {'File':<45} {'Type':<8} {'Size':<10}")
     print("-" * 70)
 
-    for idx, file in enumerate(scan_files, 1):
+    # Show each file as soon as it is found rather than after the whole search
+    found = []
+
+    def show_file(file: Dict) -> None:
+        found.append(file)
         name = file['path'][-43:] if len(file['path']) > 43 else file['path']
         size_kb = file['size'] / 1024
         file_type = file.get('type', 'unknown').upper()
-        print(f"{idx:<4} {name:<45} {file_type:<8} {size_kb:>6.1f} KB")
+        print(f"{len(found):<4} {name:<45} {file_type:<8} {size_kb:>6.1f} KB", flush=True)
+
+    try:
+        scan_files = github_client.find_scan_files(owner, repo, path, ref, on_file=show_file)
+    except Exception as e:
+        print(f"\n✗ Error accessing repository: {e}")
+        sys.exit(1)
+
+    if not scan_files:
+        print(f"✗ No scan files (.nessus or .csv) found in {owner}/{repo}")
+        sys.exit(1)
 
     # Let user select file
     while True:
@@ -310,13 +573,8 @@ def import_from_github_interactive():
             sys.exit(0)
 
     # Get available assessments
-    paramify_client = ParamifyClient(
-        api_key=Config.PARAMIFY_API_KEY,
-        base_url=Config.PARAMIFY_BASE_URL
-    )
-
     try:
-        assessments = paramify_client.list_assessments()
+        assessments = assessments_prefetch.result()
     except Exception as e:
         print(f"\n✗ Error fetching assessments: {e}")
         sys.exit(1)
@@ -375,6 +633,18 @@ def import_from_github_interactive():
         filename = selected_file['name']
 
         print(f"✓ Downloaded {len(file_content)} bytes")
+
+        findings_index = open_findings_index()
+        if findings_index:
+            try:
+                findings_index.index_bytes(
+                    file_content, filename,
+                    origin=f"github:{owner}/{repo}@{ref}:{selected_file['path']}",
+                    effective_date=effective_date
+                )
+            except Exception as e:
+                print(f"⚠ Could not add file to findings index: {e}")
+
         print("⏳ Uploading to Paramify...")
 
         # Upload to Paramify
@@ -404,6 +674,526 @@ def import_from_github_interactive():
         sys.exit(1)
 
 
+def import_from_github_batch(
+    repos: List[str],
+    patterns: List[str],
+    mapping_entries: List[str],
+    default_assessment_id: Optional[str] = None,
+    effective_date: Optional[str] = None,
+    token: Optional[str] = None,
+    max_workers: int = 4,
+    dry_run: bool = False,
+    archive: bool = False,
+    journal: Optional[JobJournal] = None,
+    transcode_csv: bool = False,
+    shard: Optional[Shard] = None,
+    ledger: Optional[ResultLedger] = None,
+    job_timeout: Optional[float] = None,
+    history: Optional[List[str]] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    sync_state: Optional[SyncState] = None
+):
+    """
+    Import every matching scan file from one or more GitHub repositories (non-interactive).
+
+    With history paths, every distinct version of those files in the
+    repositories' commit history is imported instead, each with its commit
+    date as the effective date. With a sync state, only the files added or
+    modified since each repository's last sync are imported.
+    """
+    try:
+        mapping = parse_mapping(mapping_entries)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    if history and (patterns or archive or effective_date):
+        print("✗ --history cannot be combined with --glob, --archive or --effective-date")
+        sys.exit(1)
+    if (since or until) and not history:
+        print("✗ --since and --until need --history")
+        sys.exit(1)
+    if history and sync_state:
+        print("✗ --history cannot be combined with --sync")
+        sys.exit(1)
+
+    if not mapping and not default_assessment_id:
+        print("✗ Provide --assessment-id and/or at least one --map GLOB=ASSESSMENT_ID")
+        sys.exit(1)
+
+    paramify_client = build_paramify_client()
+    check_assessment_targets(paramify_client, [
+        target.strip()
+        for value in [default_assessment_id or '', *(a for _, a in mapping)]
+        for target in value.split(',') if target.strip()
+    ])
+    scheduler_limits, priority_policy = load_scheduling()
+
+    importer = GitHubBulkImporter(
+        github_client=GitHubClient(token=token, timeouts=Config.get_timeouts()),
+        paramify_client=paramify_client,
+        max_workers=max_workers,
+        archive=archive,
+        journal=journal,
+        transcode_csv=transcode_csv,
+        transcode_columns=Config.get_transcode_columns(),
+        findings_index=open_findings_index(),
+        shard=shard,
+        job_timeout=job_timeout,
+        scheduler_limits=scheduler_limits,
+        priority_policy=priority_policy
+    )
+
+    try:
+        _run_github_batch(importer, repos, patterns, mapping, default_assessment_id,
+                          effective_date, max_workers, dry_run, ledger, history, since, until, sync_state)
+    finally:
+        importer.close()
+
+
+def _run_github_batch(
+    importer: GitHubBulkImporter,
+    repos: List[str],
+    patterns: List[str],
+    mapping: List,
+    default_assessment_id: Optional[str],
+    effective_date: Optional[str],
+    max_workers: int,
+    dry_run: bool,
+    ledger: Optional[ResultLedger] = None,
+    history: Optional[List[str]] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    sync_state: Optional[SyncState] = None
+):
+    """Discover, plan, and run a GitHub bulk import."""
+    heads = {}
+    if history:
+        print(f"\n⏳ Reading the history of {len(history)} paths in {len(repos)} repositories...")
+    elif sync_state:
+        print(f"\n⏳ Checking {len(repos)} repositories for changes since the last sync...")
+    elif importer.archive:
+        print(f"\n⏳ Downloading archives of {len(repos)} repositories...")
+    else:
+        print(f"\n⏳ Searching {len(repos)} repositories for scan files...")
+
+    try:
+        if history:
+            files = importer.discover_history(repos, history, since, until)
+        elif sync_state:
+            files, heads = importer.discover_changes(repos, patterns, sync_state)
+        else:
+            files = importer.discover(repos, patterns)
+    except Exception as e:
+        print(f"\n✗ Error accessing repositories: {e}")
+        sys.exit(1)
+
+    jobs, unmapped = importer.plan(files, mapping, default_assessment_id)
+    found = 'distinct file versions' if history else 'changed files' if sync_state else 'matching files'
+    print(f"✓ Found {len(files)} {found}, {len(jobs)} mapped to an assessment")
+    if importer.shard:
+        print(f"  Shard {importer.shard} owns {len(jobs) + len(unmapped)} of them")
+    for file in unmapped:
+        print(f"  ⚠ No assessment mapping for {job_label(file)}")
+
+    if not jobs and importer.shard and files and not unmapped:
+        # Another shard owns every file; that is not an error
+        print("Nothing for this shard to import.")
+        if not dry_run:
+            save_sync_state(sync_state, heads, [])
+        return
+    if not jobs and sync_state and not unmapped:
+        print("Nothing changed since the last sync.")
+        if not dry_run:
+            save_sync_state(sync_state, heads, [])
+        return
+    if not jobs:
+        print("✗ Nothing to import.")
+        sys.exit(1)
+
+    if dry_run:
+        print(f"\n{'File':<50} {'Assessment':<20}")
+        print("-" * 70)
+        for job in jobs:
+            name = job_label(job).split('/', 1)[1][-48:]
+            if history:
+                name = f"{name[-37:]} {job['effective_date']}"
+            print(f"{name:<50} {job['assessment_id']}")
+        print()
+        return
+
+    print(f"⏳ Importing {len(jobs)} files ({max_workers} at a time)...")
+    results = importer.run(jobs, effective_date)
+    if ledger:
+        ledger.record_results('github', results, importer.item_key)
+    save_sync_state(sync_state, heads, results)
+
+    succeeded = [r for r in results if r['success']]
+    print("\n" + "=" * 70)
+    print(f"  IMPORT RESULTS: {len(succeeded)} of {len(results)} succeeded")
+    print("=" * 70 + "\n")
+
+    print(f"{'File':<45} {'Result':<25}")
+    print("-" * 70)
+    for r in sorted(results, key=lambda r: (r['owner'], r['repo'], r['path'], r.get('effective_date', ''))):
+        name = job_label(r).split('/', 1)[1][-43:]
+        if r['success']:
+            artifacts = r['result'].get('artifacts') or [{}]
+            outcome = f"✓ {artifacts[0].get('id', 'uploaded')}"
+        else:
+            outcome = f"✗ {r['error']}"
+        print(f"{name:<45} {outcome}")
+    print()
+    print_transcode_summary([r['result'].get('transcode') for r in succeeded])
+
+    if len(succeeded) != len(results):
+        sys.exit(1)
+
+
+def save_sync_state(sync_state: Optional[SyncState], heads: Dict[str, str], results: List[Dict]) -> None:
+    """
+    Record the synced head commit of every repository whose imports all succeeded.
+
+    A repository with a failed import keeps its previous commit, so the
+    next sync compares from there again and retries the failed files.
+    """
+    if not sync_state:
+        return
+    failed = {r['sync_key'] for r in results if not r['success']}
+    for key, head in heads.items():
+        if key in failed:
+            print(f"  ⚠ {key} stays at its last synced commit; failed files are retried next sync")
+        else:
+            sync_state.update(key, head)
+    sync_state.save()
+
+
+def print_transcode_summary(stats: List[Optional[Dict]]) -> None:
+    """Display the total size reduction of files transcoded to CSV, if any."""
+    stats = [s for s in stats if s]
+    if not stats:
+        return
+
+    input_bytes = sum(s['input_bytes'] for s in stats)
+    output_bytes = sum(s['output_bytes'] for s in stats)
+    ratio = input_bytes / output_bytes if output_bytes else 0
+    print(f"  Transcoded {len(stats)} file(s) to CSV: {format_size(input_bytes)} → "
+          f"{format_size(output_bytes)} ({ratio:.1f}x smaller)")
+    print()
+
+
+def format_scan_summary(summary: Dict) -> str:
+    """Describe a scan summary in one line, e.g. '42 on 3 hosts (2 critical, 5 high, ...)'."""
+    counts = ', '.join(f"{count} {severity}" for severity, count in summary['severity'].items() if count)
+    text = f"{summary['findings']} on {summary['hosts']} hosts" + (f" ({counts})" if counts else '')
+    if summary.get('scan_start') and summary.get('scan_end'):
+        text += f", scanned {summary['scan_start'][:16]} to {summary['scan_end'][:16]}"
+    return text
+
+
+def format_size(num_bytes: int) -> str:
+    """Format a byte count as KB, MB or GB."""
+    size = num_bytes / 1024
+    for unit in ('KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def print_file_results(results: List[Dict]) -> None:
+    """Display per-file results of a local import."""
+    succeeded = [r for r in results if r['success']]
+    print("\n" + "=" * 70)
+    print(f"  IMPORT RESULTS: {len(succeeded)} of {len(results)} succeeded")
+    print("=" * 70 + "\n")
+
+    print(f"{'File':<45} {'Result':<25}")
+    print("-" * 70)
+    for r in sorted(results, key=lambda r: r['path']):
+        name = r['path'][-43:]
+        if r['success']:
+            artifacts = r['result'].get('artifacts') or [{}]
+            outcome = f"✓ {artifacts[0].get('id', 'uploaded')}"
+        else:
+            outcome = f"✗ {r['error']}"
+        print(f"{name:<45} {outcome}")
+    print()
+
+
+def import_files(
+    paths: List[str],
+    assessment_id: str,
+    effective_date: Optional[str] = None,
+    max_workers: int = 4,
+    shard: Optional[Shard] = None,
+    ledger: Optional[ResultLedger] = None,
+    job_timeout: Optional[float] = None
+):
+    """Import local .nessus/.csv files into a Paramify assessment (non-interactive)."""
+    try:
+        files = collect_scan_files(paths)
+    except FileNotFoundError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    if shard:
+        owned = [path for path in files if shard.owns(file_key(path))]
+        print(f"Shard {shard} owns {len(owned)} of {len(files)} files")
+        if files and not owned:
+            return
+        files = owned
+
+    if not files:
+        print("✗ No scan files (.nessus or .csv) found.")
+        sys.exit(1)
+
+    paramify_client = build_paramify_client()
+    check_assessment_targets(paramify_client, [assessment_id])
+
+    print(f"\n⏳ Importing {len(files)} files ({max_workers} at a time)...")
+    results = import_local_files(
+        paramify_client, files, assessment_id, effective_date, max_workers, open_findings_index(),
+        job_timeout, load_scheduling()[0]
+    )
+    if ledger:
+        ledger.record_results('file', results, lambda r: file_key(r['path']), assessment_id)
+    print_file_results(results)
+
+    if any(not r['success'] for r in results):
+        sys.exit(1)
+
+
+def watch_dir(
+    directory: str,
+    assessment_id: str,
+    effective_date: Optional[str] = None,
+    max_workers: int = 4,
+    poll_interval: float = 5,
+    once: bool = False,
+    shard: Optional[Shard] = None,
+    ledger: Optional[ResultLedger] = None,
+    job_timeout: Optional[float] = None
+):
+    """Import scan files as they are dropped into a folder."""
+    if not os.path.isdir(directory):
+        print(f"✗ Not a directory: {directory}")
+        sys.exit(1)
+
+    paramify_client = build_paramify_client()
+    check_assessment_targets(paramify_client, [assessment_id])
+
+    watcher = DropFolderWatcher(
+        paramify_client=paramify_client,
+        watch_dir=directory,
+        assessment_id=assessment_id,
+        effective_date=effective_date,
+        max_workers=max_workers,
+        poll_interval=poll_interval,
+        findings_index=open_findings_index(),
+        shard=shard,
+        ledger=ledger,
+        job_timeout=job_timeout,
+        scheduler_limits=load_scheduling()[0]
+    )
+
+    print(f"\n👀 Watching {directory} for .nessus/.csv files (Ctrl+C to stop)...")
+    print(f"   Imported files move to {watcher.done_dir}, failures to {watcher.failed_dir}")
+    if shard:
+        print(f"   Shard {shard}: files owned by other shards are left for their watchers")
+
+    try:
+        results = watcher.run(once=once)
+    except KeyboardInterrupt:
+        results = watcher.results
+        print("\nStopped.")
+
+    print_file_results(results)
+
+    if once and any(not r['success'] for r in results):
+        sys.exit(1)
+
+
+def index_files(paths: List[str], index_path: str, effective_date: Optional[str] = None):
+    """Add local .nessus/.csv files to the findings index."""
+    try:
+        files = collect_scan_files(paths)
+    except FileNotFoundError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    if not files:
+        print("✗ No scan files (.nessus or .csv) found.")
+        sys.exit(1)
+
+    findings_index = FindingsIndex(index_path)
+    print(f"\n⏳ Indexing {len(files)} files into {index_path}...")
+
+    failed = 0
+    for path in files:
+        try:
+            result = findings_index.index_file(
+                path, origin=f"file:{os.path.abspath(path)}", effective_date=effective_date
+            )
+        except Exception as e:
+            failed += 1
+            print(f"  ✗ {path}: {e}")
+            continue
+        note = "already indexed" if result['skipped'] else f"{result['findings']} findings"
+        print(f"  ✓ {path}: {note}")
+
+    stats = findings_index.stats()
+    findings_index.close()
+    print(f"\n✓ Index holds {stats['findings']} findings from {stats['sources']} files "
+          f"({stats['hosts']} hosts, {stats['cves']} CVEs)\n")
+
+    if failed:
+        sys.exit(1)
+
+
+def query_findings(
+    index_path: str,
+    host: Optional[str] = None,
+    cve: Optional[str] = None,
+    plugin_id: Optional[int] = None,
+    min_severity: Optional[int] = None,
+    scan: Optional[str] = None,
+    limit: Optional[int] = 100
+):
+    """Search the findings index and display matching findings."""
+    if not os.path.exists(index_path):
+        print(f"✗ Findings index not found: {index_path}")
+        print("  Run 'index' first, or set FINDINGS_INDEX so imports are indexed automatically")
+        sys.exit(1)
+
+    findings_index = FindingsIndex(index_path)
+    started = time.perf_counter()
+    findings = findings_index.query(
+        host=host, cve=cve, plugin_id=plugin_id, min_severity=min_severity, scan=scan, limit=limit
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    findings_index.close()
+
+    if not findings:
+        print(f"No matching findings ({elapsed_ms:.1f} ms).")
+        return
+
+    severity_names = ['Info', 'Low', 'Medium', 'High', 'Critical']
+    print(f"\n{'Host':<18} {'Port':<6} {'Plugin':<8} {'CVE':<16} {'Sev':<9} {'Date':<11} {'Scan':<20}")
+    print("-" * 92)
+    for f in findings:
+        severity = f['severity']
+        severity = severity_names[severity] if severity is not None and 0 <= severity < 5 else '-'
+        print(f"{str(f['host'])[:17]:<18} {str(f['port'] if f['port'] is not None else '-'):<6} "
+              f"{str(f['plugin_id'] or '-'):<8} {str(f['cve'] or '-'):<16} {severity:<9} "
+              f"{str(f['effective_date'] or '-')[:10]:<11} {str(f['scan'] or '-')[:20]}")
+
+    more = " (limit reached, use --limit to see more)" if limit and len(findings) == limit else ""
+    print(f"\n{len(findings)} findings in {elapsed_ms:.1f} ms{more}\n")
+
+
+def generate_fixture(
+    path: str,
+    hosts: int,
+    findings_per_host: int,
+    severity_mix: Optional[str] = None,
+    seed: int = 0,
+    format: Optional[str] = None
+):
+    """Write a synthetic .nessus/.csv scan file for load and memory testing."""
+    try:
+        mix = parse_severity_mix(severity_mix) if severity_mix else None
+        print(f"\n⏳ Generating {hosts} hosts × {findings_per_host} findings into {path}...")
+        stats = write_fixture(path, hosts, findings_per_host, mix, seed, format)
+    except (ValueError, OSError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    rate = stats['bytes'] / stats['seconds'] if stats['seconds'] else 0
+    print(f"✓ Wrote {format_size(stats['bytes'])} ({stats['findings']} findings, {stats['format']}) "
+          f"in {stats['seconds']}s ({format_size(rate)}/s)")
+
+
+def report_ledgers(paths: List[str]):
+    """Merge results ledgers (e.g. one per shard) and summarize them."""
+    entries = merge_ledgers(paths)
+    if not entries:
+        print("No ledger entries found.")
+        return
+
+    by_shard: Dict[str, List[int]] = {}
+    for entry in entries:
+        counts = by_shard.setdefault(entry.get('shard') or '-', [0, 0])
+        counts[0 if entry['success'] else 1] += 1
+
+    print(f"\n{'Shard':<10} {'Succeeded':>10} {'Failed':>8}")
+    print("-" * 30)
+    for shard, (ok, failed) in sorted(by_shard.items()):
+        print(f"{shard:<10} {ok:>10} {failed:>8}")
+    print("-" * 30)
+    total_failed = sum(counts[1] for counts in by_shard.values())
+    print(f"{'Total':<10} {len(entries) - total_failed:>10} {total_failed:>8}")
+
+    failures = [e for e in entries if not e['success']]
+    if failures:
+        print(f"\n{'Item':<40} {'Shard':<7} {'Error':<30}")
+        print("-" * 78)
+        for e in failures:
+            print(f"{str(e['item'])[-39:]:<40} {str(e.get('shard') or '-'):<7} {str(e.get('error'))[:30]}")
+    print()
+
+
+def serve(
+    host: str,
+    port: int,
+    max_workers: int = 4,
+    journal: Optional[JobJournal] = None,
+    ledger: Optional[ResultLedger] = None,
+    job_timeout: Optional[float] = None,
+    transcode_csv: bool = False,
+    listing_ttl: float = 60,
+    scanner_timeout: Optional[float] = None,
+    file_root: Optional[str] = None
+):
+    """Run the import service and its HTTP API until interrupted."""
+    nessus_enabled, _ = Config.validate_nessus()
+    # Enough keep-alive connections per server for every worker plus the listings
+    pool_size = max_workers + 2
+    integration = build_integration(transcode_csv, job_timeout, pool_size, scanner_timeout)
+    github_client = GitHubClient(
+        token=Config.GITHUB_TOKEN or None, timeouts=Config.get_timeouts(), pool_size=pool_size
+    )
+    service = ImportService(
+        integration, github_client, max_workers, nessus_enabled, journal, ledger, listing_ttl,
+        file_root=file_root
+    )
+    try:
+        server = create_server(service, host, port, Config.SERVICE_TOKEN or None)
+    except OSError as e:
+        service.close()
+        print(f"✗ Cannot listen on {host}:{port}: {e}")
+        sys.exit(1)
+
+    logging.getLogger().setLevel(Config.get_log_level())
+    bound_host, bound_port = server.server_address[:2]
+    print(f"\n🚀 Serving the import API on http://{bound_host}:{bound_port} ({max_workers} workers, Ctrl+C to stop)")
+    if not nessus_enabled:
+        print("   Nessus is not configured: Nessus jobs are refused")
+    if not file_root:
+        print("   File jobs are disabled: pass --file-root to accept them")
+    if not Config.SERVICE_TOKEN and host not in ('127.0.0.1', 'localhost', '::1'):
+        print("   ⚠ SERVICE_TOKEN is not set: anyone who can reach this address can submit imports")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping: queued jobs are cancelled, running jobs are stopped...")
+    finally:
+        server.server_close()
+        service.close()
+
+
 def unified_menu():
     """Unified menu for all import options."""
     print("\n" + "=" * 70)
@@ -438,21 +1228,13 @@ def unified_menu():
                         print(f"  - {key}")
                     sys.exit(1)
 
-                integration = NessusParamifyIntegration(
-                    nessus_url=Config.NESSUS_URL,
-                    nessus_access_key=Config.NESSUS_ACCESS_KEY,
-                    nessus_secret_key=Config.NESSUS_SECRET_KEY,
-                    paramify_api_key=Config.PARAMIFY_API_KEY,
-                    paramify_base_url=Config.PARAMIFY_BASE_URL
-                )
+                integration = build_integration()
                 import_scan_interactive(integration)
                 break
 
             elif choice == '2':
                 # Only need Paramify credentials for GitHub import
-                if not Config.PARAMIFY_API_KEY:
-                    print("✗ Configuration error: PARAMIFY_API_KEY is required")
-                    sys.exit(1)
+                require_paramify()
                 import_from_github_interactive()
                 break
 
@@ -465,13 +1247,7 @@ def unified_menu():
                         print(f"  - {key}")
                     sys.exit(1)
 
-                integration = NessusParamifyIntegration(
-                    nessus_url=Config.NESSUS_URL,
-                    nessus_access_key=Config.NESSUS_ACCESS_KEY,
-                    nessus_secret_key=Config.NESSUS_SECRET_KEY,
-                    paramify_api_key=Config.PARAMIFY_API_KEY,
-                    paramify_base_url=Config.PARAMIFY_BASE_URL
-                )
+                integration = build_integration()
                 list_scans(integration)
                 # Return to menu after listing
                 input("\nPress Enter to return to the main menu...")
@@ -485,13 +1261,7 @@ def unified_menu():
                     print("\nPlease set PARAMIFY_API_KEY in your .env file")
                     sys.exit(1)
 
-                integration = NessusParamifyIntegration(
-                    nessus_url=Config.NESSUS_URL,
-                    nessus_access_key=Config.NESSUS_ACCESS_KEY,
-                    nessus_secret_key=Config.NESSUS_SECRET_KEY,
-                    paramify_api_key=Config.PARAMIFY_API_KEY,
-                    paramify_base_url=Config.PARAMIFY_BASE_URL
-                )
+                integration = build_integration()
                 list_assessments(integration)
                 # Return to menu after listing
                 input("\nPress Enter to return to the main menu...")
@@ -514,7 +1284,9 @@ def import_scan(
     integration: NessusParamifyIntegration,
     scan_id: int,
     assessment_id: str,
-    effective_date: Optional[str] = None
+    effective_date: Optional[str] = None,
+    scanner: Optional[str] = None,
+    journal: Optional[JobJournal] = None
 ):
     """Import a Nessus scan into a Paramify assessment (non-interactive)."""
     print("\n⏳ Importing scan...")
@@ -523,7 +1295,9 @@ def import_scan(
         result = integration.import_scan_to_assessment(
             scan_id=scan_id,
             assessment_id=assessment_id,
-            effective_date=effective_date
+            effective_date=effective_date,
+            scanner=scanner,
+            journal=journal
         )
 
         print("\n" + "=" * 70)
@@ -535,7 +1309,10 @@ def import_scan(
             print(f"\n  Artifact ID:   {artifact.get('id')}")
             print(f"  File:          {artifact.get('originalFileName')}")
             print(f"  Effective:     {artifact.get('effectiveDate', 'N/A')[:10]}")
+        if result.get('summary'):
+            print(f"  Findings:      {format_scan_summary(result['summary'])}")
         print()
+        print_transcode_summary([result.get('transcode')])
 
     except Exception as e:
         print("\n" + "=" * 70)
@@ -545,6 +1322,281 @@ def import_scan(
         sys.exit(1)
 
 
+def import_scan_multi(
+    integration: NessusParamifyIntegration,
+    scan_id: int,
+    assessment_ids: List[str],
+    effective_date: Optional[str] = None,
+    scanner: Optional[str] = None,
+    journal: Optional[JobJournal] = None,
+    assessment_names: Optional[Dict[str, str]] = None
+):
+    """Import one Nessus scan into several Paramify assessments (export once, upload in parallel)."""
+    print(f"\n⏳ Importing scan into {len(set(assessment_ids))} assessments...")
+
+    try:
+        results = integration.import_scan_to_assessments(
+            scan_id=scan_id,
+            assessment_ids=assessment_ids,
+            effective_date=effective_date,
+            scanner=scanner,
+            journal=journal
+        )
+    except Exception as e:
+        print("\n" + "=" * 70)
+        print("  ✗ IMPORT FAILED")
+        print("=" * 70)
+        print(f"\n  Error: {e}\n")
+        sys.exit(1)
+
+    print_assessment_results(results, assessment_names)
+
+    if any(not r['success'] for r in results):
+        sys.exit(1)
+
+
+def print_assessment_results(results: List[Dict], assessment_names: Optional[Dict[str, str]] = None) -> None:
+    """Display per-assessment results of uploading one file to several assessments."""
+    succeeded = [r for r in results if r['success']]
+    print("\n" + "=" * 70)
+    print(f"  IMPORT RESULTS: {len(succeeded)} of {len(results)} assessments succeeded")
+    print("=" * 70 + "\n")
+
+    print(f"{'Assessment':<40} {'Result':<28}")
+    print("-" * 70)
+    for r in results:
+        name = str((assessment_names or {}).get(r['assessment_id']) or r['assessment_id'])[:38]
+        if r['success']:
+            artifacts = r['result'].get('artifacts') or [{}]
+            outcome = f"✓ {artifacts[0].get('id', 'uploaded')}"
+        else:
+            outcome = f"✗ {r['error']}"
+        print(f"{name:<40} {outcome}")
+    print()
+    # Every assessment received the same transcoded file
+    print_transcode_summary([r['result'].get('transcode') for r in succeeded][:1])
+
+
+def import_folder(
+    integration: NessusParamifyIntegration,
+    folder: str,
+    assessment_id: str,
+    effective_date: Optional[str] = None,
+    max_workers: int = 4,
+    scanner: Optional[str] = None,
+    journal: Optional[JobJournal] = None,
+    shard: Optional[Shard] = None,
+    ledger: Optional[ResultLedger] = None
+):
+    """Import every completed scan in a Nessus folder (non-interactive)."""
+    shard_note = f" (shard {shard})" if shard else ""
+    print(f"\n⏳ Importing all completed scans in folder '{folder}'{shard_note}...")
+
+    try:
+        if scanner is None and len(integration.scanner_names) > 1:
+            results = integration.import_folder_from_all_scanners(
+                folder=folder,
+                assessment_id=assessment_id,
+                effective_date=effective_date,
+                max_workers=max_workers,
+                journal=journal,
+                shard=shard
+            )
+        else:
+            results = integration.import_folder_to_assessment(
+                folder=folder,
+                assessment_id=assessment_id,
+                effective_date=effective_date,
+                max_workers=max_workers,
+                scanner=scanner,
+                journal=journal,
+                shard=shard
+            )
+    except Exception as e:
+        print("\n" + "=" * 70)
+        print("  ✗ IMPORT FAILED")
+        print("=" * 70)
+        print(f"\n  Error: {e}\n")
+        sys.exit(1)
+
+    if ledger:
+        ledger.record_results(
+            'nessus', results, lambda r: integration.scan_key(r['scanner'], r['scan_id']), assessment_id
+        )
+    print_import_results(results)
+
+    if any(not r['success'] for r in results):
+        sys.exit(1)
+
+
+def import_folder_consolidated(
+    integration: NessusParamifyIntegration,
+    folder: str,
+    assessment_ids: List[str],
+    effective_date: Optional[str] = None,
+    max_workers: int = 4,
+    scanner: Optional[str] = None,
+    ledger: Optional[ResultLedger] = None
+):
+    """Merge every completed scan in a Nessus folder and upload the result once per assessment (non-interactive)."""
+    print(f"\n⏳ Consolidating all completed scans in folder '{folder}' into one upload...")
+
+    try:
+        outcome = integration.import_folder_consolidated(
+            folder=folder,
+            assessment_ids=assessment_ids,
+            effective_date=effective_date,
+            max_workers=max_workers,
+            scanners=[scanner] if scanner else None
+        )
+    except Exception as e:
+        print("\n" + "=" * 70)
+        print("  ✗ IMPORT FAILED")
+        print("=" * 70)
+        print(f"\n  Error: {e}\n")
+        sys.exit(1)
+
+    # Every merged scan went into the same artifact of an assessment (none succeeded where the upload failed)
+    per_target = {}
+    for upload in outcome['uploads']:
+        artifacts = {'artifacts': (upload.get('result') or {}).get('artifacts')}
+        per_target[upload['assessment_id']] = [
+            {**r, 'result': artifacts} if r['success'] and upload['success']
+            else {**r, 'success': False, 'error': r.get('error') or upload['error']}
+            for r in outcome['scans']
+        ]
+        if ledger:
+            ledger.record_results(
+                'nessus', per_target[upload['assessment_id']],
+                lambda r: integration.scan_key(r['scanner'], r['scan_id']), upload['assessment_id']
+            )
+
+    if len(outcome['uploads']) == 1:
+        results = per_target[outcome['uploads'][0]['assessment_id']]
+    else:
+        merged = {'artifacts': [{'id': 'merged'}]}
+        results = [{**r, 'result': merged} if r['success'] else r for r in outcome['scans']]
+    print_import_results(results)
+    if outcome['consolidate']:
+        print_consolidate_summary(outcome['consolidate'])
+        if len(outcome['uploads']) == 1:
+            print_transcode_summary([(outcome['uploads'][0].get('result') or {}).get('transcode')])
+        else:
+            print_assessment_results(outcome['uploads'])
+
+    if any(not r['success'] for r in results) or any(not u['success'] for u in outcome['uploads']):
+        sys.exit(1)
+
+
+def consolidate_files(
+    paths: List[str],
+    output: Optional[str] = None,
+    report_name: Optional[str] = None,
+    assessment_ids: Optional[List[str]] = None,
+    effective_date: Optional[str] = None,
+    job_timeout: Optional[float] = None
+):
+    """Merge local .nessus files into one, optionally uploading it to one or more assessments."""
+    try:
+        files = [path for path in collect_scan_files(paths) if path.lower().endswith('.nessus')]
+    except FileNotFoundError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    if not files:
+        print("✗ No .nessus files found.")
+        sys.exit(1)
+
+    # Without --output the merged file only lives until it is uploaded
+    dest_path = output
+    if not dest_path:
+        fd, dest_path = tempfile.mkstemp(suffix='.nessus')
+        os.close(fd)
+
+    try:
+        print(f"\n⏳ Consolidating {len(files)} .nessus files...")
+        try:
+            stats = consolidate_nessus(files, dest_path, report_name)
+        except Exception as e:
+            print(f"✗ Consolidation failed: {e}")
+            sys.exit(1)
+        print_consolidate_summary(stats)
+        if output:
+            print(f"  Wrote {output}\n")
+
+        if assessment_ids:
+            paramify_client = build_paramify_client()
+            check_assessment_targets(paramify_client, assessment_ids)
+            filename = os.path.basename(output) if output else f"{report_name or 'Consolidated scan'}.nessus"
+            deadline = Deadline(job_timeout)
+
+            def upload(assessment_id: str) -> Dict:
+                return paramify_client.upload_intake_file(
+                    assessment_id=assessment_id,
+                    file_path=dest_path,
+                    filename=filename,
+                    effective_date=effective_date,
+                    deadline=deadline
+                )
+
+            # Every assessment (possibly in different tenants) gets the same file, in parallel
+            assessment_ids = list(dict.fromkeys(assessment_ids))
+            with ThreadPoolExecutor(max_workers=len(assessment_ids)) as pool:
+                futures = [pool.submit(upload, assessment_id) for assessment_id in assessment_ids]
+            failed = False
+            for assessment_id, future in zip(assessment_ids, futures):
+                try:
+                    artifacts = future.result().get('artifacts') or [{}]
+                except Exception as e:
+                    print(f"✗ Upload to assessment {assessment_id} failed: {e}")
+                    failed = True
+                    continue
+                print(f"✓ Uploaded {filename} to assessment {assessment_id} ({artifacts[0].get('id', 'uploaded')})")
+            print()
+            if failed:
+                sys.exit(1)
+    finally:
+        if not output and os.path.exists(dest_path):
+            os.remove(dest_path)
+
+
+def print_consolidate_summary(stats: Dict) -> None:
+    """Display what merging overlapping scans saved."""
+    print(f"  Consolidated {stats['sources']} scans: {stats['findings']} of {stats['input_findings']} findings kept "
+          f"across {stats['hosts']} hosts ({stats['replaced']} replaced by newer results), "
+          f"{format_size(stats['input_bytes'])} → {format_size(stats['output_bytes'])}")
+    print()
+
+
+def print_import_results(results: List[Dict]) -> None:
+    """Display per-scan results of a bulk import."""
+    succeeded = [r for r in results if r['success']]
+
+    print("\n" + "=" * 70)
+    print(f"  IMPORT RESULTS: {len(succeeded)} of {len(results)} succeeded")
+    print("=" * 70 + "\n")
+
+    if not results:
+        print("No completed scans found.")
+        print()
+        return
+
+    print(f"{'Scanner':<12} {'ID':<8} {'Name':<28} {'Result':<20}")
+    print("-" * 70)
+
+    for r in results:
+        scanner = str(r.get('scanner') or '')[:11]
+        scan_id = r.get('scan_id') if r.get('scan_id') is not None else '-'
+        name = str(r.get('scan_name') or '-')[:26]
+        if r['success']:
+            artifacts = r['result'].get('artifacts') or [{}]
+            outcome = f"✓ {artifacts[0].get('id', 'uploaded')}"
+        else:
+            outcome = f"✗ {r['error']}"
+        print(f"{scanner:<12} {scan_id:<8} {name:<28} {outcome}")
+    print()
+    print_transcode_summary([r['result'].get('transcode') for r in succeeded])
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -558,6 +1610,18 @@ Examples:
   # Import from GitHub repository
   python main.py import-github
 
+  # Import all matching files from several repositories (non-interactive)
+  python main.py import-github --repo acme/scans@main --repo acme/infra \\
+      --glob 'scans/2026-*/**/*.nessus' --map 'scans/prod/**=abc-123-def' --assessment-id xyz-456
+
+  # Nightly: import only the scan files changed since the last sync
+  python main.py import-github --repo acme/scans@main --map 'scans/prod/**=abc-123-def' \\
+      --sync scans.sync.json
+
+  # Backfill every version of a file overwritten on each commit, dated by commit
+  python main.py import-github --repo acme/scans@main --history scans/latest.nessus \\
+      --since 2025-10-01 --assessment-id abc-123-def
+
   # List all Nessus scans
   python main.py list-scans
 
@@ -569,25 +1633,174 @@ Examples:
 
   # Import with an effective date
   python main.py import --scan-id 123 --assessment-id abc-123-def --effective-date 2025-01-15
+
+  # Import every completed scan in a Nessus folder (by ID or name)
+  python main.py import --folder Production --assessment-id abc-123-def
+
+  # Import one scan into several assessments (exported and downloaded once)
+  python main.py import --scan-id 123 --assessment-id abc-123-def --assessment-id ghi-456-jkl
+
+  # Upload local scan files (e.g. copied from an air-gapped scanner)
+  python main.py import-file scans/*.nessus --assessment-id abc-123-def
+
+  # Import files dropped into a folder as they arrive
+  python main.py watch-dir /srv/scan-drop --assessment-id abc-123-def
+
+  # Upload compact CSV instead of the full .nessus XML
+  python main.py import --folder Production --assessment-id abc-123-def --transcode-csv
+
+  # Find which scans reported a CVE on a host (needs FINDINGS_INDEX or 'index' first)
+  python main.py index scans/
+  python main.py query --cve CVE-2024-3094 --host 10.0.0.5
+
+  # Split a nightly folder import across three runners, then combine their results
+  python main.py import --folder Nightly --assessment-id abc-123-def --shard 1/3 --ledger nightly.ledger
+  python main.py report nightly.shard-*-of-3.ledger
+
+  # Run a local import API for an orchestrator, then submit jobs to it
+  python main.py serve --port 8765 --workers 8
+  curl -X POST localhost:8765/jobs -d '{"type": "nessus", "scan_id": 123, "assessment_id": "abc-123-def"}'
+
+  # Merge partial scans of one boundary (e.g. per subnet) into a single upload
+  python main.py import --folder Q3-Subnets --assessment-id abc-123-def --consolidate
+  python main.py consolidate subnet-a.nessus subnet-b.nessus rescan.nessus -o merged.nessus
+
+  # Import from a specific scanner when several are configured
+  python main.py import --scanner east --scan-id 123 --assessment-id abc-123-def
+
+  # Import one scan into assessments of two Paramify tenants (PARAMIFY_TENANTS)
+  python main.py import --scan-id 123 --assessment-id acme:abc-123-def --assessment-id globex:ghi-456-jkl
         """
     )
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
     # List scans command
-    subparsers.add_parser('list-scans', help='List all available Nessus scans')
+    list_scans_parser = subparsers.add_parser('list-scans', help='List all available Nessus scans')
+    list_scans_parser.add_argument('--scanner', type=str, help='Only list scans from this scanner profile (default: all)')
+    list_scans_parser.add_argument('--scanner-timeout', type=float, help='Time limit in seconds for each scanner when several are listed or imported from (default: SCANNER_TIMEOUT from .env, none if unset)')
+    list_scans_parser.add_argument('--format', choices=FORMATS, default='table', help='Output format; ndjson prints one scan per line as each scanner answers (default: table)')
+    list_scans_parser.add_argument('--fields', type=str, help="Comma-separated fields to output, e.g. 'scanner,id,name,status' (default: all, or the usual table)")
 
     # List assessments command
-    subparsers.add_parser('list-assessments', help='List all available Paramify assessments')
+    list_assessments_parser = subparsers.add_parser('list-assessments', help='List all available Paramify assessments')
+    list_assessments_parser.add_argument('--tenant', action='append', help='Only list assessments of this Paramify tenant (repeatable; default: all)')
+    list_assessments_parser.add_argument('--format', choices=FORMATS, default='table', help='Output format; ndjson prints one assessment per line as each tenant answers (default: table)')
+    list_assessments_parser.add_argument('--fields', type=str, help="Comma-separated fields to output, e.g. 'id,name,type' (default: all, or the usual table)")
 
     # Import command (can be interactive or with arguments)
     import_parser = subparsers.add_parser('import', help='Import a Nessus scan into a Paramify assessment')
     import_parser.add_argument('--scan-id', type=int, help='Nessus scan ID (interactive if not provided)')
-    import_parser.add_argument('--assessment-id', type=str, help='Paramify assessment UUID (interactive if not provided)')
+    import_parser.add_argument('--assessment-id', action='append', help='Paramify assessment UUID, or TENANT:UUID with PARAMIFY_TENANTS (repeatable; interactive if not provided)')
     import_parser.add_argument('--effective-date', type=str, help='Effective date (YYYY-MM-DD format)')
-
-    # Import from GitHub command
-    subparsers.add_parser('import-github', help='Import a .nessus or .csv file from a GitHub repository')
+    import_parser.add_argument('--folder', type=str, help='Import all completed scans in this Nessus folder (ID or name)')
+    import_parser.add_argument('--workers', type=int, default=4, help='Concurrent exports/uploads for folder import (default: 4)')
+    import_parser.add_argument('--scanner', type=str, help='Scanner profile to import from (folder import uses all scanners if not provided)')
+    import_parser.add_argument('--journal', type=str, help='Job journal file; rerunning with the same journal resumes interrupted imports (a new run of a scan is imported again)')
+    import_parser.add_argument('--transcode-csv', action='store_true', help='Convert exports to compact CSV before uploading (columns: TRANSCODE_COLUMNS)')
+    import_parser.add_argument('--shard', type=str, help='Only process this shard of the folder, e.g. 2/4 (journal and ledger files get a per-shard suffix)')
+    import_parser.add_argument('--ledger', type=str, help='Append every outcome to this results ledger (merge shards with the report command)')
+    import_parser.add_argument('--deadline', type=float, help='Time limit in seconds for each scan import (default: JOB_TIMEOUT from .env, none if unset)')
+    import_parser.add_argument('--scanner-timeout', type=float, help='Time limit in seconds for each scanner when several are listed or imported from (default: SCANNER_TIMEOUT from .env, none if unset)')
+    import_parser.add_argument('--consolidate', action='store_true', help='With --folder: merge the scans (latest result per host, port and plugin) and upload one file')
+    import_parser.add_argument('--progress', choices=PROGRESS_MODES, default='auto', help='Live transfer progress on stderr: bar, periodic JSON lines, or off (default: auto, a bar on a terminal and lines otherwise)')
+
+    # Import from GitHub command (interactive unless --repo is given)
+    github_parser = subparsers.add_parser('import-github', help='Import .nessus or .csv files from GitHub repositories')
+    github_parser.add_argument('--repo', action='append', default=[], help='Repository as owner/repo[@ref] or URL (repeatable; interactive if not provided)')
+    github_parser.add_argument('--glob', action='append', default=[], help="Path glob to import, e.g. 'scans/2026-*/**/*.nessus' (repeatable; default: all .nessus/.csv files)")
+    github_parser.add_argument('--map', action='append', default=[], metavar='GLOB=ASSESSMENT_ID', help='Send files matching GLOB to an assessment, or to several comma-separated ones (repeatable; first match wins)')
+    github_parser.add_argument('--assessment-id', type=str, help='Assessment (or comma-separated assessments) for files not matched by --map')
+    github_parser.add_argument('--effective-date', type=str, help='Effective date (YYYY-MM-DD format)')
+    github_parser.add_argument('--history', action='append', default=[], metavar='PATH', help='Import every distinct version of this file from the commit history of --repo, each dated by its commit (repeatable)')
+    github_parser.add_argument('--since', type=str, help='With --history: only commits on or after this date (YYYY-MM-DD)')
+    github_parser.add_argument('--until', type=str, help='With --history: only commits on or before this date (YYYY-MM-DD)')
+    github_parser.add_argument('--sync', type=str, metavar='STATE_FILE', help='Only import files added or modified since the commit recorded in this file by the last sync, then record the new head (the first sync imports everything)')
+    github_parser.add_argument('--token', type=str, help='GitHub token (default: GITHUB_TOKEN from .env)')
+    github_parser.add_argument('--workers', type=int, default=4, help='Concurrent downloads/uploads (default: 4)')
+    github_parser.add_argument('--dry-run', action='store_true', help='Only show which files would be imported where')
+    github_parser.add_argument('--archive', action='store_true', help='Fetch each repository as one tarball instead of one API call per file/directory')
+    github_parser.add_argument('--journal', type=str, help='Job journal file; rerunning with the same journal skips file versions already uploaded (a changed file is imported again)')
+    github_parser.add_argument('--shard', type=str, help='Only process this shard of the files, e.g. 2/4 (journal and ledger files get a per-shard suffix)')
+    github_parser.add_argument('--ledger', type=str, help='Append every outcome to this results ledger (merge shards with the report command)')
+    github_parser.add_argument('--transcode-csv', action='store_true', help='Convert .nessus files to compact CSV before uploading (columns: TRANSCODE_COLUMNS)')
+    github_parser.add_argument('--deadline', type=float, help='Time limit in seconds for each file import (default: JOB_TIMEOUT from .env, none if unset)')
+    github_parser.add_argument('--progress', choices=PROGRESS_MODES, default='auto', help='Live transfer progress on stderr: bar, periodic JSON lines, or off (default: auto, a bar on a terminal and lines otherwise)')
+
+    # Import local files command
+    file_parser = subparsers.add_parser('import-file', help='Import local .nessus or .csv files')
+    file_parser.add_argument('paths', nargs='+', help='Scan files, or directories containing them')
+    file_parser.add_argument('--assessment-id', type=str, required=True, help='Paramify assessment UUID')
+    file_parser.add_argument('--effective-date', type=str, help='Effective date (YYYY-MM-DD format)')
+    file_parser.add_argument('--workers', type=int, default=4, help='Concurrent uploads (default: 4)')
+    file_parser.add_argument('--shard', type=str, help='Only process this shard of the files, e.g. 2/4 (the ledger file gets a per-shard suffix)')
+    file_parser.add_argument('--ledger', type=str, help='Append every outcome to this results ledger (merge shards with the report command)')
+    file_parser.add_argument('--deadline', type=float, help='Time limit in seconds for each upload (default: JOB_TIMEOUT from .env, none if unset)')
+    file_parser.add_argument('--progress', choices=PROGRESS_MODES, default='auto', help='Live transfer progress on stderr: bar, periodic JSON lines, or off (default: auto, a bar on a terminal and lines otherwise)')
+
+    # Watch drop folder command
+    watch_parser = subparsers.add_parser('watch-dir', help='Import scan files as they are dropped into a folder')
+    watch_parser.add_argument('directory', help='Folder to watch; imported files move to done/ or failed/ inside it')
+    watch_parser.add_argument('--assessment-id', type=str, required=True, help='Paramify assessment UUID')
+    watch_parser.add_argument('--effective-date', type=str, help='Effective date (YYYY-MM-DD format)')
+    watch_parser.add_argument('--workers', type=int, default=4, help='Concurrent uploads (default: 4)')
+    watch_parser.add_argument('--interval', type=float, default=5, help='Seconds between folder checks (default: 5)')
+    watch_parser.add_argument('--once', action='store_true', help='Import the files present now and exit')
+    watch_parser.add_argument('--shard', type=str, help='Only process this shard of the dropped files, e.g. 2/4 (the ledger file gets a per-shard suffix)')
+    watch_parser.add_argument('--ledger', type=str, help='Append every outcome to this results ledger (merge shards with the report command)')
+    watch_parser.add_argument('--deadline', type=float, help='Time limit in seconds for each upload (default: JOB_TIMEOUT from .env, none if unset)')
+    watch_parser.add_argument('--progress', choices=PROGRESS_MODES, default='auto', help='Live transfer progress on stderr: bar, periodic JSON lines, or off (default: auto, a bar on a terminal and lines otherwise)')
+
+    # Import service command
+    serve_parser = subparsers.add_parser('serve', help='Run a local HTTP API that queues and runs import jobs')
+    serve_parser.add_argument('--host', type=str, default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    serve_parser.add_argument('--workers', type=int, default=4, help='Jobs run at once (default: 4)')
+    serve_parser.add_argument('--journal', type=str, help='Job journal file; jobs already uploaded are skipped and interrupted imports resume')
+    serve_parser.add_argument('--ledger', type=str, help='Append the outcome of every job to this results ledger')
+    serve_parser.add_argument('--transcode-csv', action='store_true', help='Convert .nessus files to compact CSV before uploading (columns: TRANSCODE_COLUMNS)')
+    serve_parser.add_argument('--cache-ttl', type=float, default=60, help='Seconds the scan and assessment listings are cached (default: 60)')
+    serve_parser.add_argument('--deadline', type=float, help='Time limit in seconds for each job (default: JOB_TIMEOUT from .env, none if unset)')
+    serve_parser.add_argument('--scanner-timeout', type=float, help='Time limit in seconds for each scanner when several are listed or imported from (default: SCANNER_TIMEOUT from .env, none if unset)')
+    serve_parser.add_argument('--file-root', type=str, help='Directory "file" jobs may upload from; paths are resolved (symlinks and ..) before the check. File jobs are refused without it, since any API client could otherwise send any file this process can read to Paramify')
+
+    # Consolidate command
+    consolidate_parser = subparsers.add_parser('consolidate', help='Merge overlapping .nessus files, keeping the latest result of each finding')
+    consolidate_parser.add_argument('paths', nargs='+', help='.nessus files, or directories containing them')
+    consolidate_parser.add_argument('-o', '--output', type=str, help='Merged .nessus file to write (required unless uploading)')
+    consolidate_parser.add_argument('--name', type=str, help='Report name of the merged scan (default: Consolidated scan)')
+    consolidate_parser.add_argument('--assessment-id', action='append', help='Upload the merged file to this Paramify assessment (repeatable)')
+    consolidate_parser.add_argument('--effective-date', type=str, help='Effective date of the upload (YYYY-MM-DD format)')
+    consolidate_parser.add_argument('--deadline', type=float, help='Time limit in seconds for the upload (default: JOB_TIMEOUT from .env, none if unset)')
+    consolidate_parser.add_argument('--progress', choices=PROGRESS_MODES, default='auto', help='Live transfer progress on stderr: bar, periodic JSON lines, or off (default: auto, a bar on a terminal and lines otherwise)')
+
+    # Report command
+    report_parser = subparsers.add_parser('report', help='Summarize results ledgers, e.g. from several shards')
+    report_parser.add_argument('ledgers', nargs='+', help='Ledger files to merge')
+
+    # Findings index commands
+    index_parser = subparsers.add_parser('index', help='Add local .nessus or .csv files to the findings index')
+    index_parser.add_argument('paths', nargs='+', help='Scan files, or directories containing them')
+    index_parser.add_argument('--index', type=str, help='Index database file (default: FINDINGS_INDEX or findings.db)')
+    index_parser.add_argument('--effective-date', type=str, help='Effective date to record (YYYY-MM-DD format)')
+
+    query_parser = subparsers.add_parser('query', help='Search indexed findings by host, CVE, or plugin')
+    query_parser.add_argument('--host', type=str, help='Host name or IP address')
+    query_parser.add_argument('--cve', type=str, help='CVE ID, e.g. CVE-2024-3094')
+    query_parser.add_argument('--plugin', type=int, help='Nessus plugin ID')
+    query_parser.add_argument('--min-severity', choices=['info', 'low', 'medium', 'high', 'critical'], help='Minimum severity')
+    query_parser.add_argument('--scan', type=str, help='Scan or file name')
+    query_parser.add_argument('--limit', type=int, default=100, help='Maximum number of findings to show (default: 100, 0 for all)')
+    query_parser.add_argument('--index', type=str, help='Index database file (default: FINDINGS_INDEX or findings.db)')
+
+    # Synthetic fixture command
+    fixture_parser = subparsers.add_parser('generate-fixture', help='Write a synthetic .nessus or .csv scan for load testing')
+    fixture_parser.add_argument('output', help='File to write; the .nessus or .csv extension selects the format')
+    fixture_parser.add_argument('--hosts', type=int, default=100, help='Number of hosts (default: 100)')
+    fixture_parser.add_argument('--findings-per-host', type=int, default=50, help='Findings per host (default: 50)')
+    fixture_parser.add_argument('--severity-mix', type=str, help='Relative weights, e.g. critical=2,high=8,medium=20,low=10,info=60 (the default)')
+    fixture_parser.add_argument('--seed', type=int, default=0, help='Seed; the same arguments always produce the same file (default: 0)')
+    fixture_parser.add_argument('--format', choices=['nessus', 'csv'], help='Output format (default: from the file extension)')
 
     args = parser.parse_args()
 
@@ -600,55 +1813,203 @@ Examples:
         return
 
     # Execute command
-    if args.command == 'import-github':
-        # Validate that we have Paramify credentials
-        if not Config.PARAMIFY_API_KEY:
-            print("✗ Configuration error: PARAMIFY_API_KEY is required")
-            sys.exit(1)
-        import_from_github_interactive()
-    else:
-        # Validate Paramify configuration (required for all commands)
-        is_valid, missing = Config.validate()
-        if not is_valid:
-            print(f"✗ Configuration error: Missing required Paramify credentials: {', '.join(missing)}")
-            print("\nPlease set PARAMIFY_API_KEY in your .env file")
-            sys.exit(1)
+    shard = parse_shard(getattr(args, 'shard', None))
+    ledger = open_ledger(getattr(args, 'ledger', None), shard)
+    job_timeout = getattr(args, 'deadline', None) or Config.get_job_timeout()
 
-        # Validate Nessus configuration for Nessus-specific commands
-        if args.command in ['list-scans', 'import']:
-            is_valid_nessus, missing_nessus = Config.validate_nessus()
-            if not is_valid_nessus:
-                print(f"✗ Configuration error: Missing Nessus credentials: {', '.join(missing_nessus)}")
-                print("\nPlease set the following in your .env file:")
-                for key in missing_nessus:
-                    print(f"  - {key}")
+    reporter = start_progress(getattr(args, 'progress', None))
+    try:
+        if args.command == 'report':
+            report_ledgers(args.ledgers)
+        elif args.command == 'generate-fixture':
+            generate_fixture(
+                args.output, args.hosts, args.findings_per_host, args.severity_mix, args.seed, args.format
+            )
+        elif args.command in ('index', 'query'):
+            # The findings index is local and needs no credentials
+            index_path = args.index or Config.FINDINGS_INDEX or 'findings.db'
+            if args.command == 'index':
+                index_files(args.paths, index_path, args.effective_date)
+            else:
+                query_findings(
+                    index_path,
+                    host=args.host,
+                    cve=args.cve,
+                    plugin_id=args.plugin,
+                    min_severity=SEVERITY_LEVELS[args.min_severity] if args.min_severity else None,
+                    scan=args.scan,
+                    limit=args.limit or None
+                )
+        elif args.command == 'consolidate':
+            if not args.output and not args.assessment_id:
+                print("✗ --output or --assessment-id is required")
                 sys.exit(1)
-
-        # Initialize integration
-        integration = NessusParamifyIntegration(
-            nessus_url=Config.NESSUS_URL,
-            nessus_access_key=Config.NESSUS_ACCESS_KEY,
-            nessus_secret_key=Config.NESSUS_SECRET_KEY,
-            paramify_api_key=Config.PARAMIFY_API_KEY,
-            paramify_base_url=Config.PARAMIFY_BASE_URL
-        )
-
-        # Execute Nessus-based commands
-        if args.command == 'list-scans':
-            list_scans(integration)
-        elif args.command == 'list-assessments':
-            list_assessments(integration)
-        elif args.command == 'import':
-            # Use interactive mode if no scan-id or assessment-id provided
-            if args.scan_id is None or args.assessment_id is None:
-                import_scan_interactive(integration)
+            if args.assessment_id:
+                require_paramify()
+            consolidate_files(
+                args.paths, args.output, args.name, args.assessment_id, args.effective_date, job_timeout
+            )
+        elif args.command == 'serve':
+            require_paramify()
+            serve(
+                args.host,
+                args.port,
+                args.workers,
+                open_journal(args.journal, None),
+                ledger,
+                job_timeout,
+                args.transcode_csv,
+                args.cache_ttl,
+                args.scanner_timeout,
+                args.file_root
+            )
+        elif args.command == 'import-github':
+            # Validate that we have Paramify credentials
+            require_paramify()
+            if args.repo:
+                import_from_github_batch(
+                    repos=args.repo,
+                    patterns=args.glob,
+                    mapping_entries=args.map,
+                    default_assessment_id=args.assessment_id,
+                    effective_date=args.effective_date,
+                    token=args.token or Config.GITHUB_TOKEN or None,
+                    max_workers=args.workers,
+                    dry_run=args.dry_run,
+                    archive=args.archive,
+                    journal=open_journal(args.journal, shard),
+                    transcode_csv=args.transcode_csv,
+                    shard=shard,
+                    ledger=ledger,
+                    job_timeout=job_timeout,
+                    history=args.history,
+                    since=args.since,
+                    until=args.until,
+                    sync_state=SyncState(shard_path(args.sync, shard)) if args.sync else None
+                )
             else:
-                import_scan(
-                    integration,
-                    args.scan_id,
+                import_from_github_interactive()
+        elif args.command in ('import-file', 'watch-dir'):
+            # Local files only need Paramify credentials
+            require_paramify()
+            if args.command == 'import-file':
+                import_files(args.paths, args.assessment_id, args.effective_date, args.workers, shard, ledger, job_timeout)
+            else:
+                watch_dir(
+                    args.directory,
                     args.assessment_id,
-                    args.effective_date
+                    args.effective_date,
+                    args.workers,
+                    args.interval,
+                    args.once,
+                    shard,
+                    ledger,
+                    job_timeout
+                )
+        else:
+            # Validate Paramify configuration (required for all commands)
+            is_valid, missing = Config.validate()
+            if not is_valid:
+                print(f"✗ Configuration error: Missing required Paramify credentials: {', '.join(missing)}")
+                print("\nPlease set PARAMIFY_API_KEY in your .env file")
+                sys.exit(1)
+
+            # Validate Nessus configuration for Nessus-specific commands
+            if args.command in ['list-scans', 'import']:
+                is_valid_nessus, missing_nessus = Config.validate_nessus()
+                if not is_valid_nessus:
+                    print(f"✗ Configuration error: Missing Nessus credentials: {', '.join(missing_nessus)}")
+                    print("\nPlease set the following in your .env file:")
+                    for key in missing_nessus:
+                        print(f"  - {key}")
+                    sys.exit(1)
+
+            # Initialize integration
+            integration = build_integration(
+                transcode_csv=getattr(args, 'transcode_csv', False), job_timeout=job_timeout,
+                scanner_timeout=getattr(args, 'scanner_timeout', None)
+            )
+
+            # Execute Nessus-based commands
+            if args.command == 'list-scans':
+                list_scans(
+                    integration, scanner=args.scanner, output_format=args.format, fields=parse_fields(args.fields)
                 )
+            elif args.command == 'list-assessments':
+                list_assessments(
+                    integration, tenants=args.tenant, output_format=args.format, fields=parse_fields(args.fields)
+                )
+            elif args.command == 'import':
+                journal = open_journal(args.journal, shard)
+                if shard and args.folder is None:
+                    print("✗ --shard is only supported with --folder")
+                    sys.exit(1)
+                if args.folder is not None and args.scan_id is not None:
+                    print("✗ Use either --folder or --scan-id, not both")
+                    sys.exit(1)
+                if args.consolidate and (args.folder is None or journal or shard):
+                    print("✗ --consolidate requires --folder and does not support --journal or --shard")
+                    sys.exit(1)
+                if args.folder is not None:
+                    if not args.assessment_id:
+                        print("✗ --assessment-id is required with --folder")
+                        sys.exit(1)
+                    if len(args.assessment_id) != 1 and not args.consolidate:
+                        print("✗ Several --assessment-id values need --consolidate with --folder")
+                        sys.exit(1)
+                check_assessment_targets(integration.paramify_client, args.assessment_id or [])
+                if args.consolidate:
+                    import_folder_consolidated(
+                        integration,
+                        args.folder,
+                        args.assessment_id,
+                        args.effective_date,
+                        args.workers,
+                        args.scanner,
+                        ledger
+                    )
+                elif args.folder is not None:
+                    import_folder(
+                        integration,
+                        args.folder,
+                        args.assessment_id[0],
+                        args.effective_date,
+                        args.workers,
+                        args.scanner,
+                        journal,
+                        shard,
+                        ledger
+                    )
+                # Use interactive mode if no scan-id or assessment-id provided
+                elif args.scan_id is None or args.assessment_id is None:
+                    import_scan_interactive(integration)
+                else:
+                    if args.scanner is None and len(integration.scanner_names) > 1:
+                        print("✗ --scanner is required with --scan-id when several scanners are configured")
+                        print(f"  Configured scanners: {', '.join(integration.scanner_names)}")
+                        sys.exit(1)
+                    if len(args.assessment_id) > 1:
+                        import_scan_multi(
+                            integration,
+                            args.scan_id,
+                            args.assessment_id,
+                            args.effective_date,
+                            args.scanner,
+                            journal
+                        )
+                    else:
+                        import_scan(
+                            integration,
+                            args.scan_id,
+                            args.assessment_id[0],
+                            args.effective_date,
+                            args.scanner,
+                            journal
+                        )
+
+    finally:
+        if reporter:
+            reporter.close()
 
 
 if __name__ == '__main__':
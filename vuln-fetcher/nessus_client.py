@@ -1,21 +1,42 @@
 """
 Nessus API Client for retrieving scan results.
 """
+import os
+import json
+import time
+import hashlib
+import threading
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+from deadline import Deadline, request_timeout, deadline_errors
+import progress
+from compression import ACCEPT_ENCODING, wire_size
 
 # Disable SSL warnings for self-signed certificates (common with Nessus)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Serializes read-modify-write of the shared export registry file
+_REGISTRY_FILE_LOCK = threading.Lock()
+
 
 class NessusClient:
     """Client for interacting with Nessus API."""
 
-    def __init__(self, url: str, access_key: str, secret_key: str, verify_ssl: bool = False):
+    def __init__(
+        self,
+        url: str,
+        access_key: str,
+        secret_key: str,
+        verify_ssl: bool = False,
+        export_registry_path: Optional[str] = None,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        pool_size: int = 10
+    ):
         """
         Initialize Nessus client.
 
@@ -24,24 +45,48 @@ class NessusClient:
             access_key: Nessus API access key
             secret_key: Nessus API secret key
             verify_ssl: Whether to verify SSL certificates (default False for self-signed certs)
+            export_registry_path: Optional JSON file to persist export file IDs in,
+                so later runs can reuse exports too (in-memory only if not provided)
+            timeouts: (connect, read) timeouts by endpoint class ('api',
+                'download'); see deadline.DEFAULT_TIMEOUTS
+            pool_size: Keep-alive connections kept open to the server
         """
         self.url = url.rstrip('/')
         self.access_key = access_key
         self.secret_key = secret_key
         self.verify_ssl = verify_ssl
+        self.timeouts = timeouts or {}
         self.headers = {
             'X-ApiKeys': f'accessKey={access_key}; secretKey={secret_key}',
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING
         }
-
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        self.session = requests.Session()
+        self.session.mount(self.url, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+
+        # Export file IDs keyed by (scan ID, history ID, format)
+        self.export_registry_path = export_registry_path
+        self._exports: Dict[Tuple[int, Optional[int], str], int] = {}
+        self._exports_lock = threading.Lock()
+        self._load_export_registry()
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        endpoint_class: str = 'api',
+        deadline: Optional[Deadline] = None,
+        **kwargs
+    ) -> requests.Response:
         """
         Make HTTP request to Nessus API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
+            endpoint_class: Timeout class of the endpoint ('api' or 'download')
+            deadline: Optional job deadline the timeout is clamped to
             **kwargs: Additional arguments to pass to requests
 
         Returns:
@@ -49,121 +94,396 @@ class NessusClient:
 
         Raises:
             requests.exceptions.RequestException: If request fails
+            DeadlineExceeded: If the deadline has passed or was cancelled
         """
         url = f"{self.url}{endpoint}"
         kwargs['verify'] = self.verify_ssl
         kwargs['headers'] = self.headers
+        kwargs['timeout'] = request_timeout(self.timeouts, endpoint_class, deadline)
 
         logger.debug(f"Making {method} request to {url}")
-        response = requests.request(method, url, **kwargs)
+        with deadline_errors(deadline, f"{method} {endpoint}"):
+            response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
         return response
 
-    def list_scans(self) -> List[Dict]:
+    def list_scans(self, folder_id: Optional[int] = None) -> List[Dict]:
         """
         List all scans.
 
+        Args:
+            folder_id: Optional folder ID to restrict the listing to
+
         Returns:
             List of scan dictionaries
         """
         logger.info("Fetching list of scans from Nessus")
-        response = self._make_request('GET', '/scans')
+        params = {'folder_id': folder_id} if folder_id is not None else None
+        response = self._make_request('GET', '/scans', params=params)
         data = response.json()
-        return data.get('scans', [])
+        # Nessus returns "scans": null for empty folders
+        return data.get('scans') or []
 
-    def get_scan_details(self, scan_id: int) -> Dict:
+    def list_folders(self) -> List[Dict]:
+        """
+        List all scan folders.
+
+        Returns:
+            List of folder dictionaries (id, name, type)
+        """
+        logger.info("Fetching list of folders from Nessus")
+        response = self._make_request('GET', '/folders')
+        data = response.json()
+        return data.get('folders') or []
+
+    def get_scan_details(self, scan_id: int, deadline: Optional[Deadline] = None) -> Dict:
         """
         Get detailed information about a specific scan.
 
         Args:
             scan_id: Scan ID
+            deadline: Optional job deadline
 
         Returns:
             Scan details dictionary
         """
         logger.info(f"Fetching details for scan ID: {scan_id}")
-        response = self._make_request('GET', f'/scans/{scan_id}')
+        response = self._make_request('GET', f'/scans/{scan_id}', deadline=deadline)
         return response.json()
 
-    def export_scan(self, scan_id: int, format: str = 'nessus') -> int:
+    @staticmethod
+    def latest_history_id(scan_details: Dict) -> Optional[int]:
+        """
+        Get the history ID of the most recent completed run of a scan.
+
+        Args:
+            scan_details: Scan details from get_scan_details()
+
+        Returns:
+            History ID, or None if the scan has no completed run
+        """
+        history = [h for h in scan_details.get('history') or [] if h.get('status') == 'completed']
+        if not history:
+            return None
+        latest = max(history, key=lambda h: (h.get('last_modification_date') or 0, h.get('history_id') or 0))
+        return latest.get('history_id')
+
+    def export_scan(
+        self,
+        scan_id: int,
+        format: str = 'nessus',
+        history_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None
+    ) -> int:
         """
         Request a scan export.
 
         Args:
             scan_id: Scan ID to export
             format: Export format ('nessus', 'csv', 'html', 'pdf', 'db')
+            history_id: Optional scan run to export (latest run if not provided)
+            deadline: Optional job deadline
 
         Returns:
             File ID for the export
         """
         logger.info(f"Requesting export for scan ID: {scan_id} in format: {format}")
         payload = {'format': format}
-        response = self._make_request('POST', f'/scans/{scan_id}/export', json=payload)
+        params = {'history_id': history_id} if history_id is not None else None
+        response = self._make_request(
+            'POST', f'/scans/{scan_id}/export', deadline=deadline, json=payload, params=params
+        )
         data = response.json()
         file_id = data.get('file')
         logger.info(f"Export requested, file ID: {file_id}")
         return file_id
 
-    def check_export_status(self, scan_id: int, file_id: int) -> str:
+    def request_export(
+        self,
+        scan_id: int,
+        format: str = 'nessus',
+        history_id: Optional[int] = None,
+        deadline: Optional[Deadline] = None
+    ) -> int:
+        """
+        Get an export of a scan run, reusing an earlier one when Nessus still has it.
+
+        Exporting makes Nessus regenerate the whole file, so exports are
+        remembered by (scan ID, history ID, format). If a remembered export
+        is still ready (or still being built), its file ID is returned and
+        no new export is requested.
+
+        Args:
+            scan_id: Scan ID to export
+            format: Export format ('nessus', 'csv', 'html', 'pdf', 'db')
+            history_id: Scan run to export. Pass it whenever known: exports
+                of "the latest run" (None) are only reused within one run
+                of the tool, since a new scan run may have finished since.
+            deadline: Optional job deadline
+
+        Returns:
+            File ID for the export
+        """
+        key = (scan_id, history_id, format)
+        with self._exports_lock:
+            file_id = self._exports.get(key)
+
+        if file_id is not None:
+            try:
+                status = self.check_export_status(scan_id, file_id, deadline)
+            except requests.exceptions.RequestException as e:
+                logger.debug(f"Registered export {file_id} for scan {scan_id} is gone: {e}")
+                status = None
+
+            if status in ('ready', 'loading'):
+                logger.info(f"Reusing export {file_id} for scan ID: {scan_id} (status: {status})")
+                return file_id
+            self._register_export(key, None)
+
+        file_id = self.export_scan(scan_id, format, history_id, deadline)
+        self._register_export(key, file_id)
+        return file_id
+
+    def _register_export(self, key: Tuple[int, Optional[int], str], file_id: Optional[int]) -> None:
+        """
+        Remember (or forget, if file_id is None) an export file ID.
+
+        Args:
+            key: (scan ID, history ID, format)
+            file_id: Export file ID, or None to drop the entry
+        """
+        with self._exports_lock:
+            if file_id is None:
+                self._exports.pop(key, None)
+            else:
+                self._exports[key] = file_id
+
+        # Only exports of a known run are safe to reuse across runs of the tool
+        if not self.export_registry_path or key[1] is None:
+            return
+
+        with _REGISTRY_FILE_LOCK:
+            registry = self._read_registry_file()
+            entry = self._registry_file_key(key)
+            if file_id is None:
+                registry.pop(entry, None)
+            else:
+                registry[entry] = file_id
+            partial_path = f"{self.export_registry_path}.tmp"
+            with open(partial_path, 'w', encoding='utf-8') as f:
+                json.dump(registry, f, indent=2)
+            os.replace(partial_path, self.export_registry_path)
+
+    def _load_export_registry(self) -> None:
+        """Load export file IDs for this server from the registry file."""
+        if not self.export_registry_path:
+            return
+
+        prefix = f"{self.url}|"
+        with _REGISTRY_FILE_LOCK:
+            registry = self._read_registry_file()
+
+        for entry, file_id in registry.items():
+            if not entry.startswith(prefix):
+                continue
+            scan_id, history_id, format = entry[len(prefix):].split('|')
+            self._exports[(int(scan_id), int(history_id), format)] = file_id
+
+    def _read_registry_file(self) -> Dict[str, int]:
+        """Read the registry file (empty if missing or unreadable)."""
+        try:
+            with open(self.export_registry_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable export registry {self.export_registry_path}: {e}")
+            return {}
+
+    def _registry_file_key(self, key: Tuple[int, Optional[int], str]) -> str:
+        """Build the registry file entry name, scoped to this server."""
+        scan_id, history_id, format = key
+        return f"{self.url}|{scan_id}|{history_id}|{format}"
+
+    def check_export_status(self, scan_id: int, file_id: int, deadline: Optional[Deadline] = None) -> str:
         """
         Check the status of a scan export.
 
         Args:
             scan_id: Scan ID
             file_id: Export file ID
+            deadline: Optional job deadline
 
         Returns:
             Status string ('ready' or 'loading')
         """
-        response = self._make_request('GET', f'/scans/{scan_id}/export/{file_id}/status')
+        response = self._make_request('GET', f'/scans/{scan_id}/export/{file_id}/status', deadline=deadline)
         data = response.json()
         return data.get('status')
 
-    def download_scan(self, scan_id: int, file_id: int) -> bytes:
+    def download_scan(self, scan_id: int, file_id: int, deadline: Optional[Deadline] = None) -> bytes:
         """
         Download exported scan file.
 
         Args:
             scan_id: Scan ID
             file_id: Export file ID
+            deadline: Optional job deadline, checked between chunks
 
         Returns:
             Scan file content as bytes
         """
         logger.info(f"Downloading scan ID: {scan_id}, file ID: {file_id}")
-        response = self._make_request('GET', f'/scans/{scan_id}/export/{file_id}/download')
-        return response.content
+        response = self._make_request(
+            'GET', f'/scans/{scan_id}/export/{file_id}/download',
+            endpoint_class='download', deadline=deadline, stream=True
+        )
+        chunks = []
+        with response, deadline_errors(deadline, f"Download of scan {scan_id}"), \
+                progress.transfer('download', f"scan {scan_id}", progress.content_length(response)) as tracked:
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                if deadline:
+                    deadline.check(f"Download of scan {scan_id}")
+                chunks.append(chunk)
+                tracked.advance(len(chunk))
+        content = b''.join(chunks)
+        self._log_compression(scan_id, len(content), response)
+        return content
+
+    def download_scan_to_file(
+        self,
+        scan_id: int,
+        file_id: int,
+        dest_path: str,
+        chunk_size: int = 1024 * 1024,
+        deadline: Optional[Deadline] = None
+    ) -> str:
+        """
+        Download exported scan file to disk without holding it in memory.
 
-    def get_scan_export(self, scan_id: int, format: str = 'nessus', max_retries: int = 30) -> bytes:
+        The file is written to a temporary name next to dest_path and renamed
+        once complete, so dest_path never holds a partial download (the
+        partial file is removed if the download fails or runs out of time).
+
+        Args:
+            scan_id: Scan ID
+            file_id: Export file ID
+            dest_path: Path to write the export to
+            chunk_size: Bytes to read per chunk
+            deadline: Optional job deadline, checked between chunks
+
+        Returns:
+            SHA-256 hex digest of the downloaded file
+        """
+        logger.info(f"Downloading scan ID: {scan_id}, file ID: {file_id} to {dest_path}")
+        digest = hashlib.sha256()
+        partial_path = f"{dest_path}.part"
+
+        response = self._make_request(
+            'GET', f'/scans/{scan_id}/export/{file_id}/download',
+            endpoint_class='download', deadline=deadline, stream=True
+        )
+        try:
+            with response, open(partial_path, 'wb') as f, \
+                    deadline_errors(deadline, f"Download of scan {scan_id}"), \
+                    progress.transfer('download', f"scan {scan_id}", progress.content_length(response)) as tracked:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if deadline:
+                        deadline.check(f"Download of scan {scan_id}")
+                    f.write(chunk)
+                    digest.update(chunk)
+                    tracked.advance(len(chunk))
+            self._log_compression(scan_id, tracked.done, response)
+            os.replace(partial_path, dest_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _log_compression(scan_id: int, size: int, response: requests.Response) -> None:
+        """Log how much a compressed download saved on the wire."""
+        compressed = wire_size(response)
+        if compressed is not None:
+            logger.info(
+                f"Downloaded scan {scan_id}: {size} bytes, {compressed} on the wire "
+                f"({response.headers['Content-Encoding']})"
+            )
+
+    def wait_for_export(
+        self,
+        scan_id: int,
+        file_id: int,
+        max_retries: int = 30,
+        poll_interval: float = 2,
+        deadline: Optional[Deadline] = None
+    ) -> None:
+        """
+        Wait for a requested export to become ready.
+
+        Args:
+            scan_id: Scan ID
+            file_id: Export file ID
+            max_retries: Maximum number of times to check export status
+            poll_interval: Seconds to wait between checks
+            deadline: Optional job deadline; waiting stops when it passes
+                or is cancelled, even with retries left
+
+        Raises:
+            TimeoutError: If export doesn't complete within max_retries
+            DeadlineExceeded: If the deadline passes or is cancelled first
+        """
+        with progress.export_wait(f"scan {scan_id}"):
+            for i in range(max_retries):
+                status = self.check_export_status(scan_id, file_id, deadline)
+                if status == 'ready':
+                    logger.info(f"Export ready after {i+1} attempts")
+                    return
+                logger.debug(f"Export status: {status}, waiting... ({i+1}/{max_retries})")
+                if deadline:
+                    deadline.sleep(poll_interval)
+                else:
+                    time.sleep(poll_interval)
+
+        raise TimeoutError(f"Export did not complete within {max_retries} retries")
+
+    def get_scan_export(
+        self,
+        scan_id: int,
+        format: str = 'nessus',
+        max_retries: int = 30,
+        history_id: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> bytes:
         """
         Export and download a scan (convenience method that handles the full workflow).
 
+        A still-available export of the same scan run is downloaded again
+        instead of requesting a new one (see request_export()).
+
         Args:
             scan_id: Scan ID to export
             format: Export format ('nessus', 'csv', 'html', 'pdf', 'db')
             max_retries: Maximum number of times to check export status
+            history_id: Optional scan run to export (latest run if not provided)
+            timeout: Optional wall-clock limit in seconds for the whole
+                export, wait and download
 
         Returns:
             Scan file content as bytes
 
         Raises:
             TimeoutError: If export doesn't complete within max_retries
+            DeadlineExceeded: If the whole workflow takes longer than timeout
         """
-        import time
+        deadline = Deadline(timeout) if timeout else None
 
-        # Request export
-        file_id = self.export_scan(scan_id, format)
+        # Request export (or reuse a registered one)
+        file_id = self.request_export(scan_id, format, history_id, deadline)
 
         # Wait for export to be ready
-        for i in range(max_retries):
-            status = self.check_export_status(scan_id, file_id)
-            if status == 'ready':
-                logger.info(f"Export ready after {i+1} attempts")
-                break
-            logger.debug(f"Export status: {status}, waiting... ({i+1}/{max_retries})")
-            time.sleep(2)
-        else:
-            raise TimeoutError(f"Export did not complete within {max_retries} retries")
+        self.wait_for_export(scan_id, file_id, max_retries, deadline=deadline)
 
         # Download the export
-        return self.download_scan(scan_id, file_id)
+        return self.download_scan(scan_id, file_id, deadline)
@@ -0,0 +1,103 @@
+"""
+Machine-readable output for the list commands.
+
+Tables are meant for people and truncate long names. Scripts get NDJSON
+(one JSON object per line, written and flushed as soon as the record is
+known) or a JSON array. Both are streamed: records are written as they
+arrive and never collected, so a listing of tens of thousands of scans
+can be piped through jq or grep in constant memory.
+"""
+import sys
+import json
+from typing import Optional, List, Dict, Iterable, IO
+
+FORMATS = ('table', 'ndjson', 'json')
+
+
+def parse_fields(spec: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated --fields value.
+
+    Args:
+        spec: e.g. 'id,name,status'
+
+    Returns:
+        Field names in the given order, or None to keep every field
+    """
+    fields = [f.strip() for f in (spec or '').split(',') if f.strip()]
+    return list(dict.fromkeys(fields)) or None
+
+
+def select_fields(record: Dict, fields: Optional[List[str]]) -> Dict:
+    """Keep only the given fields of a record, in that order (missing fields are null)."""
+    if not fields:
+        return record
+    return {field: record.get(field) for field in fields}
+
+
+class RecordWriter:
+    """Writes records as NDJSON lines or as one JSON array, as they arrive."""
+
+    def __init__(self, output_format: str, fields: Optional[List[str]] = None, stream: Optional[IO[str]] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            output_format: 'ndjson' or 'json'
+            fields: Fields to keep in each record (default: all)
+            stream: Where to write (default: stdout)
+
+        Raises:
+            ValueError: If the format is not a streaming format
+        """
+        if output_format not in ('ndjson', 'json'):
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.output_format = output_format
+        self.fields = fields
+        self.stream = stream or sys.stdout
+        self.count = 0
+        self._closed = False
+
+    def __enter__(self) -> 'RecordWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, record: Dict) -> None:
+        """Write one record and flush it, so a reader at the other end of a pipe sees it at once."""
+        line = json.dumps(select_fields(record, self.fields), default=str)
+        if self.output_format == 'ndjson':
+            self.stream.write(line + '\n')
+        else:
+            self.stream.write(('[\n' if self.count == 0 else ',\n') + line)
+        self.count += 1
+        self.stream.flush()
+
+    def write_all(self, records: Iterable[Dict]) -> None:
+        """Write every record of an iterable."""
+        for record in records:
+            self.write(record)
+
+    def close(self) -> None:
+        """Finish the output (closes the JSON array)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.output_format == 'json':
+            self.stream.write('[]\n' if self.count == 0 else '\n]\n')
+            self.stream.flush()
+
+
+def format_records_table(records: List[Dict], fields: List[str]) -> None:
+    """Display records as a table of the given fields, with columns as wide as their values."""
+    if not records:
+        print("No results.")
+        return
+
+    rows = [['' if r.get(f) is None else str(r.get(f)) for f in fields] for r in records]
+    widths = [max(len(field), *(len(row[i]) for row in rows)) for i, field in enumerate(fields)]
+    print('  '.join(field.ljust(width) for field, width in zip(fields, widths)).rstrip())
+    print('-' * min(sum(widths) + 2 * (len(widths) - 1), 120))
+    for row in rows:
+        print('  '.join(value.ljust(width) for value, width in zip(row, widths)).rstrip())
@@ -1,30 +1,276 @@
 """
 Paramify API Client for managing assessments and intake uploads.
 """
+import os
+import io
+import json
+import mmap
+import time
+import uuid
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.filepost import encode_multipart_formdata
 import logging
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, List, Tuple, Iterator, Callable, IO
+from deadline import Deadline, request_timeout, deadline_errors
+from preflight import preflight_bytes, preflight_file
+import progress
+from compression import gzip_stream
+from scan_summary import ScanSummary, new_summary
 
 logger = logging.getLogger(__name__)
 
+# Artifact metadata key a scan summary is attached under
+ARTIFACT_SUMMARY_KEY = 'scanSummary'
+
+# Bytes reserved in a streamed artifact part for the scan summary, which is
+# only known once the file part has been sent (see _MultipartFileBody)
+SUMMARY_RESERVE = 512
+
+
+class _MappedFile:
+    """
+    Read-only view of a file through a memory map.
+
+    read() returns zero-copy memoryview slices of the mapping, so the file
+    contents are paged in by the OS as the socket sends them and are never
+    copied into Python bytes objects.
+    """
+
+    def __init__(self, file_path: str):
+        self._file = open(file_path, 'rb')
+        self._size = os.fstat(self._file.fileno()).st_size
+        # Zero-length files cannot be mapped
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+        self._view = memoryview(self._map) if self._map else memoryview(b'')
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> memoryview:
+        """Return the next size bytes (all remaining bytes if size < 0) as a memoryview."""
+        end = self._size if size < 0 else min(self._pos + size, self._size)
+        chunk = self._view[self._pos:end]
+        self._pos = end
+        return chunk
+
+    def close(self) -> None:
+        """Release the mapping and close the file."""
+        self._view.release()
+        if self._map:
+            try:
+                self._map.close()
+            except BufferError:
+                # A slice is still referenced somewhere; the mapping is freed with it
+                pass
+        self._file.close()
+
+
+class _MultipartFileBody:
+    """
+    File-like multipart/form-data body that streams the intake file from disk.
+
+    requests reads the whole file into memory when it is passed via files=,
+    so the body is assembled here instead: the part headers and the artifact
+    part are small in-memory buffers, and the file part is served from a
+    memory map in chunks as the connection asks for it.
+
+    With a summary, every file chunk is also fed to it as it is sent. The
+    artifact part comes after the file part, so it is only built once the
+    file has been sent; to attach the summary to it, the artifact JSON is
+    given SUMMARY_RESERVE bytes of room (padded with whitespace, which JSON
+    ignores), keeping the body length known up front.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        filename: str,
+        content_type: str,
+        artifact_data: Dict,
+        deadline: Optional[Deadline] = None,
+        summary: Optional[ScanSummary] = None,
+        attach_summary: bool = False
+    ):
+        self.boundary = uuid.uuid4().hex
+        self._deadline = deadline
+        self._artifact_data = artifact_data
+        self._summary = summary
+        self._attach_summary = attach_summary and summary is not None
+        # Summary of the file, once it has been read in full
+        self.summary: Optional[Dict] = None
+        quoted_name = filename.replace('\\', '\\\\').replace('"', '%22')
+
+        head = (
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="file"; filename="{quoted_name}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode('utf-8')
+        self._artifact_head = (
+            f'\r\n--{self.boundary}\r\n'
+            'Content-Disposition: form-data; name="artifact"; filename="artifact.json"\r\n'
+            'Content-Type: application/json\r\n\r\n'
+        ).encode('utf-8')
+        self._closing = f'\r\n--{self.boundary}--\r\n'.encode('utf-8')
+        self._artifact_length = len(json.dumps(artifact_data).encode('utf-8'))
+        if self._attach_summary:
+            self._artifact_length += SUMMARY_RESERVE
+
+        self._file = _MappedFile(file_path)
+        self._length = (
+            len(head) + len(self._file) + len(self._artifact_head) + self._artifact_length + len(self._closing)
+        )
+        # The artifact part (None) is built when the file part has been read
+        self._parts = [io.BytesIO(head), self._file, None]
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value including the boundary."""
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1):
+        """
+        Read up to size bytes of the body (all remaining bytes if size < 0).
+
+        Chunks never span two parts, so file data is handed out as-is
+        without being joined into a new bytes object. The deadline, if any,
+        is checked before every chunk so a slow upload stops when it passes.
+        """
+        if self._deadline:
+            self._deadline.check('Upload')
+        if size < 0:
+            return b''.join(bytes(part.read()) for part in self._remaining_parts())
+
+        while self._parts:
+            if self._parts[0] is None:
+                self._parts[0] = io.BytesIO(self._artifact_part())
+            chunk = self._parts[0].read(size)
+            if len(chunk):
+                if self._summary and self._parts[0] is self._file:
+                    self._summary.feed(chunk)
+                return chunk
+            self._parts.pop(0)
+        return b''
+
+    def _remaining_parts(self):
+        """Yield the unread parts, feeding the rest of the file to the summary."""
+        while self._parts:
+            part = self._parts.pop(0)
+            if part is None:
+                part = io.BytesIO(self._artifact_part())
+            elif self._summary and part is self._file:
+                data = part.read()
+                self._summary.feed(data)
+                part = io.BytesIO(data)
+            yield part
+
+    def _artifact_part(self) -> bytes:
+        """Build the artifact part and closing boundary, with the summary if it is attached."""
+        artifact_data = self._artifact_data
+        if self._summary:
+            self.summary = self._summary.close()
+        if self._attach_summary and self.summary:
+            with_summary = {**artifact_data, ARTIFACT_SUMMARY_KEY: self.summary}
+            if len(json.dumps(with_summary).encode('utf-8')) <= self._artifact_length:
+                artifact_data = with_summary
+        artifact_json = json.dumps(artifact_data).encode('utf-8').ljust(self._artifact_length)
+        return self._artifact_head + artifact_json + self._closing
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+
+class _RateLimiter:
+    """Spaces requests out so that at most `rate` start per second, across threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self, deadline: Optional[Deadline] = None) -> None:
+        """Block until the next request may start."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            if deadline:
+                deadline.sleep(start - now)
+            else:
+                time.sleep(start - now)
+
 
 class ParamifyClient:
     """Client for interacting with Paramify API."""
 
-    def __init__(self, api_key: str, base_url: str = "https://stage.paramify.com/api/v0"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://stage.paramify.com/api/v0",
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        pool_size: int = 10,
+        rate_limit: Optional[float] = None,
+        compress_uploads: bool = False,
+        attach_summary: bool = False
+    ):
         """
         Initialize Paramify client.
 
         Args:
             api_key: Paramify API key (Bearer token)
             base_url: Paramify API base URL
+            timeouts: (connect, read) timeouts by endpoint class ('api',
+                'upload'); see deadline.DEFAULT_TIMEOUTS
+            pool_size: Keep-alive connections kept open to the API
+            rate_limit: Optional maximum number of requests started per second
+            compress_uploads: Send intake uploads gzip-compressed. The first
+                upload probes for support; if the server rejects it, it is
+                resent uncompressed and later uploads are not compressed.
+            attach_summary: Add the scan summary of each uploaded .nessus or
+                .csv file to its artifact metadata (as ARTIFACT_SUMMARY_KEY)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.timeouts = timeouts or {}
         self.headers = {
             'Authorization': f'Bearer {api_key}',
             'Accept': 'application/json'
         }
+        self.session = requests.Session()
+        self.session.mount(self.base_url, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        self.rate_limiter = _RateLimiter(rate_limit) if rate_limit else None
+        self.compress_uploads = compress_uploads
+        self.attach_summary = attach_summary
+        # Whether the server accepts gzip uploads (None until an upload has shown it)
+        self.gzip_supported: Optional[bool] = None
+
+    def resolve(self, target: str) -> Tuple['ParamifyClient', str]:
+        """
+        Find the client and assessment UUID of an assessment target.
+
+        A single client serves every target itself; see ParamifyTenants
+        for targets naming a tenant.
+
+        Args:
+            target: Assessment UUID
+
+        Returns:
+            Tuple of (this client, target)
+        """
+        return self, target
+
+    def _throttle(self, deadline: Optional[Deadline] = None) -> None:
+        """Wait for the rate limit, if any, before starting a request."""
+        if self.rate_limiter:
+            self.rate_limiter.wait(deadline)
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
@@ -48,9 +294,11 @@ class ParamifyClient:
         if 'headers' in kwargs:
             headers.update(kwargs.pop('headers'))
         kwargs['headers'] = headers
+        kwargs.setdefault('timeout', request_timeout(self.timeouts, 'api'))
 
         logger.debug(f"Making {method} request to {url}")
-        response = requests.request(method, url, **kwargs)
+        self._throttle()
+        response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
         return response
 
@@ -90,7 +338,8 @@ class ParamifyClient:
         file_content: bytes,
         filename: str,
         artifact_metadata: Optional[Dict] = None,
-        effective_date: Optional[str] = None
+        effective_date: Optional[str] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict:
         """
         Submit intake data for an assessment.
@@ -104,16 +353,214 @@ class ParamifyClient:
             filename: Original filename (will be preserved)
             artifact_metadata: Optional metadata for creating the artifact
             effective_date: Optional effective date (format: YYYY-MM-DD)
+            deadline: Optional job deadline the request timeout is clamped to
+
+        Returns:
+            Response data from the API, with a 'summary' entry holding the
+            scan summary of .nessus and .csv files (see scan_summary)
+
+        Raises:
+            PreflightError: If the content is a truncated or malformed scan
+                file (nothing is sent)
+        """
+        preflight_bytes(file_content, filename)
+        logger.info(f"Uploading intake file '{filename}' to assessment: {assessment_id}")
+
+        content_type = self._content_type(filename)
+        artifact_data = self._artifact_data(artifact_metadata, effective_date)
+
+        # The content is already in memory, so it is summarized before it is sent
+        summary = None
+        scan_summary = new_summary(filename)
+        if scan_summary:
+            scan_summary.feed(file_content)
+            summary = scan_summary.close()
+        if self.attach_summary and summary:
+            artifact_data = {**artifact_data, ARTIFACT_SUMMARY_KEY: summary}
+
+        # Prepare multipart form data (encoded the same way requests encodes files=,
+        # but sent as a sized stream so upload progress can be reported)
+        # The 'artifact' must be sent as a file-like part with application/json content-type
+        artifact_json = json.dumps(artifact_data)
+        body, body_content_type = encode_multipart_formdata({
+            'file': (filename, file_content, content_type),
+            'artifact': ('artifact.json', artifact_json.encode('utf-8'), 'application/json')
+        })
+
+        url = f"{self.base_url}/assessment/{assessment_id}/intake"
+        logger.debug(f"Making POST request to {url}")
+        logger.debug(f"Files: file={filename}, artifact={artifact_data}")
+
+        response = self._post_intake(
+            url, filename, lambda: (io.BytesIO(body), len(body), body_content_type), deadline
+        )
+
+        # Log response details for debugging
+        logger.debug(f"Response status: {response.status_code}")
+        logger.debug(f"Response headers: {response.headers}")
+        logger.debug(f"Response body: {response.text}")
+
+        response.raise_for_status()
+
+        logger.info(f"Successfully uploaded intake file to assessment: {assessment_id}")
+        return self._with_summary(response.json(), summary)
+
+    def upload_intake_file(
+        self,
+        assessment_id: str,
+        file_path: str,
+        filename: Optional[str] = None,
+        artifact_metadata: Optional[Dict] = None,
+        effective_date: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict:
+        """
+        Submit intake data for an assessment, streaming the file from disk.
+
+        Same as upload_intake(), but the file is never read into memory as a
+        whole, so it is suitable for multi-GB scan exports. The scan summary
+        is computed from the chunks as they are sent.
+
+        Args:
+            assessment_id: Assessment UUID
+            file_path: Path of the file to upload
+            filename: Filename to upload as (default: basename of file_path)
+            artifact_metadata: Optional metadata for creating the artifact
+            effective_date: Optional effective date (format: YYYY-MM-DD)
+            deadline: Optional job deadline; the upload stops when it passes
+                or is cancelled
 
         Returns:
-            Response data from the API
+            Response data from the API, with a 'summary' entry holding the
+            scan summary of .nessus and .csv files (see scan_summary)
+
+        Raises:
+            PreflightError: If the file is a truncated or malformed scan file
+                (nothing is sent)
         """
+        filename = filename or os.path.basename(file_path)
+        preflight_file(file_path, filename)
         logger.info(f"Uploading intake file '{filename}' to assessment: {assessment_id}")
 
-        import json
-        import io
+        artifact_data = self._artifact_data(artifact_metadata, effective_date)
+        content_type = self._content_type(filename)
+        bodies: List[_MultipartFileBody] = []
+
+        def open_body() -> Tuple[IO[bytes], int, str]:
+            body = _MultipartFileBody(
+                file_path, filename, content_type, artifact_data, deadline,
+                new_summary(filename), self.attach_summary
+            )
+            bodies.append(body)
+            return body, len(body), body.content_type
+
+        url = f"{self.base_url}/assessment/{assessment_id}/intake"
+        logger.debug(f"Making POST request to {url}")
+        logger.debug(f"Files: file={filename}, artifact={artifact_data}")
+
+        response = self._post_intake(url, filename, open_body, deadline)
+
+        logger.debug(f"Response status: {response.status_code}")
+        logger.debug(f"Response body: {response.text}")
+
+        response.raise_for_status()
+
+        logger.info(f"Successfully uploaded intake file to assessment: {assessment_id}")
+        return self._with_summary(response.json(), bodies[-1].summary)
+
+    @staticmethod
+    def _with_summary(result: Dict, summary: Optional[Dict]) -> Dict:
+        """Add the scan summary of an upload to its result."""
+        if summary:
+            result['summary'] = summary
+        return result
+
+    def _post_intake(
+        self,
+        url: str,
+        filename: str,
+        open_body: Callable[[], Tuple[IO[bytes], int, str]],
+        deadline: Optional[Deadline] = None
+    ) -> requests.Response:
+        """
+        POST an intake body, gzip-compressed if enabled and not known to be unsupported.
+
+        A server that does not accept compressed uploads answers 415 (or 400).
+        The first time that happens the body is resent uncompressed and
+        compression is turned off for this client. If the uncompressed
+        upload is rejected with the same status, the file was the problem,
+        not the compression, and the next upload probes again.
+
+        Args:
+            url: Intake URL
+            filename: Uploaded filename, for errors and progress
+            open_body: Returns a fresh (body, length, Content-Type) for each attempt
+            deadline: Optional job deadline
 
-        # Determine content type based on file extension
+        Returns:
+            The final response (not checked for errors)
+        """
+        compress = self.compress_uploads and self.gzip_supported is not False
+        response = self._send_intake(url, filename, open_body, compress, deadline)
+        if not compress:
+            return response
+        if response.ok:
+            self.gzip_supported = True
+        elif response.status_code in (400, 415) and self.gzip_supported is None:
+            logger.info(
+                f"{self.base_url} rejected a compressed upload ({response.status_code}), "
+                f"sending {filename} uncompressed"
+            )
+            self.gzip_supported = False
+            retry = self._send_intake(url, filename, open_body, False, deadline)
+            if retry.status_code == response.status_code:
+                self.gzip_supported = None
+            return retry
+        return response
+
+    def _send_intake(
+        self,
+        url: str,
+        filename: str,
+        open_body: Callable[[], Tuple[IO[bytes], int, str]],
+        compress: bool,
+        deadline: Optional[Deadline] = None
+    ) -> requests.Response:
+        """Make one intake POST, reporting upload progress in uncompressed bytes."""
+        body, length, content_type = open_body()
+        headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Accept': 'application/json',
+            'Content-Type': content_type
+        }
+        try:
+            with deadline_errors(deadline, f"Upload of {filename}"), \
+                    progress.transfer('upload', filename, length) as tracked:
+                self._throttle(deadline)
+                if compress:
+                    # Sent with chunked transfer encoding, as the compressed length is not known up front
+                    headers['Content-Encoding'] = 'gzip'
+                    data = gzip_stream(body, tracked)
+                else:
+                    data = progress.ProgressBody(body, tracked)
+                return self.session.post(
+                    url, data=data, headers=headers,
+                    timeout=request_timeout(self.timeouts, 'upload', deadline)
+                )
+        finally:
+            body.close()
+
+    @staticmethod
+    def _content_type(filename: str) -> str:
+        """
+        Determine the upload content type based on file extension.
+
+        Args:
+            filename: Upload filename
+
+        Returns:
+            MIME type string
+        """
         content_type = 'application/octet-stream'
         if filename.lower().endswith('.csv'):
             content_type = 'text/csv'
@@ -123,41 +570,179 @@ class ParamifyClient:
             content_type = 'application/xml'
         elif filename.lower().endswith('.nessus'):
             content_type = 'application/xml'  # .nessus files are XML
+        return content_type
+
+    @staticmethod
+    def _artifact_data(artifact_metadata: Optional[Dict], effective_date: Optional[str]) -> Dict:
+        """
+        Prepare artifact metadata with effectiveDate.
+
+        Args:
+            artifact_metadata: Optional metadata for creating the artifact
+            effective_date: Optional effective date (format: YYYY-MM-DD)
 
-        # Prepare artifact metadata with effectiveDate
+        Returns:
+            Artifact metadata dictionary
+        """
         artifact_data = artifact_metadata if artifact_metadata else {}
         if effective_date:
             artifact_data['effectiveDate'] = effective_date
+        return artifact_data
 
-        # Prepare multipart form data
-        # The 'artifact' must be sent as a file-like part with application/json content-type
-        artifact_json = json.dumps(artifact_data)
-        files = {
-            'file': (filename, file_content, content_type),
-            'artifact': ('artifact.json', io.BytesIO(artifact_json.encode('utf-8')), 'application/json')
-        }
 
-        data = {}
+class ParamifyTenants:
+    """
+    Several Paramify tenants behind the ParamifyClient interface.
 
-        # Build custom headers for multipart/form-data
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Accept': 'application/json'
+    Assessments are addressed as 'TENANT:ASSESSMENT_UUID' targets; a bare
+    UUID belongs to the first tenant. Each tenant has its own client, so
+    its own connection pool and rate limit, and uploads to different
+    tenants never wait on each other's connections.
+    """
+
+    def __init__(
+        self,
+        profiles: Dict[str, Dict],
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        pool_size: int = 10
+    ):
+        """
+        Create a client for every tenant.
+
+        Args:
+            profiles: Tenant name -> dict with api_key, base_url,
+                rate_limit (requests per second, or None), compress_uploads
+                and attach_summary (see ParamifyClient)
+            timeouts: (connect, read) timeouts by endpoint class, shared by all tenants
+            pool_size: Keep-alive connections each tenant's client keeps open
+
+        Raises:
+            ValueError: If no tenants are given
+        """
+        if not profiles:
+            raise ValueError("No Paramify tenants configured")
+        self.clients = {
+            name: ParamifyClient(
+                api_key=profile['api_key'],
+                base_url=profile['base_url'],
+                timeouts=timeouts,
+                pool_size=pool_size,
+                rate_limit=profile.get('rate_limit'),
+                compress_uploads=profile.get('compress_uploads', False),
+                attach_summary=profile.get('attach_summary', False)
+            )
+            for name, profile in profiles.items()
         }
 
-        url = f"{self.base_url}/assessment/{assessment_id}/intake"
-        logger.debug(f"Making POST request to {url}")
-        logger.debug(f"Files: file={filename}, artifact={artifact_data}")
-        logger.debug(f"Data: {data}")
+    @property
+    def tenant_names(self) -> List[str]:
+        """Names of the configured tenants."""
+        return list(self.clients)
 
-        response = requests.post(url, files=files, data=data, headers=headers)
+    def resolve(self, target: str) -> Tuple[ParamifyClient, str]:
+        """
+        Find the tenant client and assessment UUID of an assessment target.
 
-        # Log response details for debugging
-        logger.debug(f"Response status: {response.status_code}")
-        logger.debug(f"Response headers: {response.headers}")
-        logger.debug(f"Response body: {response.text}")
+        Args:
+            target: 'TENANT:ASSESSMENT_UUID', or an assessment UUID of the first tenant
 
-        response.raise_for_status()
+        Returns:
+            Tuple of (tenant's client, assessment UUID)
 
-        logger.info(f"Successfully uploaded intake file to assessment: {assessment_id}")
-        return response.json()
+        Raises:
+            ValueError: If the target names an unknown tenant
+        """
+        tenant, sep, assessment_id = target.partition(':')
+        if not sep:
+            return next(iter(self.clients.values())), target
+        if tenant not in self.clients:
+            raise ValueError(
+                f"Unknown Paramify tenant '{tenant}' in '{target}'. Configured: {', '.join(self.clients)}"
+            )
+        return self.clients[tenant], assessment_id
+
+    def list_assessments(self, params: Optional[Dict] = None, tenants: Optional[List[str]] = None) -> List[Dict]:
+        """
+        List the assessments of several tenants in parallel.
+
+        Each assessment is tagged with a 'tenant' key, and its 'id' is the
+        'TENANT:ASSESSMENT_UUID' target, so it can be passed back to the
+        upload methods as is. A tenant that fails is logged and left out.
+
+        Args:
+            params: Optional query parameters for filtering
+            tenants: Tenants to list (default: all)
+
+        Returns:
+            List of assessment dictionaries, in tenant order
+
+        Raises:
+            ValueError: If a tenant name is unknown
+            RuntimeError: With the first tenant's error, if every tenant failed
+        """
+        names = tenants or self.tenant_names
+        listed = {}
+        errors = []
+        for name, assessments, error in self.iter_assessments(params, names):
+            if error:
+                errors.append(error)
+            else:
+                listed[name] = assessments
+        if errors and len(errors) == len(names):
+            raise RuntimeError(errors[0])
+        return [a for name in names if name in listed for a in listed[name]]
+
+    def iter_assessments(
+        self,
+        params: Optional[Dict] = None,
+        tenants: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, Optional[List[Dict]], Optional[str]]]:
+        """
+        List the assessments of several tenants in parallel, yielding each tenant's as soon as it answers.
+
+        Assessments are tagged as in list_assessments().
+
+        Args:
+            params: Optional query parameters for filtering
+            tenants: Tenants to list (default: all)
+
+        Yields:
+            Tuples of (tenant name, assessments, None), or (tenant name,
+            None, error message) for a tenant that failed
+
+        Raises:
+            ValueError: If a tenant name is unknown
+        """
+        names = tenants or self.tenant_names
+        unknown = [name for name in names if name not in self.clients]
+        if unknown:
+            raise ValueError(
+                f"Unknown Paramify tenant '{unknown[0]}'. Configured: {', '.join(self.clients)}"
+            )
+
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            futures = {pool.submit(self.clients[name].list_assessments, params): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    listed = future.result()
+                except Exception as e:
+                    logger.warning(f"Paramify tenant '{name}' failed: {e}")
+                    yield name, None, str(e)
+                    continue
+                yield name, [{**a, 'id': f"{name}:{a.get('id')}", 'tenant': name} for a in listed], None
+
+    def get_assessment(self, assessment_id: str) -> Dict:
+        """Get a single assessment by target (see resolve())."""
+        client, assessment_id = self.resolve(assessment_id)
+        return client.get_assessment(assessment_id)
+
+    def upload_intake(self, assessment_id: str, *args, **kwargs) -> Dict:
+        """Upload in-memory intake data to an assessment target (see ParamifyClient.upload_intake())."""
+        client, assessment_id = self.resolve(assessment_id)
+        return client.upload_intake(assessment_id, *args, **kwargs)
+
+    def upload_intake_file(self, assessment_id: str, *args, **kwargs) -> Dict:
+        """Stream an intake file to an assessment target (see ParamifyClient.upload_intake_file())."""
+        client, assessment_id = self.resolve(assessment_id)
+        return client.upload_intake_file(assessment_id, *args, **kwargs)
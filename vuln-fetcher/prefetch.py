@@ -0,0 +1,63 @@
+"""
+Background prefetching for the interactive flows.
+
+Listings a later prompt will need (scans, assessments) are started as soon
+as a flow begins, so they load while the user is still reading or typing
+and are usually ready by the time they are shown.
+"""
+import threading
+from typing import Any, Callable, Optional
+
+
+class Prefetch:
+    """Runs one call in a background thread and hands over its result on demand."""
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        """
+        Start the call.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        self._result = None
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+        # A daemon thread, so quitting at a prompt never waits for a listing nobody needs
+        self._thread = threading.Thread(target=self._run, args=(fn, args, kwargs), daemon=True)
+        self._thread.start()
+
+    def _run(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        """Run the call, keeping its result or exception."""
+        try:
+            self._result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        """Whether the call has finished."""
+        return self._done.is_set()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the call to finish.
+
+        Args:
+            timeout: Optional maximum number of seconds to wait
+
+        Returns:
+            The call's return value
+
+        Raises:
+            TimeoutError: If the call does not finish within timeout
+            Exception: Whatever the call raised
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Prefetch did not finish within {timeout}s")
+        if self._error is not None:
+            raise self._error
+        return self._result
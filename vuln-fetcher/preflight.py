@@ -0,0 +1,181 @@
+"""
+Preflight validation of scan files before they are uploaded.
+
+A truncated .nessus export, a file that is not XML at all, or a CSV with
+the wrong header is otherwise only noticed after the whole file has been
+uploaded and Paramify has rejected it. The checks here read just the first
+and last few KB of a file, so they cost the same for a 1 KB and a 10 GB
+scan, and run before any upload bytes are sent.
+"""
+import io
+import os
+import re
+import csv
+import codecs
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+# Bytes read from the start and the end of a file
+HEAD_BYTES = 64 * 1024
+TAIL_BYTES = 4 * 1024
+
+NESSUS_ROOT = 'NessusClientData_v2'
+
+# A scan CSV needs a column naming the host and one identifying the finding
+CSV_HOST_COLUMNS = ('Host', 'IP Address', 'FQDN')
+CSV_FINDING_COLUMNS = ('Plugin ID', 'Name')
+
+# Leading bytes of formats that are sometimes uploaded by mistake
+BINARY_SIGNATURES = {
+    b'\x1f\x8b': 'gzip-compressed',
+    b'PK\x03\x04': 'a ZIP archive',
+    b'\xff\xfe': 'UTF-16 encoded (Paramify expects UTF-8)',
+    b'\xfe\xff': 'UTF-16 encoded (Paramify expects UTF-8)',
+}
+
+_XML_ENCODING = re.compile(rb'^<\?xml[^>]*encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']')
+
+
+class PreflightError(ValueError):
+    """A file that Paramify would reject, caught before it is uploaded."""
+
+
+def preflight_file(path: str, filename: Optional[str] = None) -> None:
+    """
+    Check that a .nessus, .xml or .csv file looks complete and well-formed.
+
+    Other file types are not checked.
+
+    Args:
+        path: File to check
+        filename: Name the file is uploaded as (default: basename of path);
+            its extension selects the checks
+
+    Raises:
+        PreflightError: If the file would be rejected
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        head = f.read(HEAD_BYTES)
+        tail_start = max(size - TAIL_BYTES, 0)
+        f.seek(tail_start)
+        tail = f.read(TAIL_BYTES)
+    _check(filename or os.path.basename(path), head, tail, tail_start, size)
+
+
+def preflight_bytes(content: bytes, filename: str) -> None:
+    """
+    Check in-memory file content the same way as preflight_file().
+
+    Args:
+        content: File content
+        filename: Name the content is uploaded as
+
+    Raises:
+        PreflightError: If the content would be rejected
+    """
+    tail_start = max(len(content) - TAIL_BYTES, 0)
+    _check(filename, content[:HEAD_BYTES], content[tail_start:], tail_start, len(content))
+
+
+def _check(filename: str, head: bytes, tail: bytes, tail_start: int, size: int) -> None:
+    """Run the checks for the file type of filename."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in ('.nessus', '.xml', '.csv'):
+        return
+    if size == 0:
+        raise PreflightError(f"{filename} is empty")
+    for signature, description in BINARY_SIGNATURES.items():
+        if head.startswith(signature):
+            raise PreflightError(f"{filename} is {description}")
+    if b'\x00' in head:
+        raise PreflightError(f"{filename} contains binary data")
+
+    complete = size <= len(head)
+    if extension == '.csv':
+        encoding = 'utf-8-sig'
+        text = _decode(filename, head, encoding, complete)
+        _check_csv_header(filename, text, complete)
+    else:
+        declared = _XML_ENCODING.match(head.lstrip(codecs.BOM_UTF8))
+        encoding = declared.group(1).decode('ascii') if declared else 'utf-8'
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            raise PreflightError(f"{filename} declares an unknown encoding: {encoding}")
+        _decode(filename, head, encoding, complete)
+        root = _check_xml_head(filename, head, complete)
+        if extension == '.nessus' and root != NESSUS_ROOT:
+            raise PreflightError(f"{filename} is not a Nessus file (root element <{root}>, expected <{NESSUS_ROOT}>)")
+        _check_xml_tail(filename, tail, root if extension == '.nessus' else None)
+
+    if not complete and codecs.lookup(encoding).name.startswith('utf-8'):
+        _decode(filename, _skip_partial_char(tail) if tail_start else tail, encoding, True, tail_start)
+
+
+def _decode(filename: str, data: bytes, encoding: str, final: bool, offset: int = 0) -> str:
+    """Decode a chunk, allowing a character cut off at its end unless final."""
+    try:
+        return codecs.getincrementaldecoder(encoding)().decode(data, final)
+    except UnicodeDecodeError as e:
+        raise PreflightError(f"{filename} is not valid {encoding} text (byte {offset + e.start})")
+
+
+def _skip_partial_char(data: bytes) -> bytes:
+    """Drop UTF-8 continuation bytes left at the start of a chunk by cutting a character."""
+    start = 0
+    while start < min(len(data), 3) and data[start] & 0xC0 == 0x80:
+        start += 1
+    return data[start:]
+
+
+def _check_xml_head(filename: str, head: bytes, complete: bool) -> str:
+    """
+    Check that the start of an XML file is well-formed and find its root element.
+
+    Returns:
+        Root element name
+    """
+    parser = ET.XMLPullParser(events=('start',))
+    try:
+        parser.feed(head)
+        if complete:
+            parser.close()
+        root = next((elem.tag for _, elem in parser.read_events()), None)
+    except ET.ParseError as e:
+        raise PreflightError(f"{filename} is not well-formed XML ({e})")
+    if root is None:
+        raise PreflightError(f"{filename} has no root element in its first {len(head)} bytes")
+    return root
+
+
+def _check_xml_tail(filename: str, tail: bytes, root: Optional[str]) -> None:
+    """Check that an XML file ends with its closing root tag, i.e. was not truncated."""
+    end = tail.rstrip()
+    expected = f'</{root}>'.encode('ascii') if root else b'>'
+    if not end.endswith(expected):
+        raise PreflightError(
+            f"{filename} is truncated (does not end with {expected.decode('ascii')})"
+        )
+
+
+def _check_csv_header(filename: str, text: str, complete: bool) -> None:
+    """Check that a CSV starts with a header naming a host and a finding column."""
+    if not complete and '\n' not in text:
+        raise PreflightError(f"{filename} has no CSV header row in its first {HEAD_BYTES} bytes")
+    try:
+        header = next(csv.reader(io.StringIO(text)), [])
+    except csv.Error as e:
+        raise PreflightError(f"{filename} has an unreadable CSV header ({e})")
+
+    columns = [c.strip() for c in header]
+    if not any(columns):
+        raise PreflightError(f"{filename} has an empty CSV header row")
+    duplicates = sorted({c for c in columns if c and columns.count(c) > 1})
+    if duplicates:
+        raise PreflightError(f"{filename} has duplicate CSV columns: {', '.join(duplicates)}")
+    for required in (CSV_HOST_COLUMNS, CSV_FINDING_COLUMNS):
+        if not any(c in columns for c in required):
+            raise PreflightError(
+                f"{filename} has no {' or '.join(required)} column in its CSV header"
+            )
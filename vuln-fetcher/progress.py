@@ -0,0 +1,383 @@
+"""
+Live progress and throughput reporting for downloads, uploads and export waits.
+
+The clients report every byte they stream and every export they wait for
+to the process-wide reporter installed by the CLI. With no reporter
+installed (the library default, and the `serve` command) tracking costs
+one attribute lookup per chunk.
+
+The reporter aggregates all concurrent transfers of a batch import into
+one status: bytes/s and ETA per direction, the number of exports Nessus
+is still building and how long the oldest has been waiting, and how long
+the most idle transfer has gone without receiving a byte, which tells a
+slow link from a hung job. On a terminal the status is redrawn in place on
+stderr; otherwise a JSON line is written every few seconds. When the run
+ends, a summary of the run's throughput is written.
+"""
+import sys
+import json
+import time
+import threading
+from collections import deque
+from typing import Optional, Dict, List, IO
+
+# Seconds between status updates on a terminal and in line mode
+TTY_INTERVAL = 0.5
+LINE_INTERVAL = 10.0
+
+# Seconds of history the current transfer rate is averaged over, and the
+# resolution it is sampled at (uploads report every 8 KB socket write)
+RATE_WINDOW = 5.0
+SAMPLE_RESOLUTION = 0.1
+
+DIRECTIONS = ('download', 'upload')
+
+# Values of the CLI's --progress option
+PROGRESS_MODES = ('auto', 'bar', 'lines', 'off')
+
+_reporter: Optional['ProgressReporter'] = None
+
+
+def install(reporter: Optional['ProgressReporter']) -> None:
+    """Make a reporter receive the progress of every transfer in the process (None to stop)."""
+    global _reporter
+    _reporter = reporter
+
+
+def transfer(direction: str, name: str, total: Optional[int] = None) -> 'Transfer':
+    """
+    Start tracking a download or an upload.
+
+    Args:
+        direction: 'download' or 'upload'
+        name: What is being transferred, e.g. 'scan 12'
+        total: Size in bytes, if known
+
+    Returns:
+        Transfer to report bytes to; use it as a context manager so it
+        ends when the transfer does
+    """
+    return Transfer(_reporter, direction, name, total)
+
+
+def export_wait(name: str) -> 'Transfer':
+    """
+    Start tracking the wait for a Nessus export to be built.
+
+    Args:
+        name: e.g. 'scan 12'
+
+    Returns:
+        Transfer that ends when the wait does
+    """
+    return Transfer(_reporter, 'export', name)
+
+
+class Transfer:
+    """One download, upload or export wait being tracked."""
+
+    def __init__(self, reporter: Optional['ProgressReporter'], direction: str, name: str, total: Optional[int] = None):
+        self.reporter = reporter
+        self.direction = direction
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.started = self.last_activity = time.monotonic()
+        self.finished = False
+        if reporter:
+            reporter._start(self)
+
+    def __enter__(self) -> 'Transfer':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.finish()
+
+    def advance(self, num_bytes: int) -> None:
+        """Record bytes sent or received."""
+        self.done += num_bytes
+        if self.reporter and num_bytes:
+            self.reporter._advance(self, num_bytes)
+
+    def finish(self) -> None:
+        """End the transfer (repeated calls are ignored)."""
+        if self.reporter and not self.finished:
+            self.reporter._finish(self)
+        self.finished = True
+
+
+def content_length(response) -> Optional[int]:
+    """
+    Size of a streamed response body as iterated by requests, if the server sent it.
+
+    Content-Length of a compressed response counts the compressed bytes,
+    not the decoded ones, so it is not used then.
+    """
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return None
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, ValueError):
+        return None
+
+
+class ProgressReader:
+    """File-like wrapper that reports the bytes read through it to a transfer."""
+
+    def __init__(self, raw: IO[bytes], progress: Transfer):
+        self._raw = raw
+        self._progress = progress
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self._progress.advance(len(data))
+        return data
+
+
+class ProgressBody(ProgressReader):
+    """Request body that reports upload progress; its len() is the transfer's total, so requests sends a Content-Length."""
+
+    def __len__(self) -> int:
+        return self._progress.total
+
+
+class ProgressReporter:
+    """Aggregates the tracked transfers of a run and writes their status to stderr."""
+
+    def __init__(self, mode: str = 'auto', stream: Optional[IO[str]] = None, interval: Optional[float] = None):
+        """
+        Initialize the reporter; start() begins writing.
+
+        Args:
+            mode: 'bar' (redrawn status line), 'lines' (a JSON line per
+                interval), or 'auto' (bar on a terminal, lines otherwise)
+            stream: Where to write (default: stderr)
+            interval: Seconds between updates (default: TTY_INTERVAL for
+                bar, LINE_INTERVAL for lines)
+        """
+        self.stream = stream or sys.stderr
+        if mode == 'auto':
+            mode = 'bar' if getattr(self.stream, 'isatty', lambda: False)() else 'lines'
+        self.mode = mode
+        self.interval = interval or (TTY_INTERVAL if mode == 'bar' else LINE_INTERVAL)
+        self._lock = threading.Lock()
+        self._active: List[Transfer] = []
+        self._totals = {d: {'bytes': 0, 'count': 0, 'first': None, 'last': None} for d in DIRECTIONS}
+        self._export_waits = {'count': 0, 'seconds': 0.0}
+        self._samples = {d: deque() for d in DIRECTIONS}
+        self._started = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._line_width = 0
+
+    def start(self) -> 'ProgressReporter':
+        """Install the reporter and start writing updates."""
+        install(self)
+        self._thread = threading.Thread(target=self._run, name='progress', daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> Optional[Dict]:
+        """
+        Stop writing updates, uninstall the reporter and write the run summary.
+
+        Returns:
+            The summary (see summary()), or None if nothing was transferred
+        """
+        install(None)
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self._clear()
+        summary = self.summary()
+        if summary['downloads'] or summary['uploads'] or summary['export_waits']:
+            self._write_summary(summary)
+            return summary
+        return None
+
+    def __enter__(self) -> 'ProgressReporter':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _start(self, item: Transfer) -> None:
+        with self._lock:
+            self._active.append(item)
+            if item.direction in self._totals:
+                totals = self._totals[item.direction]
+                totals['first'] = totals['first'] or item.started
+
+    def _advance(self, item: Transfer, num_bytes: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            item.last_activity = now
+            if item.direction in self._totals:
+                self._totals[item.direction]['bytes'] += num_bytes
+                samples = self._samples[item.direction]
+                if samples and now - samples[-1][0] < SAMPLE_RESOLUTION:
+                    samples[-1][1] += num_bytes
+                else:
+                    samples.append([now, num_bytes])
+
+    def _finish(self, item: Transfer) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if item in self._active:
+                self._active.remove(item)
+            if item.direction in self._totals:
+                totals = self._totals[item.direction]
+                totals['count'] += 1
+                totals['last'] = now
+            else:
+                self._export_waits['count'] += 1
+                self._export_waits['seconds'] += now - item.started
+
+    def status(self) -> Dict:
+        """
+        Current aggregate status.
+
+        Returns:
+            Dict with, per direction, active transfers, bytes so far,
+            current rate (bytes/s) and ETA (seconds, None if unknown); the
+            number of exports being waited for and the longest wait; and
+            the longest time an active transfer has gone without progress
+        """
+        now = time.monotonic()
+        with self._lock:
+            status = {'elapsed': round(now - self._started, 1)}
+            for direction in DIRECTIONS:
+                samples = self._samples[direction]
+                while samples and samples[0][0] < now - RATE_WINDOW:
+                    samples.popleft()
+                window = min(RATE_WINDOW, now - self._started) or 1.0
+                rate = sum(n for _, n in samples) / window
+                active = [t for t in self._active if t.direction == direction]
+                remaining = [t.total - t.done for t in active if t.total]
+                eta = None
+                if remaining and len(remaining) == len(active) and rate > 0:
+                    eta = round(sum(max(r, 0) for r in remaining) / rate)
+                status[direction] = {
+                    'active': len(active),
+                    'bytes': self._totals[direction]['bytes'],
+                    'rate': round(rate),
+                    'eta': eta
+                }
+            waits = [now - t.started for t in self._active if t.direction == 'export']
+            status['exports_waiting'] = len(waits)
+            status['longest_export_wait'] = round(max(waits), 1) if waits else None
+            # An upload that has been sent in full is waiting for the server to process it
+            idle = [
+                now - t.last_activity for t in self._active
+                if t.direction in DIRECTIONS and not (t.total and t.done >= t.total)
+            ]
+            status['longest_idle'] = round(max(idle), 1) if idle else None
+        return status
+
+    def summary(self) -> Dict:
+        """
+        Throughput of the run so far.
+
+        Returns:
+            Dict with, per direction ('downloads', 'uploads'), the number of
+            finished transfers, bytes, busy seconds (first start to last
+            end) and bytes/s, plus export_waits and export_wait_seconds
+        """
+        summary = {'elapsed': round(time.monotonic() - self._started, 1)}
+        with self._lock:
+            for direction in DIRECTIONS:
+                totals = self._totals[direction]
+                seconds = (totals['last'] - totals['first']) if totals['first'] and totals['last'] else 0.0
+                summary[f'{direction}s'] = totals['count']
+                summary[f'{direction}_bytes'] = totals['bytes']
+                summary[f'{direction}_seconds'] = round(seconds, 1)
+                summary[f'{direction}_rate'] = round(totals['bytes'] / seconds) if seconds > 0 else None
+            summary['export_waits'] = self._export_waits['count']
+            summary['export_wait_seconds'] = round(self._export_waits['seconds'], 1)
+        return summary
+
+    def _run(self) -> None:
+        """Update loop."""
+        while not self._stop.wait(self.interval):
+            status = self.status()
+            if not (status['download']['active'] or status['upload']['active'] or status['exports_waiting']):
+                self._clear()
+                continue
+            if self.mode == 'bar':
+                self._draw(self._format_status(status))
+            else:
+                self._write_line({'event': 'progress', **status})
+
+    def _format_status(self, status: Dict) -> str:
+        """One-line human-readable status."""
+        parts = []
+        for direction, arrow in (('download', '⇣'), ('upload', '⇡')):
+            s = status[direction]
+            if s['active']:
+                eta = f", ETA {format_duration(s['eta'])}" if s['eta'] is not None else ''
+                parts.append(f"{arrow} {s['active']} {direction}ing {format_bytes(s['rate'])}/s "
+                             f"({format_bytes(s['bytes'])}{eta})")
+        if status['exports_waiting']:
+            parts.append(f"⧗ {status['exports_waiting']} exports building "
+                         f"(longest {format_duration(status['longest_export_wait'])})")
+        if status['longest_idle'] is not None and status['longest_idle'] >= 30:
+            parts.append(f"⚠ no data for {format_duration(status['longest_idle'])}")
+        return '  '.join(parts)
+
+    def _draw(self, line: str) -> None:
+        """Redraw the status line in place."""
+        self.stream.write('\r' + line.ljust(self._line_width))
+        self.stream.flush()
+        self._line_width = len(line)
+
+    def _clear(self) -> None:
+        """Remove the status line, if one is drawn."""
+        if self._line_width:
+            self.stream.write('\r' + ' ' * self._line_width + '\r')
+            self.stream.flush()
+            self._line_width = 0
+
+    def _write_line(self, record: Dict) -> None:
+        """Write one structured line."""
+        self.stream.write(json.dumps(record) + '\n')
+        self.stream.flush()
+
+    def _write_summary(self, summary: Dict) -> None:
+        """Write the end-of-run throughput summary."""
+        if self.mode != 'bar':
+            self._write_line({'event': 'summary', **summary})
+            return
+        parts = []
+        for direction in DIRECTIONS:
+            if summary[f'{direction}s']:
+                rate = summary[f'{direction}_rate']
+                parts.append(
+                    f"{direction}ed {format_bytes(summary[f'{direction}_bytes'])} in "
+                    f"{summary[f'{direction}s']} files ({format_bytes(rate) + '/s' if rate else 'n/a'})"
+                )
+        if summary['export_waits']:
+            parts.append(f"waited {format_duration(summary['export_wait_seconds'])} for "
+                         f"{summary['export_waits']} exports")
+        self.stream.write(f"Transfer summary: {', '.join(parts)}\n")
+        self.stream.flush()
+
+
+def format_bytes(num_bytes: Optional[float]) -> str:
+    """Human-readable byte count, e.g. '12.3 MB'."""
+    value = float(num_bytes or 0)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024 or unit == 'GB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Human-readable duration, e.g. '1m05s'."""
+    seconds = int(seconds or 0)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
@@ -0,0 +1,264 @@
+"""
+Scan summaries computed while a file is uploaded.
+
+A summary (host count, findings by severity, and for .nessus files the
+scan window) is built from the same chunks the upload sends, so it costs
+no extra read of the file, however large. .nessus XML is parsed with expat
+callbacks, so no element tree is built; CSV rows are parsed one complete
+record at a time. A file that cannot be parsed simply has no summary; it
+is not an upload error (preflight catches broken files).
+"""
+import os
+import csv
+import codecs
+import logging
+import calendar
+import time
+import xml.parsers.expat as expat
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Set, Tuple
+from findings_index import SEVERITY_LEVELS
+
+logger = logging.getLogger(__name__)
+
+# Severity names by Nessus severity level (0-4)
+SEVERITY_NAMES = ('info', 'low', 'medium', 'high', 'critical')
+
+NESSUS_ROOT = 'NessusClientData_v2'
+
+# <HostProperties> tags holding when a host's scan started and ended
+# (the *_TIMESTAMP tags are Unix times; the others are Nessus date strings)
+START_TAGS = ('HOST_START_TIMESTAMP', 'HOST_START')
+END_TAGS = ('HOST_END_TIMESTAMP', 'HOST_END')
+
+
+def new_summary(filename: str) -> Optional['ScanSummary']:
+    """
+    Create the summary builder for a file type.
+
+    Args:
+        filename: Name of the uploaded file; its extension selects the parser
+
+    Returns:
+        Summary builder, or None for file types that are not summarized
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in ('.nessus', '.xml'):
+        return NessusSummary()
+    if extension == '.csv':
+        return CsvSummary()
+    return None
+
+
+class ScanSummary(ABC):
+    """Builds a summary from a file's content, fed in order in chunks of any size."""
+
+    def __init__(self):
+        self.severity = [0] * len(SEVERITY_NAMES)
+        self.scan_start: Optional[float] = None
+        self.scan_end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def feed(self, data) -> None:
+        """Add the next chunk of the file (bytes or memoryview)."""
+        if self.error is None:
+            try:
+                self._feed(data)
+            except (expat.ExpatError, csv.Error, ValueError) as e:
+                self.error = str(e)
+                logger.debug(f"Not summarizing scan: {e}")
+
+    def close(self) -> Optional[Dict]:
+        """
+        Finish the summary once the whole file has been fed.
+
+        Returns:
+            Dict with hosts, findings, severity (count per severity name) and,
+            when the file records them, scan_start and scan_end (ISO 8601,
+            UTC); None if the file could not be summarized
+        """
+        if self.error is None:
+            try:
+                self._close()
+            except (expat.ExpatError, csv.Error, ValueError) as e:
+                self.error = str(e)
+        if self.error is not None:
+            return None
+        summary = {
+            'hosts': self._host_count(),
+            'findings': sum(self.severity),
+            'severity': dict(zip(reversed(SEVERITY_NAMES), reversed(self.severity)))
+        }
+        if self.scan_start is not None:
+            summary['scan_start'] = _isoformat(self.scan_start)
+        if self.scan_end is not None:
+            summary['scan_end'] = _isoformat(self.scan_end)
+        return summary
+
+    def _count(self, level: Optional[int]) -> None:
+        """Count a finding of a severity level (unknown levels count as info)."""
+        self.severity[level if level is not None and 0 <= level < len(SEVERITY_NAMES) else 0] += 1
+
+    @abstractmethod
+    def _feed(self, data) -> None:
+        """Parse the next chunk; raise expat.ExpatError, csv.Error or ValueError if it is malformed."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Finish parsing; raise like _feed() if the file is incomplete or of the wrong kind."""
+
+    @abstractmethod
+    def _host_count(self) -> int:
+        """Number of distinct hosts seen."""
+
+
+class NessusSummary(ScanSummary):
+    """Summary of a .nessus file: one host per <ReportHost>, one finding per <ReportItem>."""
+
+    def __init__(self):
+        super().__init__()
+        self.hosts = 0
+        self._root: Optional[str] = None
+        self._tag: Optional[str] = None
+        self._text: List[str] = []
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._data
+
+    def _feed(self, data) -> None:
+        if len(data):
+            self._parser.Parse(data, False)
+
+    def _close(self) -> None:
+        self._parser.Parse(b'', True)
+        if self._root != NESSUS_ROOT:
+            raise ValueError(f"not a Nessus file (root element <{self._root}>)")
+
+    def _host_count(self) -> int:
+        return self.hosts
+
+    def _start(self, name: str, attrs: Dict[str, str]) -> None:
+        if self._root is None:
+            self._root = name
+        if name == 'ReportItem':
+            try:
+                self._count(int(attrs.get('severity', 0)))
+            except ValueError:
+                self._count(0)
+        elif name == 'ReportHost':
+            self.hosts += 1
+        elif name == 'tag' and attrs.get('name') in START_TAGS + END_TAGS:
+            self._tag = attrs['name']
+            self._text = []
+
+    def _data(self, text: str) -> None:
+        if self._tag:
+            self._text.append(text)
+
+    def _end(self, name: str) -> None:
+        if name != 'tag' or not self._tag:
+            return
+        when = _host_time(self._tag, ''.join(self._text).strip())
+        if when is not None:
+            if self._tag in START_TAGS:
+                self.scan_start = when if self.scan_start is None else min(self.scan_start, when)
+            else:
+                self.scan_end = when if self.scan_end is None else max(self.scan_end, when)
+        self._tag = None
+
+
+class CsvSummary(ScanSummary):
+    """
+    Summary of a Nessus-style CSV.
+
+    A Nessus CSV has one row per CVE of a finding; consecutive rows of the
+    same host, port, protocol and plugin count as one finding.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.host_names: Set[str] = set()
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+        self._buffer = ''
+        self._record: List[str] = []
+        self._quotes = 0
+        self._columns: Optional[Dict[str, int]] = None
+        self._last_finding: Optional[Tuple] = None
+
+    def _feed(self, data) -> None:
+        self._buffer += self._decoder.decode(bytes(data))
+        lines = self._buffer.split('\n')
+        self._buffer = lines.pop()
+        for line in lines:
+            self._line(line + '\n')
+
+    def _close(self) -> None:
+        self._buffer += self._decoder.decode(b'', True)
+        if self._buffer:
+            self._line(self._buffer)
+            self._buffer = ''
+        if self._record:
+            raise ValueError("CSV ends inside a quoted field")
+        if self._columns is None:
+            raise ValueError("CSV has no header row")
+
+    def _host_count(self) -> int:
+        return len(self.host_names)
+
+    def _line(self, line: str) -> None:
+        """Add a line; a record is complete once its quotes are balanced (quoted fields may span lines)."""
+        self._record.append(line)
+        self._quotes += line.count('"')
+        if self._quotes % 2:
+            return
+        row = next(csv.reader([''.join(self._record)]), [])
+        self._record = []
+        self._quotes = 0
+        if any(value.strip() for value in row):
+            self._row(row)
+
+    def _row(self, row: List[str]) -> None:
+        if self._columns is None:
+            self._columns = {name.strip(): i for i, name in enumerate(row)}
+            return
+
+        def value(*names: str) -> str:
+            for name in names:
+                i = self._columns.get(name)
+                if i is not None and i < len(row) and row[i].strip():
+                    return row[i].strip()
+            return ''
+
+        host = value('Host', 'IP Address', 'FQDN')
+        if not host:
+            return
+        self.host_names.add(host)
+
+        finding = (host, value('Port'), value('Protocol'), value('Plugin ID'))
+        if finding == self._last_finding:
+            return
+        self._last_finding = finding
+
+        risk = value('Risk').lower()
+        if risk in SEVERITY_LEVELS:
+            self._count(SEVERITY_LEVELS[risk])
+        else:
+            severity = value('Severity')
+            self._count(int(severity) if severity.isdigit() else None)
+
+
+def _host_time(tag: str, text: str) -> Optional[float]:
+    """Parse a HOST_START/HOST_END(_TIMESTAMP) tag value into a Unix timestamp."""
+    try:
+        if tag.endswith('_TIMESTAMP'):
+            return float(text)
+        return float(calendar.timegm(time.strptime(text, '%a %b %d %H:%M:%S %Y')))
+    except ValueError:
+        return None
+
+
+def _isoformat(timestamp: float) -> str:
+    """Format a Unix timestamp as ISO 8601 UTC."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace('+00:00', 'Z')
@@ -0,0 +1,299 @@
+"""
+Priority scheduling of import jobs with per-destination concurrency limits.
+
+Batch and watch imports submit their jobs here instead of to a plain thread
+pool. Workers always start the highest-priority job that can run, so scans
+with critical findings or an assessment due soon are imported before large
+informational ones. Each job names the endpoints it uses ('nessus:<scanner>',
+'github', 'paramify:<assessment>'), and no endpoint ever runs more jobs at
+once than its limit; a job whose endpoint is busy waits without holding up
+jobs for other endpoints.
+"""
+import heapq
+import logging
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from datetime import date, datetime, timezone
+from typing import Optional, List, Dict, Callable, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Weight of each finding severity and of the other priority factors:
+#   deadline - added in full when an assessment's deadline is today or past,
+#              divided by the number of days left otherwise
+#   age      - per day since the scan finished (negative: fresher scans first)
+DEFAULT_PRIORITY_WEIGHTS = {
+    'critical': 1000.0,
+    'high': 100.0,
+    'medium': 10.0,
+    'low': 1.0,
+    'info': 0.0,
+    'deadline': 100000.0,
+    'age': -1.0,
+}
+
+SEVERITY_NAMES = ['critical', 'high', 'medium', 'low', 'info']
+
+
+class PriorityPolicy:
+    """Computes job priorities from scan severity counts, assessment deadlines and scan age."""
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        deadlines: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            weights: Overrides of DEFAULT_PRIORITY_WEIGHTS
+            deadlines: Assessment UUID -> deadline date (YYYY-MM-DD)
+
+        Raises:
+            ValueError: If a weight name is unknown or a deadline is not a date
+        """
+        unknown = set(weights or {}) - set(DEFAULT_PRIORITY_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown priority weights: {', '.join(sorted(unknown))}")
+        self.weights = {**DEFAULT_PRIORITY_WEIGHTS, **(weights or {})}
+        self.deadlines = {
+            assessment_id: date.fromisoformat(deadline)
+            for assessment_id, deadline in (deadlines or {}).items()
+        }
+
+    def severity_counts(self, scan_details: Dict) -> Dict[str, int]:
+        """
+        Total the findings of each severity across the hosts of a scan.
+
+        Args:
+            scan_details: Nessus scan details (with a 'hosts' list)
+
+        Returns:
+            Dict of severity name to count
+        """
+        counts = Counter()
+        for host in scan_details.get('hosts') or []:
+            for name in SEVERITY_NAMES:
+                counts[name] += int(host.get(name) or 0)
+        return {name: counts[name] for name in SEVERITY_NAMES}
+
+    def deadline_priority(self, assessment_id: Optional[str], today: Optional[date] = None) -> float:
+        """
+        Priority contributed by an assessment's deadline.
+
+        Args:
+            assessment_id: Target assessment UUID
+            today: Date to count from (default: today)
+
+        Returns:
+            The deadline weight divided by the days left (in full when due
+            or overdue), or 0 if the assessment has no deadline
+        """
+        deadline = self.deadlines.get(assessment_id)
+        if deadline is None:
+            return 0.0
+        days_left = (deadline - (today or date.today())).days
+        return self.weights['deadline'] / max(days_left, 1)
+
+    def scan_priority(self, scan_details: Dict, assessment_id: Optional[str] = None) -> float:
+        """
+        Priority of importing a scan into an assessment.
+
+        Args:
+            scan_details: Nessus scan details
+            assessment_id: Target assessment UUID
+
+        Returns:
+            Priority (higher runs first)
+        """
+        counts = self.severity_counts(scan_details)
+        priority = sum(self.weights[name] * count for name, count in counts.items())
+        priority += self.deadline_priority(assessment_id)
+
+        finished = (scan_details.get('info') or {}).get('scanner_end') or \
+            (scan_details.get('info') or {}).get('timestamp')
+        if finished:
+            age_days = (datetime.now(timezone.utc).timestamp() - float(finished)) / 86400
+            priority += self.weights['age'] * max(age_days, 0)
+        return priority
+
+
+class ImportScheduler:
+    """Thread pool that runs the highest-priority runnable job, within per-endpoint limits."""
+
+    def __init__(self, max_workers: int = 4, limits: Optional[Dict[str, int]] = None):
+        """
+        Start the workers.
+
+        Args:
+            max_workers: Number of worker threads (jobs running at once overall)
+            limits: Concurrency limit by endpoint. A key is either a full
+                endpoint name ('nessus:east', 'paramify:<assessment UUID>')
+                or an endpoint kind ('nessus', 'github', 'paramify') that
+                applies to each endpoint of that kind. Endpoints without a
+                limit are bounded only by max_workers.
+        """
+        self.limits = dict(limits or {})
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[float, int, Dict]] = []
+        self._active: Counter = Counter()
+        self._seq = itertools.count()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"import-scheduler-{i}", daemon=True)
+            for i in range(max(max_workers, 1))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> 'ImportScheduler':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def limit(self, endpoint: str) -> Optional[int]:
+        """
+        Get the concurrency limit of an endpoint.
+
+        Args:
+            endpoint: e.g. 'nessus:east', 'github', 'paramify:<assessment UUID>'
+
+        Returns:
+            Limit, or None if unlimited
+        """
+        if endpoint in self.limits:
+            return self.limits[endpoint]
+        return self.limits.get(endpoint.split(':', 1)[0])
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        priority: float = 0.0,
+        endpoints: Iterable[str] = (),
+        **kwargs
+    ) -> Future:
+        """
+        Queue a job.
+
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+            priority: Higher runs first; equal priorities run in submission order
+            endpoints: Endpoints the job uses for its whole run
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future of the job's result
+
+        Raises:
+            RuntimeError: If the scheduler has been shut down
+        """
+        job = {
+            'fn': fn, 'args': args, 'kwargs': kwargs,
+            'endpoints': list(dict.fromkeys(endpoints)), 'future': Future()
+        }
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit jobs after shutdown")
+            heapq.heappush(self._queue, (-priority, next(self._seq), job))
+            self._cond.notify()
+        return job['future']
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Stop accepting jobs; the workers exit once the queue is empty.
+
+        Args:
+            wait: Wait for queued and running jobs to finish
+            cancel_futures: Cancel jobs that have not started yet
+        """
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                for _, _, job in self._queue:
+                    job['future'].cancel()
+                self._queue = []
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _runnable(self, job: Dict) -> bool:
+        """Whether every endpoint of a job is below its limit."""
+        for endpoint in job['endpoints']:
+            limit = self.limit(endpoint)
+            if limit is not None and self._active[endpoint] >= limit:
+                return False
+        return True
+
+    def _take(self) -> Optional[Dict]:
+        """Remove and return the highest-priority runnable job, if any (lock held)."""
+        skipped = []
+        job = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            if entry[2]['future'].cancelled():
+                continue
+            if self._runnable(entry[2]):
+                job = entry[2]
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+        return job
+
+    def _work(self) -> None:
+        """Worker loop."""
+        while True:
+            with self._cond:
+                job = self._take()
+                while job is None:
+                    if self._shutdown and not self._queue:
+                        return
+                    self._cond.wait()
+                    job = self._take()
+                for endpoint in job['endpoints']:
+                    self._active[endpoint] += 1
+
+            future = job['future']
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(job['fn'](*job['args'], **job['kwargs']))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self._cond:
+                    for endpoint in job['endpoints']:
+                        self._active[endpoint] -= 1
+                    # A finished job may unblock queued jobs for its endpoints
+                    self._cond.notify_all()
+
+
+def parse_limits(values: Dict[str, str]) -> Dict[str, int]:
+    """
+    Convert endpoint limits read from the configuration to integers.
+
+    Args:
+        values: Endpoint -> limit string, e.g. {'nessus': '4', 'paramify:abc': '1'}
+
+    Returns:
+        Endpoint -> limit
+
+    Raises:
+        ValueError: If a limit is not a positive integer
+    """
+    limits = {}
+    for endpoint, value in values.items():
+        try:
+            limits[endpoint] = int(value)
+        except ValueError:
+            limits[endpoint] = 0
+        if limits[endpoint] < 1:
+            raise ValueError(f"Invalid concurrency limit for {endpoint}: {value}")
+    return limits
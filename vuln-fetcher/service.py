@@ -0,0 +1,581 @@
+"""
+Long-running import service with a small local HTTP API.
+
+Where every CLI invocation pays for interpreter startup, configuration
+loading and fresh connections, `main.py serve` does that once: jobs posted
+to the API run on a persistent ImportScheduler and share one integration,
+whose clients keep their connections to Nessus, Paramify and GitHub alive
+between jobs.
+
+Endpoints (JSON in and out):
+    POST   /jobs            Submit one job, or a list of jobs
+    GET    /jobs            List jobs (?status=queued|running|succeeded|failed|cancelled)
+    GET    /jobs/<id>       Status and result of a job
+    DELETE /jobs/<id>       Cancel a queued job, or a running Nessus import
+    GET    /scans           Cached scan listing of every scanner (?refresh=1)
+    GET    /assessments     Cached assessment listing (?refresh=1)
+    GET    /health          Queue counts
+
+Job specs:
+    {"type": "nessus", "scan_id": 12, "assessment_id": "...", "scanner": "east"}
+    {"type": "nessus", "scan_id": 12, "assessment_ids": ["...", "..."]}
+    {"type": "nessus", "scan_id": 12, "assessment_ids": ["acme:...", "globex:..."]}
+    {"type": "github", "repo": "owner/repo@ref", "path": "scans/x.nessus", "assessment_id": "..."}
+    {"type": "file", "path": "/srv/scans/x.nessus", "assessment_id": "..."}
+Every spec may also carry effective_date (YYYY-MM-DD) and priority (a
+number added to the assessment's deadline priority; higher runs first).
+File jobs are refused unless the service has a file root, and may only
+name files inside it.
+"""
+import os
+import json
+import time
+import uuid
+import hmac
+import logging
+import threading
+import urllib.parse
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from integration import NessusParamifyIntegration
+from github_client import GitHubClient
+from github_import import GitHubBulkImporter, parse_repo_spec
+from local_import import import_local_file, is_scan_file, file_key
+from journal import JobJournal
+from ledger import ResultLedger
+from scheduler import ImportScheduler
+from deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+JOB_TYPES = ('nessus', 'github', 'file')
+JOB_STATUSES = ('queued', 'running', 'succeeded', 'failed', 'cancelled')
+
+# Largest request body accepted, so a bad client cannot exhaust memory
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class CachedListing:
+    """Result of a listing call, reused until it is older than the TTL."""
+
+    def __init__(self, fn: Callable[[], Any], ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            fn: Function returning the listing
+            ttl: Seconds a listing is served from the cache
+        """
+        self._fn = fn
+        self.ttl = ttl
+        self._value = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def get(self, refresh: bool = False) -> Tuple[Any, float]:
+        """
+        Get the listing, fetching it if it is missing, stale or refresh is set.
+
+        Concurrent callers of a stale listing wait for a single fetch.
+
+        Returns:
+            Tuple of (listing, time it was fetched as a Unix timestamp)
+        """
+        with self._lock:
+            if refresh or self._fetched_at is None or time.time() - self._fetched_at > self.ttl:
+                self._value = self._fn()
+                self._fetched_at = time.time()
+            return self._value, self._fetched_at
+
+
+class ImportService:
+    """Queue of import jobs run on a persistent worker pool with shared clients."""
+
+    def __init__(
+        self,
+        integration: NessusParamifyIntegration,
+        github_client: GitHubClient,
+        max_workers: int = 4,
+        nessus_enabled: bool = True,
+        journal: Optional[JobJournal] = None,
+        ledger: Optional[ResultLedger] = None,
+        listing_ttl: float = 60,
+        max_finished_jobs: int = 1000,
+        file_root: Optional[str] = None
+    ):
+        """
+        Start the workers.
+
+        Args:
+            integration: Integration whose clients every job shares
+            github_client: Client for GitHub jobs
+            max_workers: Number of jobs run at once
+            nessus_enabled: Whether Nessus credentials are configured (Nessus
+                jobs and the scan listing are refused otherwise)
+            journal: Optional job journal; jobs already uploaded are skipped
+                and interrupted Nessus imports resume
+            ledger: Optional results ledger every finished job is appended to
+            listing_ttl: Seconds the scan and assessment listings are cached
+            max_finished_jobs: Finished jobs kept for status queries (oldest
+                are forgotten first)
+            file_root: Directory file jobs may read from (file jobs are
+                refused if not provided)
+        """
+        self.integration = integration
+        self.nessus_enabled = nessus_enabled
+        self.journal = journal
+        self.ledger = ledger
+        self.max_finished_jobs = max_finished_jobs
+        self.file_root = os.path.realpath(file_root) if file_root else None
+        self.github_importer = GitHubBulkImporter(
+            github_client,
+            integration.paramify_client,
+            journal=journal,
+            transcode_csv=integration.transcode_csv,
+            transcode_columns=integration.transcode_columns,
+            findings_index=integration.findings_index,
+            job_timeout=integration.job_timeout
+        )
+        self.scheduler = ImportScheduler(
+            max_workers, {'nessus': max_workers, **integration.scheduler_limits}
+        )
+        self.scans = CachedListing(integration.list_all_nessus_scans, listing_ttl)
+        self.assessments = CachedListing(integration.list_paramify_assessments, listing_ttl)
+        self._jobs: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the workers, cancelling queued jobs and running Nessus imports.
+
+        Args:
+            wait: Wait for running jobs to stop
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job['status'] == 'running':
+                    job['cancel_event'].set()
+        self.scheduler.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            for job in self._jobs.values():
+                if job['status'] == 'queued':
+                    self._finish(job, 'cancelled', error='Service stopped')
+        self.github_importer.close()
+
+    def submit(self, spec: Dict) -> Dict:
+        """
+        Validate a job spec and queue the job.
+
+        Args:
+            spec: Job spec (see the module docstring)
+
+        Returns:
+            Public view of the queued job
+
+        Raises:
+            ValueError: If the spec is invalid
+        """
+        fn, args, endpoints, priority, item, targets = self._plan(spec)
+        job = {
+            'id': uuid.uuid4().hex[:16],
+            'type': spec['type'],
+            'spec': spec,
+            'status': 'queued',
+            'item': item,
+            'targets': targets,
+            'submitted_at': _now(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None,
+            'cancel_event': threading.Event(),
+            'future': None
+        }
+        with self._lock:
+            self._jobs[job['id']] = job
+            job['future'] = self.scheduler.submit(
+                self._run, job, fn, args, priority=priority, endpoints=endpoints
+            )
+            self._prune()
+        logger.info(f"Queued {job['type']} job {job['id']} ({item})")
+        return self._view(job)
+
+    def submit_many(self, specs: List[Dict]) -> List[Dict]:
+        """
+        Queue several jobs; nothing is queued unless every spec is valid.
+
+        Raises:
+            ValueError: If a spec is invalid (naming its position)
+        """
+        for i, spec in enumerate(specs):
+            try:
+                self._plan(spec)
+            except ValueError as e:
+                raise ValueError(f"Job {i}: {e}")
+        return [self.submit(spec) for spec in specs]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Public view of a job, or None if it is unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._view(job) if job else None
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict]:
+        """
+        List jobs in submission order.
+
+        Args:
+            status: Optional status to filter by
+
+        Raises:
+            ValueError: If the status is unknown
+        """
+        if status and status not in JOB_STATUSES:
+            raise ValueError(f"Unknown status: {status} (expected one of {', '.join(JOB_STATUSES)})")
+        with self._lock:
+            return [self._view(job) for job in self._jobs.values() if not status or job['status'] == status]
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """
+        Cancel a job.
+
+        A queued job never starts. A running Nessus import stops at its next
+        request or download chunk; running GitHub and file jobs finish.
+
+        Returns:
+            Public view of the job, or None if it is unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return None
+            if job['status'] == 'queued' and job['future'].cancel():
+                self._finish(job, 'cancelled', error='Cancelled before it started')
+            elif job['status'] == 'running':
+                job['cancel_event'].set()
+            return self._view(job)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of known jobs in each status."""
+        with self._lock:
+            counts = {status: 0 for status in JOB_STATUSES}
+            for job in self._jobs.values():
+                counts[job['status']] += 1
+            return counts
+
+    def list_scans(self, refresh: bool = False) -> Dict:
+        """
+        Scans of every configured scanner, from the cache when fresh.
+
+        Raises:
+            ValueError: If Nessus is not configured
+        """
+        if not self.nessus_enabled:
+            raise ValueError("Nessus is not configured")
+        (scans, errors), fetched_at = self.scans.get(refresh)
+        return {'scans': scans, 'errors': errors, 'fetched_at': _timestamp(fetched_at)}
+
+    def list_assessments(self, refresh: bool = False) -> Dict:
+        """Paramify assessments, from the cache when fresh."""
+        assessments, fetched_at = self.assessments.get(refresh)
+        return {'assessments': assessments, 'fetched_at': _timestamp(fetched_at)}
+
+    def _plan(self, spec: Dict) -> Tuple[Callable, tuple, List[str], float, str, List[str]]:
+        """
+        Turn a job spec into the call that runs it.
+
+        Returns:
+            Tuple of (function, arguments, scheduler endpoints, priority,
+            ledger item, target assessments)
+
+        Raises:
+            ValueError: If the spec is invalid
+        """
+        if not isinstance(spec, dict):
+            raise ValueError("A job must be a JSON object")
+        job_type = spec.get('type')
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Unknown job type: {job_type} (expected one of {', '.join(JOB_TYPES)})")
+
+        effective_date = spec.get('effective_date')
+        if effective_date is not None:
+            try:
+                date.fromisoformat(effective_date)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid effective_date: {effective_date} (expected YYYY-MM-DD)")
+        try:
+            extra_priority = float(spec.get('priority') or 0)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid priority: {spec.get('priority')}")
+
+        if job_type == 'nessus':
+            if not self.nessus_enabled:
+                raise ValueError("Nessus is not configured")
+            assessment_ids = spec.get('assessment_ids') or [spec.get('assessment_id')]
+        else:
+            assessment_ids = [spec.get('assessment_id')]
+        if not all(isinstance(a, str) and a for a in assessment_ids):
+            raise ValueError("assessment_id is required")
+        for assessment_id in assessment_ids:
+            # Raises ValueError for an unknown tenant
+            self.integration.paramify_client.resolve(assessment_id)
+        priority = extra_priority + max(
+            self.integration.priority_policy.deadline_priority(a) for a in assessment_ids
+        )
+        endpoints = [f"paramify:{a}" for a in assessment_ids]
+
+        if job_type == 'nessus':
+            try:
+                scan_id = int(spec.get('scan_id'))
+            except (TypeError, ValueError):
+                raise ValueError("scan_id must be an integer")
+            scanner = spec.get('scanner') or self.integration.scanner_names[0]
+            self.integration.get_nessus_client(scanner)
+            item = self.integration.scan_key(scanner, scan_id)
+            if len(assessment_ids) > 1:
+                args = (self._import_nessus_multi, scan_id, assessment_ids, effective_date, scanner)
+            else:
+                args = (self._import_nessus, scan_id, assessment_ids[0], effective_date, scanner)
+            return args[0], args[1:], [f"nessus:{scanner}", *endpoints], priority, item, assessment_ids
+
+        path = spec.get('path')
+        if not isinstance(path, str) or not path:
+            raise ValueError("path is required")
+
+        if job_type == 'github':
+            try:
+                parsed = parse_repo_spec(spec.get('repo') or '')
+            except ValueError as e:
+                raise ValueError(str(e))
+            path = path.strip('/')
+            file = {
+                'owner': parsed['owner'],
+                'repo': parsed['repo'],
+                'ref': parsed['ref'],
+                'path': path,
+                'name': os.path.basename(path),
+                'assessment_id': assessment_ids[0]
+            }
+            return (
+                self.github_importer.import_file, (file, effective_date), ['github', *endpoints],
+                priority, GitHubBulkImporter.item_key(file), assessment_ids
+            )
+
+        if not self.file_root:
+            raise ValueError("File jobs are disabled (start the service with --file-root)")
+        # Resolved first, so neither '..' nor a symlink can lead outside the root
+        path = os.path.realpath(path)
+        if os.path.commonpath([path, self.file_root]) != self.file_root:
+            raise ValueError(f"Not inside the file root {self.file_root}: {spec.get('path')}")
+        if not is_scan_file(path):
+            raise ValueError(f"Not a scan file (.nessus or .csv): {path}")
+        if not os.path.isfile(path):
+            raise ValueError(f"No such file: {path}")
+        return (
+            self._import_file, (path, assessment_ids[0], effective_date), endpoints,
+            priority, file_key(path), assessment_ids
+        )
+
+    def _import_nessus(self, scan_id: int, assessment_id: str, effective_date: Optional[str],
+                       scanner: str, cancel_event: threading.Event) -> Dict:
+        """Run a Nessus job with one target assessment."""
+        return self.integration.import_scan_to_assessment(
+            scan_id, assessment_id, effective_date, scanner=scanner,
+            journal=self.journal, cancel_event=cancel_event
+        )
+
+    def _import_nessus_multi(self, scan_id: int, assessment_ids: List[str], effective_date: Optional[str],
+                             scanner: str, cancel_event: threading.Event) -> List[Dict]:
+        """Run a Nessus job with several target assessments; fails if any upload failed."""
+        results = self.integration.import_scan_to_assessments(
+            scan_id, assessment_ids, effective_date, scanner=scanner,
+            journal=self.journal, max_workers=len(assessment_ids), cancel_event=cancel_event
+        )
+        failed = [r for r in results if not r['success']]
+        if failed:
+            raise RuntimeError('; '.join(f"{r['assessment_id']}: {r['error']}" for r in failed))
+        return results
+
+    def _import_file(self, path: str, assessment_id: str, effective_date: Optional[str]) -> Dict:
+        """Run a local file job."""
+        return import_local_file(
+            self.integration.paramify_client, path, assessment_id, effective_date,
+            self.integration.findings_index, self.integration.job_timeout
+        )
+
+    def _run(self, job: Dict, fn: Callable, args: tuple) -> None:
+        """Worker body: run a job and record its outcome."""
+        with self._lock:
+            if job['status'] != 'queued':
+                return
+            job['status'] = 'running'
+            job['started_at'] = _now()
+        logger.info(f"Started {job['type']} job {job['id']}")
+
+        if job['type'] == 'nessus':
+            args = (*args, job['cancel_event'])
+        try:
+            result = fn(*args)
+        except DeadlineExceeded as e:
+            status = 'cancelled' if job['cancel_event'].is_set() else 'failed'
+            self._record(job, status, error=str(e))
+        except Exception as e:
+            logger.warning(f"Job {job['id']} failed: {e}")
+            self._record(job, 'failed', error=str(e))
+        else:
+            self._record(job, 'succeeded', result=result)
+
+    def _record(self, job: Dict, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        """Finish a job and append its outcome to the ledger."""
+        with self._lock:
+            self._finish(job, status, result, error)
+        logger.info(f"Job {job['id']} {status}")
+        if not self.ledger:
+            return
+        # A failed job has no per-target results, so each target records the failure
+        results = result if isinstance(result, list) else [result] * len(job['targets'])
+        for target, outcome in zip(job['targets'], results):
+            if isinstance(outcome, dict) and 'success' in outcome:
+                outcome = outcome.get('result')
+            artifacts = (outcome or {}).get('artifacts') or [{}]
+            self.ledger.record(
+                job['type'], job['item'], target, status == 'succeeded',
+                artifact_id=artifacts[0].get('id'), error=error, summary=(outcome or {}).get('summary')
+            )
+
+    @staticmethod
+    def _finish(job: Dict, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        """Set a job's final state (lock held)."""
+        job['status'] = status
+        job['result'] = result
+        job['error'] = error
+        job['finished_at'] = _now()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond max_finished_jobs (lock held)."""
+        finished = [job_id for job_id, job in self._jobs.items() if job['finished_at']]
+        for job_id in finished[:max(len(finished) - self.max_finished_jobs, 0)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _view(job: Dict) -> Dict:
+        """Job fields returned by the API."""
+        return {key: value for key, value in job.items() if key not in ('cancel_event', 'future')}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes API requests to the server's ImportService."""
+
+    server_version = 'vuln-fetcher'
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+
+    def do_DELETE(self) -> None:
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method: str) -> None:
+        """Authenticate, route, and turn errors into JSON responses."""
+        token = self.server.token
+        if token and not hmac.compare_digest(self.headers.get('Authorization', ''), f'Bearer {token}'):
+            self._send(401, {'error': 'Missing or invalid token'})
+            return
+
+        url = urllib.parse.urlsplit(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        query = urllib.parse.parse_qs(url.query)
+        refresh = query.get('refresh', ['0'])[0] not in ('0', 'false', '')
+        service: ImportService = self.server.service
+
+        try:
+            if method == 'GET' and parts == ['health']:
+                self._send(200, {'status': 'ok', 'jobs': service.counts()})
+            elif method == 'GET' and parts == ['jobs']:
+                self._send(200, {'jobs': service.list_jobs(query.get('status', [None])[0])})
+            elif method == 'POST' and parts == ['jobs']:
+                self._submit(service)
+            elif parts[:1] == ['jobs'] and len(parts) == 2 and method in ('GET', 'DELETE'):
+                job = service.get(parts[1]) if method == 'GET' else service.cancel(parts[1])
+                if job:
+                    self._send(200, job)
+                else:
+                    self._send(404, {'error': f"Unknown job: {parts[1]}"})
+            elif method == 'GET' and parts == ['scans']:
+                self._send(200, service.list_scans(refresh))
+            elif method == 'GET' and parts == ['assessments']:
+                self._send(200, service.list_assessments(refresh))
+            else:
+                self._send(404, {'error': f"No route for {method} {url.path}"})
+        except ValueError as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            logger.exception(f"{method} {url.path} failed")
+            self._send(502, {'error': str(e)})
+
+    def _submit(self, service: ImportService) -> None:
+        """Queue the job, or list of jobs, in the request body."""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self._send(413, {'error': f"Request body over {MAX_BODY_BYTES} bytes"})
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            raise ValueError("Request body is not valid JSON")
+
+        if isinstance(body, list):
+            self._send(202, {'jobs': service.submit_many(body)})
+        else:
+            self._send(202, service.submit(body))
+
+    def _send(self, status: int, body: Dict) -> None:
+        """Write a JSON response."""
+        data = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def create_server(
+    service: ImportService,
+    host: str = '127.0.0.1',
+    port: int = 8765,
+    token: Optional[str] = None
+) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server for a service (call serve_forever() to run it).
+
+    Args:
+        service: Service the API drives
+        host: Address to listen on (the default only accepts local clients)
+        port: Port to listen on (0 picks a free port)
+        token: Optional bearer token every request must carry
+
+    Returns:
+        The server
+    """
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.service = service
+    server.token = token
+    return server
+
+
+def _now() -> str:
+    """Current time as an ISO 8601 UTC string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _timestamp(seconds: float) -> str:
+    """Unix timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
@@ -0,0 +1,116 @@
+"""
+Deterministic sharding of import workloads across independent workers.
+
+Every worker started with the same shard count computes the same owner for
+each item (scan, repository file, local file) from the item's key alone, so
+several processes or machines can split an inventory without coordinating.
+Jump consistent hashing is used, so changing the shard count only moves the
+minimum number of items between shards.
+"""
+import os
+import hashlib
+from typing import Optional
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Map a 64-bit key to a bucket with jump consistent hashing (Lamping & Veach).
+
+    Args:
+        key: 64-bit integer key
+        buckets: Number of buckets
+
+    Returns:
+        Bucket number in [0, buckets)
+    """
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return b
+
+
+class Shard:
+    """One shard (1-based index) out of a fixed number of shards."""
+
+    def __init__(self, index: int, count: int):
+        """
+        Initialize a shard.
+
+        Args:
+            index: Shard number, from 1 to count
+            count: Total number of shards
+
+        Raises:
+            ValueError: If the index is out of range
+        """
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count}: expected 1 <= i <= N")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, spec: str) -> 'Shard':
+        """
+        Parse a shard spec of the form 'i/N'.
+
+        Args:
+            spec: e.g. '2/4' for the second of four shards
+
+        Returns:
+            Shard
+
+        Raises:
+            ValueError: If the spec is malformed or out of range
+        """
+        try:
+            index, count = (int(part) for part in spec.split('/'))
+        except ValueError:
+            raise ValueError(f"Invalid shard '{spec}': expected i/N, e.g. 1/4")
+        return cls(index, count)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def owns(self, key: str) -> bool:
+        """
+        Check whether an item belongs to this shard.
+
+        Args:
+            key: Stable item key, e.g. 'nessus:default:42' or a file path
+
+        Returns:
+            True if this shard should process the item
+        """
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        return jump_hash(int.from_bytes(digest, 'big'), self.count) == self.index - 1
+
+    def path(self, path: str) -> str:
+        """
+        Derive this shard's own copy of a state or ledger file path.
+
+        Args:
+            path: Path shared by all shards, e.g. 'imports.journal'
+
+        Returns:
+            e.g. 'imports.shard-2-of-4.journal'
+        """
+        stem, ext = os.path.splitext(path)
+        return f"{stem}.shard-{self.index}-of-{self.count}{ext}"
+
+
+def shard_path(path: Optional[str], shard: Optional[Shard]) -> Optional[str]:
+    """
+    Get the per-shard variant of an optional state file path.
+
+    Args:
+        path: State or ledger file path (None passes through)
+        shard: Shard, or None when not sharding
+
+    Returns:
+        Path to use
+    """
+    if path is None or shard is None:
+        return path
+    return shard.path(path)
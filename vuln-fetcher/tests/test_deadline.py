@@ -0,0 +1,116 @@
+"""Tests for job deadlines: pausing, timeout clamping and cancellation."""
+import threading
+
+import pytest
+
+import deadline as deadline_module
+from deadline import Deadline, DeadlineExceeded, JobCancelled, request_timeout, when_run
+
+
+class Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(deadline_module.time, 'monotonic', clock)
+    return clock
+
+
+def test_paused_time_is_not_counted(clock):
+    deadline = Deadline(10)
+    clock.advance(3)
+    assert deadline.remaining() == 7
+
+    deadline.pause()
+    clock.advance(100)
+    assert deadline.remaining() == 7
+    deadline.check()
+
+    deadline.resume()
+    clock.advance(2)
+    assert deadline.remaining() == 5
+
+    clock.advance(5)
+    with pytest.raises(DeadlineExceeded, match='10s deadline'):
+        deadline.check()
+
+
+def test_pause_and_resume_are_idempotent(clock):
+    deadline = Deadline(10)
+    deadline.pause()
+    clock.advance(4)
+    deadline.pause()
+    clock.advance(4)
+    deadline.resume()
+    deadline.resume()
+    assert deadline.remaining() == 10
+
+
+def test_when_run_starts_the_clock_when_the_job_runs(clock):
+    deadline = Deadline(10)
+    job = when_run(deadline, lambda value: (value, deadline.remaining()))
+    clock.advance(60)
+    assert deadline.remaining() == 10
+
+    value, remaining = job('scan')
+    clock.advance(4)
+
+    assert (value, remaining) == ('scan', 10)
+    assert deadline.remaining() == 6
+
+
+def test_no_time_limit(clock):
+    deadline = Deadline(None)
+    clock.advance(10 ** 6)
+    assert deadline.remaining() is None
+    deadline.check()
+    assert request_timeout({}, 'api', deadline) == (10, 60)
+
+
+def test_request_timeout_is_clamped_to_the_time_left(clock):
+    timeouts = {'api': (10, 60)}
+    deadline = Deadline(30)
+    assert request_timeout(timeouts, 'api', deadline) == (10, 30)
+
+    clock.advance(25)
+    assert request_timeout(timeouts, 'api', deadline) == (5, 5)
+    assert request_timeout(timeouts, 'upload', deadline) == (5, 5)
+    assert request_timeout(timeouts, 'upload') == (10, 600)
+
+    clock.advance(5)
+    with pytest.raises(DeadlineExceeded):
+        request_timeout(timeouts, 'api', deadline)
+
+
+def test_cancel_event_raises_job_cancelled(clock):
+    cancel_event = threading.Event()
+    first, second = Deadline(30, cancel_event), Deadline(None, cancel_event)
+    first.check()
+
+    cancel_event.set()
+
+    for deadline in (first, second):
+        assert deadline.cancelled
+        with pytest.raises(JobCancelled, match='Export was cancelled'):
+            deadline.check('Export')
+        with pytest.raises(JobCancelled):
+            request_timeout({}, 'download', deadline)
+
+
+def test_cancel_works_while_paused(clock):
+    deadline = Deadline(30)
+    deadline.pause()
+    deadline.cancel()
+    with pytest.raises(JobCancelled):
+        deadline.check()
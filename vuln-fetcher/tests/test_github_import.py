@@ -0,0 +1,82 @@
+"""Tests for GitHub imports: shared downloads and extracted archive files."""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from github_import import GitHubBulkImporter
+from journal import JobJournal, STAGE_UPLOADED
+
+
+def _job(assessment_id):
+    return {
+        'owner': 'acme', 'repo': 'evidence', 'ref': 'main', 'path': 'scans/prod.csv',
+        'name': 'prod.csv', 'sha': 'b' * 40, 'assessment_id': assessment_id
+    }
+
+
+def _importer(downloads, journal=None):
+    def get_file_content(owner, repo, path, ref, deadline=None):
+        outcome = downloads.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    paramify_client = SimpleNamespace(
+        upload_intake=lambda **kwargs: {'artifacts': [{'id': f"art-{kwargs['assessment_id']}"}]}
+    )
+    return GitHubBulkImporter(
+        SimpleNamespace(get_file_content=get_file_content), paramify_client, journal=journal
+    )
+
+
+def _share(importer, jobs):
+    shared = {'lock': threading.Lock(), 'content': None, 'users': len(jobs)}
+    importer._shared = {importer._origin(jobs[0]): shared}
+    return shared
+
+
+def test_journal_skip_releases_the_shared_download(tmp_path):
+    journal = JobJournal(str(tmp_path / 'imports.journal'))
+    jobs = [_job('a1'), _job('a2'), _job('a3')]
+    key = JobJournal.job_key('github', 'acme/evidence', 'scans/prod.csv', 'b' * 40, 'a3')
+    journal.record(key, STAGE_UPLOADED, result={'artifacts': [{'id': 'art-old'}]})
+    importer = _importer([b'Host\n'], journal)
+    shared = _share(importer, jobs)
+
+    importer.import_file(jobs[0])
+    assert shared['content'] == b'Host\n'
+    importer.import_file(jobs[1])
+    assert importer.import_file(jobs[2]) == {'artifacts': [{'id': 'art-old'}]}
+
+    assert shared == {'lock': shared['lock'], 'content': None, 'users': 0}
+
+
+def test_failed_download_releases_the_job_share():
+    jobs = [_job('a1'), _job('a2')]
+    importer = _importer([ConnectionError('reset'), b'Host\n'])
+    shared = _share(importer, jobs)
+
+    with pytest.raises(ConnectionError):
+        importer.import_file(jobs[0])
+    assert shared['users'] == 1
+    assert importer.import_file(jobs[1]) == {'artifacts': [{'id': 'art-a2'}]}
+
+    assert shared['users'] == 0
+    assert shared['content'] is None
+
+
+def test_extracted_archive_files_are_streamed_from_disk(tmp_path):
+    local_path = tmp_path / 'prod.csv'
+    local_path.write_bytes(b'Host\n')
+    uploads = []
+    paramify_client = SimpleNamespace(
+        upload_intake_file=lambda **kwargs: uploads.append(kwargs) or {'artifacts': [{'id': 'art-1'}]}
+    )
+    importer = GitHubBulkImporter(SimpleNamespace(), paramify_client)
+
+    importer.import_file({**_job('a1'), 'local_path': str(local_path)}, '2026-01-31')
+
+    assert [(u['file_path'], u['filename'], u['effective_date']) for u in uploads] == [
+        (str(local_path), 'prod.csv', '2026-01-31')
+    ]
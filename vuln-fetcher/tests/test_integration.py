@@ -0,0 +1,60 @@
+"""Tests for importing one Nessus scan into several assessments."""
+import os
+
+import pytest
+
+from deadline import DeadlineExceeded
+from integration import NessusParamifyIntegration
+from journal import JobJournal, STAGE_DOWNLOADED, STAGE_UPLOADED, file_sha256
+
+
+@pytest.fixture
+def integration(monkeypatch):
+    integration = NessusParamifyIntegration('https://nessus.invalid', 'access', 'secret', 'key')
+    nessus_client = integration.nessus_client
+    monkeypatch.setattr(nessus_client, 'get_scan_details', lambda scan_id, deadline=None: {'info': {'name': 'prod'}})
+    monkeypatch.setattr(nessus_client, 'latest_history_id', lambda details: 7)
+    return integration
+
+
+@pytest.fixture
+def journal(tmp_path, integration):
+    """Journal where a1 already has run 7 of scan 12 and its export is downloaded."""
+    journal = JobJournal(str(tmp_path / 'imports.journal'))
+    journal.record(integration._job_key(None, 12, 7, 'a1'), STAGE_UPLOADED, result={'artifacts': [{'id': 'art-1'}]})
+    export_key = integration._export_key(None, 12, 7)
+    local_path = journal.spool_path(export_key, '.nessus')
+    with open(local_path, 'w', encoding='utf-8') as f:
+        f.write('<NessusClientData_v2/>')
+    journal.record(export_key, STAGE_DOWNLOADED, local_path=local_path, sha256=file_sha256(local_path))
+    return journal
+
+
+def test_download_is_kept_when_the_uploads_do_not_finish(integration, journal, monkeypatch):
+    def upload_to_assessments(*args, **kwargs):
+        raise DeadlineExceeded("Job exceeded its 60s deadline")
+
+    monkeypatch.setattr(integration, '_upload_to_assessments', upload_to_assessments)
+    local_path = journal.downloaded_file(integration._export_key(None, 12, 7))
+
+    with pytest.raises(DeadlineExceeded):
+        integration.import_scan_to_assessments(12, ['a1', 'a2'], journal=journal)
+
+    assert os.path.exists(local_path)
+
+
+def test_download_is_removed_once_every_assessment_has_it(integration, journal, monkeypatch):
+    uploaded = []
+
+    def upload_to_assessments(upload_path, filename, assessment_ids, *args, **kwargs):
+        uploaded.extend(assessment_ids)
+        return {a: {'assessment_id': a, 'success': True, 'result': {}} for a in assessment_ids}
+
+    monkeypatch.setattr(integration, '_upload_to_assessments', upload_to_assessments)
+    local_path = journal.downloaded_file(integration._export_key(None, 12, 7))
+
+    results = integration.import_scan_to_assessments(12, ['a1', 'a2'], journal=journal)
+
+    assert uploaded == ['a2']
+    assert [r['success'] for r in results] == [True, True]
+    assert not os.path.exists(local_path)
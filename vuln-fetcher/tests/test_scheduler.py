@@ -0,0 +1,85 @@
+"""Tests for the priority scheduler and its per-endpoint limits."""
+import time
+import threading
+
+import pytest
+
+from scheduler import ImportScheduler
+
+
+def test_endpoint_limits_are_never_exceeded():
+    running = {'nessus:east': 0, 'paramify:a1': 0}
+    peak = dict(running)
+    lock = threading.Lock()
+
+    def job(endpoints):
+        with lock:
+            for endpoint in endpoints:
+                running[endpoint] += 1
+                peak[endpoint] = max(peak[endpoint], running[endpoint])
+        time.sleep(0.01)
+        with lock:
+            for endpoint in endpoints:
+                running[endpoint] -= 1
+
+    with ImportScheduler(max_workers=8, limits={'nessus': 2, 'paramify:a1': 1}) as scheduler:
+        futures = []
+        for i in range(20):
+            endpoints = ['nessus:east', 'paramify:a1'] if i % 2 else ['nessus:east']
+            futures.append(scheduler.submit(job, endpoints, endpoints=endpoints))
+        for future in futures:
+            future.result(timeout=10)
+
+    assert peak['nessus:east'] <= 2
+    assert peak['paramify:a1'] <= 1
+
+
+def test_highest_priority_runs_first():
+    gate = threading.Event()
+    order = []
+
+    with ImportScheduler(max_workers=1) as scheduler:
+        # Holds the only worker until every other job is queued
+        scheduler.submit(gate.wait, 10)
+        for priority in (1, 5, 3, 5):
+            scheduler.submit(order.append, priority, priority=priority)
+        scheduler.submit(order.append, 'last', priority=-1)
+        gate.set()
+
+    assert order == [5, 5, 3, 1, 'last']
+
+
+def test_job_for_a_busy_endpoint_does_not_block_others():
+    gate = threading.Event()
+    started = threading.Event()
+
+    with ImportScheduler(max_workers=2, limits={'github': 1}) as scheduler:
+        scheduler.submit(gate.wait, 10, endpoints=['github'])
+        scheduler.submit(gate.wait, 10, priority=10, endpoints=['github'])
+        other = scheduler.submit(started.set, endpoints=['nessus:east'])
+        other.result(timeout=5)
+        gate.set()
+
+    assert started.is_set()
+
+
+def test_shutdown_cancels_queued_jobs():
+    gate = threading.Event()
+    ran = []
+
+    scheduler = ImportScheduler(max_workers=1)
+    running = scheduler.submit(gate.wait, 10)
+    queued = [scheduler.submit(ran.append, i) for i in range(3)]
+    while not running.running():
+        time.sleep(0.001)
+
+    scheduler.shutdown(wait=False, cancel_futures=True)
+    gate.set()
+    for thread in scheduler._threads:
+        thread.join(timeout=5)
+
+    assert running.result() is True
+    assert all(future.cancelled() for future in queued)
+    assert ran == []
+    with pytest.raises(RuntimeError):
+        scheduler.submit(ran.append, 4)
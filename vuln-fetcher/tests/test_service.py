@@ -0,0 +1,79 @@
+"""Tests for the import service's job validation and bookkeeping."""
+import os
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from scheduler import PriorityPolicy
+from service import ImportService
+from ledger import ResultLedger
+
+
+def _integration(import_scan_to_assessments):
+    """Integration stub with one scanner and any assessment accepted."""
+    return SimpleNamespace(
+        paramify_client=SimpleNamespace(resolve=lambda assessment_id: None),
+        transcode_csv=False,
+        transcode_columns=None,
+        findings_index=None,
+        job_timeout=None,
+        scheduler_limits={},
+        priority_policy=PriorityPolicy(),
+        scanner_names=['default'],
+        get_nessus_client=lambda scanner: None,
+        scan_key=lambda scanner, scan_id: f"nessus:{scanner}:{scan_id}",
+        import_scan_to_assessments=import_scan_to_assessments,
+        list_all_nessus_scans=lambda: {},
+        list_paramify_assessments=lambda: []
+    )
+
+
+def test_failed_multi_assessment_job_records_every_target(tmp_path):
+    def import_scan_to_assessments(*args, **kwargs):
+        raise RuntimeError("export failed")
+
+    ledger = ResultLedger(str(tmp_path / 'results.ledger'))
+    service = ImportService(
+        _integration(import_scan_to_assessments), github_client=None, max_workers=1, ledger=ledger
+    )
+    try:
+        job = service.submit({'type': 'nessus', 'scan_id': 12, 'assessment_ids': ['a1', 'a2']})
+        service._jobs[job['id']]['future'].result(timeout=5)
+    finally:
+        service.close()
+
+    with open(ledger.path, 'r', encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    assert sorted(e['target'] for e in entries) == ['a1', 'a2']
+    assert all(not e['success'] and e['error'] == 'export failed' for e in entries)
+    assert all(e['item'] == 'nessus:default:12' for e in entries)
+
+
+def test_file_jobs_stay_inside_the_file_root(tmp_path):
+    root = tmp_path / 'scans'
+    root.mkdir()
+    (root / 'dmz.nessus').write_text('<NessusClientData_v2/>')
+    (tmp_path / 'secret.nessus').write_text('<NessusClientData_v2/>')
+    (root / 'link.nessus').symlink_to(tmp_path / 'secret.nessus')
+
+    service = ImportService(_integration(None), github_client=None, max_workers=1, file_root=str(root))
+    try:
+        plan = service._plan({'type': 'file', 'path': str(root / 'dmz.nessus'), 'assessment_id': 'a1'})
+        assert plan[1][0] == os.path.realpath(root / 'dmz.nessus')
+        for path in (tmp_path / 'secret.nessus', root / '..' / 'secret.nessus', root / 'link.nessus'):
+            with pytest.raises(ValueError, match='file root'):
+                service._plan({'type': 'file', 'path': str(path), 'assessment_id': 'a1'})
+    finally:
+        service.close()
+
+
+def test_file_jobs_are_refused_without_a_file_root(tmp_path):
+    path = tmp_path / 'dmz.nessus'
+    path.write_text('<NessusClientData_v2/>')
+    service = ImportService(_integration(None), github_client=None, max_workers=1)
+    try:
+        with pytest.raises(ValueError, match='disabled'):
+            service._plan({'type': 'file', 'path': str(path), 'assessment_id': 'a1'})
+    finally:
+        service.close()
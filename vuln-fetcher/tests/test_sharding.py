@@ -0,0 +1,57 @@
+"""Tests for shard assignment, per-shard paths and merging shard ledgers."""
+import pytest
+
+from sharding import Shard, jump_hash, shard_path
+from ledger import ResultLedger, merge_ledgers
+
+KEYS = [f"nessus:default:{i}" for i in range(500)] + [f"acme/evidence@main:scans/{i}.nessus" for i in range(500)]
+
+
+@pytest.mark.parametrize('count', [1, 2, 3, 7])
+def test_every_item_lands_in_exactly_one_shard(count):
+    shards = [Shard(i, count) for i in range(1, count + 1)]
+    for key in KEYS:
+        assert sum(shard.owns(key) for shard in shards) == 1
+    if count > 1:
+        assert all(any(shard.owns(key) for key in KEYS) for shard in shards)
+
+
+def test_growing_the_shard_count_only_moves_items_to_the_new_shard():
+    for key in range(2000):
+        before, after = jump_hash(key, 4), jump_hash(key, 5)
+        assert after in (before, 4)
+
+
+def test_shard_parse_rejects_invalid_specs():
+    assert str(Shard.parse('2/4')) == '2/4'
+    for spec in ('0/4', '5/4', '1/0', 'two/4', '1'):
+        with pytest.raises(ValueError):
+            Shard.parse(spec)
+
+
+def test_shard_path_adds_the_shard_suffix():
+    shard = Shard(2, 4)
+    assert shard_path('imports.journal', shard) == 'imports.shard-2-of-4.journal'
+    assert shard_path('/var/lib/run.ledger', shard) == '/var/lib/run.shard-2-of-4.ledger'
+    assert shard_path('state', shard) == 'state.shard-2-of-4'
+    assert shard_path('imports.journal', None) == 'imports.journal'
+    assert shard_path(None, shard) is None
+
+
+def test_merge_keeps_the_latest_outcome_across_shard_ledgers(tmp_path):
+    base = str(tmp_path / 'results.ledger')
+    first = ResultLedger(shard_path(base, Shard(1, 2)), shard='1/2')
+    second = ResultLedger(shard_path(base, Shard(2, 2)), shard='2/2')
+    first.record('nessus', 'nessus:default:1', 'a1', False, error='timeout')
+    first.record('nessus', 'nessus:default:2', 'a1', True, artifact_id='art-2')
+    second.record('nessus', 'nessus:default:3', 'a1', True, artifact_id='art-3')
+    # A later retry of the first shard's failure succeeded
+    second.record('nessus', 'nessus:default:1', 'a1', True, artifact_id='art-1')
+
+    merged = merge_ledgers([first.path, second.path, str(tmp_path / 'missing.ledger')])
+
+    assert [(e['item'], e['success'], e['shard']) for e in merged] == [
+        ('nessus:default:1', True, '2/2'),
+        ('nessus:default:2', True, '1/2'),
+        ('nessus:default:3', True, '2/2'),
+    ]
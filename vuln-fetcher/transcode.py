@@ -0,0 +1,194 @@
+"""
+Streaming conversion of .nessus XML exports to compact Nessus-style CSV.
+
+Paramify ingests Nessus CSV as well as .nessus XML, and a CSV holding only
+the columns it needs is a fraction of the size of the XML. The conversion
+reads the XML incrementally and discards each host once it has been written,
+so memory use stays constant regardless of the scan size.
+"""
+import os
+import csv
+import logging
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import Optional, List, Dict, Tuple, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Where each supported CSV column comes from:
+#   ('attr', name)  - attribute of the <ReportItem>
+#   ('child', tag)  - text of a child element of the <ReportItem>
+#   ('host', None)  - the <ReportHost> name
+#   ('tag', name)   - a <HostProperties> tag of the host
+COLUMN_SOURCES = {
+    'Plugin ID': ('attr', 'pluginID'),
+    'CVE': ('child', 'cve'),
+    'CVSS v2.0 Base Score': ('child', 'cvss_base_score'),
+    'CVSS v3.0 Base Score': ('child', 'cvss3_base_score'),
+    'Risk': ('child', 'risk_factor'),
+    'Host': ('host', None),
+    'IP Address': ('tag', 'host-ip'),
+    'FQDN': ('tag', 'host-fqdn'),
+    'Protocol': ('attr', 'protocol'),
+    'Port': ('attr', 'port'),
+    'Severity': ('attr', 'severity'),
+    'Name': ('attr', 'pluginName'),
+    'Plugin Family': ('attr', 'pluginFamily'),
+    'Synopsis': ('child', 'synopsis'),
+    'Description': ('child', 'description'),
+    'Solution': ('child', 'solution'),
+    'See Also': ('child', 'see_also'),
+    'Plugin Output': ('child', 'plugin_output'),
+    'Plugin Publication Date': ('child', 'plugin_publication_date'),
+}
+
+# Same columns, in the same order, as a Nessus "CSV" export
+DEFAULT_COLUMNS = [
+    'Plugin ID', 'CVE', 'CVSS v2.0 Base Score', 'Risk', 'Host', 'Protocol', 'Port',
+    'Name', 'Synopsis', 'Description', 'Solution', 'See Also', 'Plugin Output'
+]
+
+
+def nessus_to_csv(src_path: str, dest_path: str, columns: Optional[List[str]] = None) -> Dict:
+    """
+    Convert a .nessus file to CSV in a single streaming pass.
+
+    Like a Nessus CSV export, a finding with several CVEs becomes one row per CVE.
+
+    Args:
+        src_path: .nessus file to read
+        dest_path: CSV file to write
+        columns: Columns to write (default: DEFAULT_COLUMNS)
+
+    Returns:
+        Stats dict with hosts, rows, input_bytes, output_bytes and ratio
+        (input size / output size)
+
+    Raises:
+        ValueError: If a column is not supported
+        xml.etree.ElementTree.ParseError: If the file is not valid XML
+    """
+    columns = columns or DEFAULT_COLUMNS
+    unknown = [c for c in columns if c not in COLUMN_SOURCES]
+    if unknown:
+        raise ValueError(f"Unsupported CSV columns: {', '.join(unknown)}")
+
+    sources = [COLUMN_SOURCES[c] for c in columns]
+    host_names = set()
+    rows = 0
+
+    with open(dest_path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out)
+        writer.writerow(columns)
+
+        for host_name, host_tags, item in iter_report_items(src_path):
+            host_names.add(host_name)
+            for row in _item_rows(item, sources, host_name, host_tags):
+                writer.writerow(row)
+                rows += 1
+
+    input_bytes = os.path.getsize(src_path)
+    output_bytes = os.path.getsize(dest_path)
+    stats = {
+        'hosts': len(host_names),
+        'rows': rows,
+        'input_bytes': input_bytes,
+        'output_bytes': output_bytes,
+        'ratio': round(input_bytes / output_bytes, 2) if output_bytes else 0.0
+    }
+    logger.info(
+        f"Transcoded {src_path} to CSV: {input_bytes} -> {output_bytes} bytes "
+        f"({stats['ratio']}x smaller, {rows} rows from {len(host_names)} hosts)"
+    )
+    return stats
+
+
+def iter_report_items(source) -> Iterator[Tuple[str, Dict[str, str], ET.Element]]:
+    """
+    Stream the findings of a .nessus file.
+
+    Each <ReportItem> is cleared once the caller moves on to the next one,
+    and each <ReportHost> once all its items have been yielded, so memory
+    use does not grow with the file size.
+
+    Args:
+        source: .nessus file path or binary file object
+
+    Yields:
+        Tuples of (host name, host properties dict, <ReportItem> element)
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the file is not valid XML
+    """
+    report = None
+    host_name = ''
+    host_tags: Dict[str, str] = {}
+
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == 'Report':
+                report = elem
+            elif elem.tag == 'ReportHost':
+                host_name = elem.get('name', '')
+                host_tags = {}
+            continue
+
+        if elem.tag == 'tag' and elem.get('name'):
+            host_tags[elem.get('name')] = elem.text or ''
+        elif elem.tag == 'ReportItem':
+            yield host_name, host_tags, elem
+            elem.clear()
+        elif elem.tag == 'ReportHost':
+            # Drop the finished host so the tree never grows
+            elem.clear()
+            if report is not None:
+                report.remove(elem)
+
+
+def _item_rows(item: ET.Element, sources: List[Tuple], host_name: str, host_tags: Dict[str, str]):
+    """Yield the CSV rows for one <ReportItem> (one per CVE, at least one)."""
+    cves = [c.text or '' for c in item.findall('cve')] or ['']
+
+    for cve in cves:
+        row = []
+        for kind, name in sources:
+            if kind == 'attr':
+                row.append(item.get(name, ''))
+            elif kind == 'host':
+                row.append(host_name)
+            elif kind == 'tag':
+                row.append(host_tags.get(name, ''))
+            elif name == 'cve':
+                row.append(cve)
+            else:
+                row.append(item.findtext(name, ''))
+        yield row
+
+
+def transcode_for_upload(
+    src_path: str,
+    filename: str,
+    columns: Optional[List[str]] = None
+) -> Tuple[str, str, Dict]:
+    """
+    Convert a .nessus file to a temporary CSV ready for upload.
+
+    Args:
+        src_path: .nessus file to read
+        filename: Upload filename of the .nessus file
+        columns: Columns to write (default: DEFAULT_COLUMNS)
+
+    Returns:
+        Tuple of (CSV path, CSV upload filename, stats). The caller must
+        remove the CSV file.
+    """
+    fd, csv_path = tempfile.mkstemp(suffix='.csv')
+    os.close(fd)
+    try:
+        stats = nessus_to_csv(src_path, csv_path, columns)
+    except Exception:
+        os.remove(csv_path)
+        raise
+
+    csv_filename = f"{os.path.splitext(filename)[0]}.csv"
+    return csv_path, csv_filename, stats